@@ -0,0 +1,70 @@
+"""
+Boids neighbour index benchmark: spatial grid vs brute force.
+
+Times one flock_steering() call per flock size with each neighbour index.
+The world is scaled with the flock so boid density stays constant (1000
+boids in an 800 x 600 x 800 box), which is the regime where the grid's cost
+grows linearly while brute force grows quadratically.
+
+Usage:
+    python benchmarks/bench_boids_neighbours.py
+    python benchmarks/bench_boids_neighbours.py --sizes 1000 10000 --repeat 3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.simulations.boids import BruteForceIndex, SpatialGrid, flock_steering
+
+BASE_COUNT = 1000
+BASE_BOUNDS = np.array([800.0, 600.0, 800.0])
+
+
+def time_steering(positions, velocities, index, repeat):
+    """Return the best wall-clock time of ``repeat`` flock_steering() calls."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        flock_steering(positions, velocities, index=index)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--max-brute', type=int, default=None,
+                        help='skip brute force above this many boids')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'boids':>8} {'grid (s)':>10} {'brute (s)':>10} {'speedup':>8}")
+    for n in args.sizes:
+        bounds = BASE_BOUNDS * (n / BASE_COUNT) ** (1 / 3)
+        positions = rng.uniform(0, bounds, (n, 3)).astype(np.float32)
+        velocities = rng.uniform(-1, 1, (n, 3)).astype(np.float32)
+
+        grid_time = time_steering(positions, velocities,
+                                  SpatialGrid(bounds), args.repeat)
+        if args.max_brute is not None and n > args.max_brute:
+            print(f"{n:>8} {grid_time:>10.4f} {'skipped':>10} {'-':>8}")
+            continue
+        brute_time = time_steering(positions, velocities,
+                                   BruteForceIndex(), args.repeat)
+        print(f"{n:>8} {grid_time:>10.4f} {brute_time:>10.4f} "
+              f"{brute_time / grid_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Boids performance benchmark suite with scaling curves.
+
+Times the per-boid functions (separation, alignment, cohesion,
+get_boid_color, Boid.update), a whole frame of the per-boid loop and a whole
+vectorized Flock.step() across flock sizes and neighbour radii. One "step"
+is one frame's worth of work: every per-boid function is applied to every
+boid of the flock. The world is scaled with the flock so boid density stays
+constant (1000 boids in an 800 x 600 x 800 box).
+
+For every case the suite records steps per second, the peak memory
+allocated during one step (via tracemalloc) and the scaling exponent k of
+a least-squares fit ``time ~ boids ** k``, and writes them to a JSON file.
+Two result files can be compared to spot regressions.
+
+Usage:
+    python benchmarks/bench_boids_suite.py --output results.json
+    python benchmarks/bench_boids_suite.py --cases flock_step \\
+        --sizes 1000 10000 100000 --output new.json
+    python benchmarks/bench_boids_suite.py --compare results.json new.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.simulations.boids import (
+    Flock, SpatialGrid, separation, alignment, cohesion,
+    get_boid_color,
+    DEFAULT_SEPARATION_WEIGHT, DEFAULT_ALIGNMENT_WEIGHT,
+    DEFAULT_COHESION_WEIGHT,
+)
+
+BASE_COUNT = 1000
+BASE_BOUNDS = np.array([800.0, 600.0, 800.0])
+
+DEFAULT_SIZES = [50, 500, 5000, 50000, 100000]
+DEFAULT_RADII = [25.0, 50.0, 100.0]
+
+# Per-boid cases are O(N^2) Python loops; larger flocks take minutes per step.
+DEFAULT_MAX_SCALAR = 500
+
+# Relative slowdown above which --compare reports a regression.
+DEFAULT_THRESHOLD = 0.10
+
+
+def world_bounds(num_boids):
+    """World size holding ``num_boids`` at the base density."""
+    return BASE_BOUNDS * (num_boids / BASE_COUNT) ** (1 / 3)
+
+
+def make_flock(num_boids, bounds, radius, seed):
+    """Array-backed flock spread uniformly over the whole world."""
+    rng = np.random.default_rng(seed)
+    return Flock(rng.uniform(0, bounds, (num_boids, 3)),
+                 rng.uniform(-1, 1, (num_boids, 3)),
+                 index=SpatialGrid(bounds, cell_size=radius))
+
+
+def _force_case(force):
+    def setup(flock, bounds, radius):
+        boids = flock.to_boids()
+        return lambda: [force(boid, boids, radius) for boid in boids]
+    return setup
+
+
+def _color_case(flock, bounds, radius):
+    boids = flock.to_boids()
+    return lambda: [get_boid_color(boid, boids) for boid in boids]
+
+
+def _update_case(flock, bounds, radius):
+    boids = flock.to_boids()
+
+    def run():
+        for boid in boids:
+            boid.update(bounds)
+    return run
+
+
+def _scalar_frame_case(flock, bounds, radius):
+    """One frame of the original per-boid loop (forces, colour, update)."""
+    boids = flock.to_boids()
+
+    def run():
+        for boid in boids:
+            boid.acceleration += (
+                separation(boid, boids, radius / 2) * DEFAULT_SEPARATION_WEIGHT
+                + alignment(boid, boids, radius) * DEFAULT_ALIGNMENT_WEIGHT
+                + cohesion(boid, boids, radius) * DEFAULT_COHESION_WEIGHT
+            )
+            get_boid_color(boid, boids, radius / 2, radius)
+        for boid in boids:
+            boid.update(bounds)
+    return run
+
+
+def _flock_step_case(flock, bounds, radius):
+    return lambda: flock.step(bounds, separation_radius=radius / 2,
+                              alignment_radius=radius, cohesion_radius=radius)
+
+
+# name -> (setup(flock, bounds, radius) -> step callable, uses radius,
+#          per-boid Python loop)
+CASES = {
+    "separation": (_force_case(separation), True, True),
+    "alignment": (_force_case(alignment), True, True),
+    "cohesion": (_force_case(cohesion), True, True),
+    "get_boid_color": (_color_case, False, True),
+    "boid_update": (_update_case, False, True),
+    "scalar_frame": (_scalar_frame_case, True, True),
+    "flock_step": (_flock_step_case, True, False),
+}
+
+
+def time_step(step, repeat, min_time):
+    """Best wall-clock time of one step over ``repeat`` runs.
+
+    Keeps running past ``repeat`` until ``min_time`` seconds have elapsed,
+    so very fast steps are measured more than once.
+    """
+    best = float('inf')
+    runs = 0
+    start = time.perf_counter()
+    while runs < repeat or time.perf_counter() - start < min_time:
+        begin = time.perf_counter()
+        step()
+        best = min(best, time.perf_counter() - begin)
+        runs += 1
+    return best
+
+
+def peak_memory(step):
+    """Peak bytes allocated by Python and numpy during one step."""
+    tracemalloc.start()
+    try:
+        step()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def scaling_exponent(sizes, seconds):
+    """Least-squares slope of log(seconds) against log(sizes).
+
+    Returns:
+        float or None: The exponent k of ``seconds ~ sizes ** k``, or None
+        with fewer than two sizes.
+    """
+    if len(sizes) < 2:
+        return None
+    slope, _ = np.polyfit(np.log(sizes), np.log(seconds), 1)
+    return float(slope)
+
+
+def run_suite(cases, sizes, radii, repeat=3, min_time=0.2,
+              max_scalar=DEFAULT_MAX_SCALAR, seed=0, log=print):
+    """Run the selected cases and return the results document.
+
+    Returns:
+        dict: ``{"meta": ..., "results": [...], "scaling": [...]}`` where
+        each result holds case, boids, radius, seconds, steps_per_second
+        and peak_memory_bytes, and each scaling entry holds case, radius,
+        exponent and the sizes it was fitted on.
+    """
+    results = []
+    for name in cases:
+        setup, uses_radius, scalar = CASES[name]
+        for radius in (radii if uses_radius else [None]):
+            for n in sizes:
+                if scalar and n > max_scalar:
+                    continue
+                bounds = world_bounds(n)
+                cell = radius if radius is not None else max(radii)
+                step = setup(make_flock(n, bounds, cell, seed), bounds, cell)
+                seconds = time_step(step, repeat, min_time)
+                memory = peak_memory(step)
+                results.append({
+                    "case": name, "boids": n, "radius": radius,
+                    "seconds": seconds, "steps_per_second": 1.0 / seconds,
+                    "peak_memory_bytes": memory,
+                })
+                log(f"{name:>15} {n:>8} {_radius_label(radius):>7} "
+                    f"{1.0 / seconds:>12.2f} {memory / 2**20:>10.2f}")
+
+    scaling = []
+    for key in dict.fromkeys((r["case"], r["radius"]) for r in results):
+        rows = [r for r in results if (r["case"], r["radius"]) == key]
+        scaling.append({
+            "case": key[0], "radius": key[1],
+            "exponent": scaling_exponent([r["boids"] for r in rows],
+                                         [r["seconds"] for r in rows]),
+            "sizes": [r["boids"] for r in rows],
+        })
+
+    meta = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "repeat": repeat,
+        "seed": seed,
+    }
+    return {"meta": meta, "results": results, "scaling": scaling}
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """Match two results documents case by case.
+
+    Returns:
+        list: ``(case, boids, radius, baseline_sps, current_sps, ratio,
+        regressed)`` tuples for every measurement present in both, where
+        ratio is current over baseline steps per second and ``regressed``
+        is True when the current run is more than ``threshold`` slower.
+    """
+    def keyed(document):
+        return {(r["case"], r["boids"], r["radius"]): r["steps_per_second"]
+                for r in document["results"]}
+
+    old, new = keyed(baseline), keyed(current)
+    rows = []
+    for key in old:
+        if key in new:
+            ratio = new[key] / old[key]
+            rows.append(key + (old[key], new[key], ratio,
+                               ratio < 1.0 - threshold))
+    return rows
+
+
+def _radius_label(radius):
+    return "-" if radius is None else f"{radius:g}"
+
+
+def print_comparison(rows, threshold):
+    print(f"{'case':>15} {'boids':>8} {'radius':>7} {'old steps/s':>12} "
+          f"{'new steps/s':>12} {'change':>8}")
+    for case, n, radius, old, new, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{case:>15} {n:>8} {_radius_label(radius):>7} {old:>12.2f} "
+              f"{new:>12.2f} {ratio - 1:>+8.1%}{flag}")
+    regressions = sum(row[-1] for row in rows)
+    print(f"{regressions} of {len(rows)} measurements more than "
+          f"{threshold:.0%} slower")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--cases', nargs='+', choices=list(CASES),
+                        default=list(CASES))
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--radii', type=float, nargs='+',
+                        default=DEFAULT_RADII)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='minimum seconds spent timing each measurement')
+    parser.add_argument('--max-scalar', type=int, default=DEFAULT_MAX_SCALAR,
+                        help='skip per-boid cases above this many boids')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path, default=None,
+                        help='write results as JSON to this file')
+    parser.add_argument('--compare', type=Path, nargs=2, default=None,
+                        metavar=('BASELINE', 'CURRENT'),
+                        help='compare two result files instead of running')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative slowdown reported as a regression')
+    args = parser.parse_args()
+
+    if args.compare is not None:
+        baseline, current = (json.loads(path.read_text())
+                             for path in args.compare)
+        regressions = print_comparison(
+            compare(baseline, current, args.threshold), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    print(f"{'case':>15} {'boids':>8} {'radius':>7} {'steps/s':>12} "
+          f"{'peak MiB':>10}")
+    document = run_suite(args.cases, args.sizes, args.radii, args.repeat,
+                         args.min_time, args.max_scalar, args.seed)
+
+    print()
+    print(f"{'case':>15} {'radius':>7} {'exponent':>9}")
+    for entry in document["scaling"]:
+        exponent = entry["exponent"]
+        print(f"{entry['case']:>15} {_radius_label(entry['radius']):>7} "
+              f"{'-' if exponent is None else f'{exponent:.2f}':>9}")
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(document, indent=2))
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Lorenz backends benchmark: pure Python vs Numba-compiled step loops.
+
+Times compute_lorenz_trajectory() for one long forward Euler trajectory on
+each backend (after one small warm-up call, so Numba's compile time is not
+counted), checks that the trajectories are bit-identical and reports the
+speedup. An ensemble run is timed the same way.
+
+Usage:
+    python benchmarks/bench_lorenz_backends.py
+    python benchmarks/bench_lorenz_backends.py --steps 1000000 --method rk4
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.simulations.lorenz import (
+    compute_lorenz_trajectory, compute_lorenz_ensemble, numba_available,
+)
+
+
+def timed(function, *args, **kwargs):
+    """Return (wall seconds, result) of one call."""
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def compare(label, function, initial, num_steps, dt, method):
+    """Time both backends on one call and print a result line."""
+    # Compile outside the timed call
+    function(initial, 10, dt, method=method, backend="numba")
+    python_time, expected = timed(function, initial, num_steps, dt,
+                                  method=method, backend="python")
+    numba_time, result = timed(function, initial, num_steps, dt,
+                               method=method, backend="numba")
+    identical = np.array_equal(result, expected)
+    print(f"{label:>22} {python_time:>10.3f} {numba_time:>10.3f} "
+          f"{python_time / numba_time:>8.1f}x {str(identical):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--steps', type=int, default=10_000_000)
+    parser.add_argument('--dt', type=float, default=0.001)
+    parser.add_argument('--method', choices=("euler", "rk4"), default="euler")
+    parser.add_argument('--members', type=int, default=1000)
+    parser.add_argument('--ensemble-steps', type=int, default=10_000)
+    args = parser.parse_args()
+
+    if not numba_available():
+        sys.exit("numba is not installed; nothing to compare")
+
+    print(f"{'run':>22} {'python (s)':>10} {'numba (s)':>10} "
+          f"{'speedup':>9} {'identical':>10}")
+    compare(f"trajectory {args.steps}", compute_lorenz_trajectory,
+            [1.0, 1.0, 1.0], args.steps, args.dt, method=args.method)
+    initial = np.random.default_rng(0).normal(0.0, 5.0, (args.members, 3))
+    compare(f"ensemble {args.members}x{args.ensemble_steps}",
+            compute_lorenz_ensemble, initial, args.ensemble_steps, args.dt,
+            method=args.method)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Lorenz integrators benchmark: accuracy per CPU second.
+
+Integrates one trajectory to time T with forward Euler and RK4 at a range
+of step sizes and with adaptive Dormand-Prince at a range of tolerances,
+and reports for each run the CPU time, the number of stored steps, the
+memory they take and the error at T against a tightly converged
+reference. T is kept short because chaos amplifies any error by about
+e^(0.9 t), which soon swamps the integrators' differences. All schemes run
+in pure Python (backend="python"), like Dormand-Prince, so the CPU times
+compare the schemes and not Numba's compilation or compiled loops.
+
+Usage:
+    python benchmarks/bench_lorenz_integrators.py
+    python benchmarks/bench_lorenz_integrators.py --t-end 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.simulations.lorenz import (
+    compute_lorenz_trajectory, solve_lorenz_adaptive,
+)
+
+INITIAL_STATE = [1.0, 1.0, 1.0]
+
+
+def cpu_time(function, *args, **kwargs):
+    """Return (CPU seconds, result) of one call."""
+    start = time.process_time()
+    result = function(*args, **kwargs)
+    return time.process_time() - start, result
+
+
+def fixed_step_run(method, dt, t_end):
+    """Run a fixed-step integrator; return (cpu, steps, bytes, final)."""
+    # Round dt so that the last step lands exactly on t_end
+    num_steps = int(round(t_end / dt)) + 1
+    seconds, trajectory = cpu_time(compute_lorenz_trajectory, INITIAL_STATE,
+                                   num_steps, t_end / (num_steps - 1),
+                                   method=method, backend="python")
+    return seconds, num_steps - 1, trajectory.nbytes, trajectory[-1]
+
+
+def adaptive_run(rtol, t_end):
+    """Run Dormand-Prince; return (cpu, steps, bytes, final)."""
+    seconds, solution = cpu_time(solve_lorenz_adaptive, INITIAL_STATE, t_end,
+                                 rtol=rtol, atol=rtol * 1e-3)
+    stored = (solution.t.nbytes + solution.states.nbytes
+              + solution._coefficients.nbytes)
+    return seconds, solution.num_steps, stored, solution(t_end)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--t-end', type=float, default=10.0)
+    parser.add_argument('--euler-dt', type=float, nargs='+',
+                        default=[1e-2, 1e-3, 1e-4, 1e-5])
+    parser.add_argument('--rk4-dt', type=float, nargs='+',
+                        default=[1e-2, 3e-3, 1e-3])
+    parser.add_argument('--rtol', type=float, nargs='+',
+                        default=[1e-4, 1e-6, 1e-8, 1e-10])
+    args = parser.parse_args()
+
+    reference = solve_lorenz_adaptive(INITIAL_STATE, args.t_end, rtol=1e-13,
+                                      atol=1e-13)(args.t_end)
+
+    runs = [("euler", f"dt={dt:g}",
+             lambda dt=dt: fixed_step_run("euler", dt, args.t_end))
+            for dt in args.euler_dt]
+    runs += [("rk4", f"dt={dt:g}",
+              lambda dt=dt: fixed_step_run("rk4", dt, args.t_end))
+             for dt in args.rk4_dt]
+    runs += [("dopri5", f"rtol={rtol:g}",
+              lambda rtol=rtol: adaptive_run(rtol, args.t_end))
+             for rtol in args.rtol]
+
+    print(f"Lorenz from {INITIAL_STATE} to t={args.t_end:g}")
+    print(f"{'method':>7} {'setting':>11} {'steps':>9} {'memory':>10} "
+          f"{'cpu (s)':>8} {'error':>9}")
+    for method, setting, run in runs:
+        seconds, steps, stored, final = run()
+        error = np.abs(final - reference).max()
+        print(f"{method:>7} {setting:>11} {steps:>9} "
+              f"{stored / 1024:>8.0f}kB {seconds:>8.3f} {error:>9.1e}")
+
+
+if __name__ == "__main__":
+    main()
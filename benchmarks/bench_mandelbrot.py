@@ -0,0 +1,91 @@
+"""
+Mandelbrot benchmark: active-set engine vs full-grid iteration.
+
+Times mandelbrot() against the original full-grid loop, which keeps
+squaring every pixel (clamping escaped ones to 2) for all max_iter
+iterations, and the active-set engine with the cardioid/bulb pre-test and
+periodicity checking enabled. Checks that all give the same result.
+
+Usage:
+    python benchmarks/bench_mandelbrot.py
+    python benchmarks/bench_mandelbrot.py --size 500 750 --max-iter 100 1000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.fractals.mandelbrot import (
+    mandelbrot, escape_time, Viewport, DEFAULT_BOUNDS,
+)
+
+
+def full_grid_mandelbrot(h, w, max_iter):
+    """The original implementation, iterating every pixel every time."""
+    y, x = np.ogrid[-1.4:1.4:h*1j, -2:0.8:w*1j]
+    c = x + y*1j
+    z = c
+    divtime = max_iter + np.zeros(z.shape, dtype=int)
+
+    for i in range(max_iter):
+        z = z**2 + c
+        diverge = z*np.conj(z) > 2**2
+        div_now = diverge & (divtime == max_iter)
+        divtime[div_now] = i
+        z[diverge] = 2
+
+    return divtime
+
+
+def early_exit_mandelbrot(h, w, max_iter):
+    """mandelbrot() with both early exits of escape_time() enabled."""
+    grid = Viewport.from_bounds(DEFAULT_BOUNDS, w, h).grid()
+    return escape_time(grid, max_iter, cardioid=True, periodicity=True)
+
+
+def best_time(function, args, repeat):
+    """Return (best wall-clock time, result) over ``repeat`` calls."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', type=int, nargs=2, default=[500, 750],
+                        metavar=('H', 'W'))
+    parser.add_argument('--max-iter', type=int, nargs='+',
+                        default=[100, 1000, 5000])
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    h, w = args.size
+    print(f"{h}x{w} pixels")
+    print(f"{'max_iter':>8} {'full (s)':>10} {'active (s)':>10} "
+          f"{'exits (s)':>10} {'speedup':>8} {'identical':>9}")
+    for max_iter in args.max_iter:
+        full_time, expected = best_time(full_grid_mandelbrot,
+                                        (h, w, max_iter), args.repeat)
+        active_time, result = best_time(mandelbrot, (h, w, max_iter),
+                                        args.repeat)
+        exits_time, exits_result = best_time(early_exit_mandelbrot,
+                                             (h, w, max_iter), args.repeat)
+        identical = (np.array_equal(expected, result)
+                     and np.array_equal(expected, exits_result))
+        print(f"{max_iter:>8} {full_time:>10.3f} {active_time:>10.3f} "
+              f"{exits_time:>10.3f} {full_time / exits_time:>7.1f}x "
+              f"{str(identical):>9}")
+
+
+if __name__ == "__main__":
+    main()
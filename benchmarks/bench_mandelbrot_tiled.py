@@ -0,0 +1,62 @@
+"""
+Mandelbrot tiled renderer benchmark: throughput vs process count.
+
+Renders the default view with render_tiled() once per process count and
+reports megapixels per second and the speedup over one process. Workers
+write straight into a shared-memory output. Use a large size (e.g.
+16384 x 16384) to measure scaling on a many-core machine; the output array
+alone needs 8 bytes per pixel.
+
+Usage:
+    python benchmarks/bench_mandelbrot_tiled.py
+    python benchmarks/bench_mandelbrot_tiled.py --size 16384 16384 \\
+        --processes 1 2 4 8 16
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.fractals.mandelbrot import Viewport, DEFAULT_BOUNDS
+from src.fractals.mandelbrot_parallel import (
+    render_tiled, SharedArray, DEFAULT_TILE_SIZE,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', type=int, nargs=2, default=[2048, 2048],
+                        metavar=('H', 'W'))
+    parser.add_argument('--max-iter', type=int, default=100)
+    parser.add_argument('--tile-size', type=int, default=DEFAULT_TILE_SIZE)
+    parser.add_argument('--processes', type=int, nargs='+',
+                        default=sorted({1, multiprocessing.cpu_count()}))
+    args = parser.parse_args()
+
+    h, w = args.size
+    viewport = Viewport.from_bounds(DEFAULT_BOUNDS, w, h)
+    out = SharedArray(viewport.shape)
+    print(f"{h}x{w} pixels, max_iter={args.max_iter}, "
+          f"tile {args.tile_size}, {multiprocessing.cpu_count()} CPUs")
+    print(f"{'processes':>9} {'time (s)':>10} {'Mpixel/s':>10} "
+          f"{'speedup':>8}")
+    baseline = None
+    with out:
+        for processes in args.processes:
+            start = time.perf_counter()
+            render_tiled(viewport, args.max_iter, processes=processes,
+                         tile_size=args.tile_size, out=out)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{processes:>9} {elapsed:>10.3f} "
+                  f"{h * w / elapsed / 1e6:>10.2f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Julia set sweep example.
+
+Renders the Julia sets of parameters on a circle ``c = r e^(i a)`` in one
+batched call and shows them as a grid of frames; Multibrot and Burning
+Ship are available through --fractal.
+
+Usage:
+    python examples/plot_julia.py
+    python examples/plot_julia.py --frames 16 --radius 0.7885
+    python examples/plot_julia.py --fractal burning-ship --max-iter 200
+"""
+
+import argparse
+import math
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib.pyplot as plt
+import numpy as np
+from src.fractals.mandelbrot import Viewport
+from src.fractals.families import (
+    Multibrot, BurningShip, render_julia_batch,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Plot Julia sets and other escape-time fractals.")
+    parser.add_argument('--fractal', default='julia',
+                        choices=['julia', 'multibrot', 'burning-ship'])
+    parser.add_argument('--frames', type=int, default=9,
+                        help='number of Julia parameters in the sweep')
+    parser.add_argument('--radius', type=float, default=0.7885,
+                        help='|c| of the swept Julia parameters')
+    parser.add_argument('--degree', type=int, default=3,
+                        help='Multibrot degree')
+    parser.add_argument('--size', type=int, default=300,
+                        help='pixels per frame edge')
+    parser.add_argument('--max-iter', type=int, default=300)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Generate and display the fractal(s)."""
+    args = parse_args(argv)
+
+    if args.fractal == 'julia':
+        viewport = Viewport(-1.6, 1.6, -1.6, 1.6, args.size, args.size)
+        angles = np.linspace(0, 2 * np.pi, args.frames, endpoint=False)
+        cs = args.radius * np.exp(1j * angles)
+        print(f"Computing {args.frames} Julia sets...")
+        images = render_julia_batch(viewport, cs, args.max_iter,
+                                    periodicity=True, smooth=True)
+        titles = [f"c = {c.real:.3f}{c.imag:+.3f}i" for c in cs]
+    else:
+        if args.fractal == 'multibrot':
+            fractal = Multibrot(args.degree)
+            viewport = Viewport(-1.6, 1.6, -1.6, 1.6, args.size, args.size)
+        else:
+            fractal = BurningShip()
+            viewport = Viewport(-2.5, 1.5, -2.0, 2.0, args.size, args.size)
+        print(f"Computing {fractal.key}...")
+        images = [fractal.render(viewport, args.max_iter, periodicity=True,
+                                 smooth=True)]
+        titles = [fractal.key]
+    print("Computation complete!")
+
+    # Visualization
+    columns = math.ceil(math.sqrt(len(images)))
+    rows = math.ceil(len(images) / columns)
+    fig, axes = plt.subplots(rows, columns, figsize=(3 * columns + 1,
+                                                     3 * rows + 1),
+                             squeeze=False)
+    for ax in axes.flat:
+        ax.axis('off')
+    for ax, image, title in zip(axes.flat, images, titles):
+        ax.imshow(image.smooth, cmap='magma', extent=image.extent,
+                  origin='lower')
+        ax.set_title(title, fontsize=9)
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,18 @@
 Lorenz attractor visualization with animation.
 
 This script demonstrates how to use the Lorenz computation module
-and visualize the results as an animated 3D plot.
+and visualize the results as an animated 3D plot. The trajectory is
+generated chunk by chunk as the animation advances; with --trail only the
+most recent points are kept, so even an endless run uses bounded memory.
+
+Usage:
+    python examples/plot_lorenz.py
+    python examples/plot_lorenz.py --steps 0 --trail 3000
 """
 
+import argparse
 import sys
+from collections import deque
 from pathlib import Path
 
 # Add project root to Python path
@@ -17,11 +25,22 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import matplotlib.animation as animation
 
-from src.simulations.lorenz import compute_lorenz_trajectory
+from src.simulations.lorenz import iter_lorenz_chunks
+
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Animate the Lorenz attractor.")
+    parser.add_argument('--steps', type=int, default=10000,
+                        help='number of steps, 0 to run forever')
+    parser.add_argument('--trail', type=int, default=None,
+                        help='points kept on screen (default: all)')
+    return parser.parse_args(argv)
 
-def main():
+
+def main(argv=None):
     """Generate and animate the Lorenz attractor."""
+    args = parse_args(argv)
 
     # Parameters for the Lorenz system
     sigma = 10.0  # Prandtl number
@@ -30,27 +49,23 @@ def main():
 
     # Time parameters
     dt = 0.01  # Time step
-    num_steps = 10000  # Number of steps
+    num_steps = args.steps or None  # Number of steps (None: endless)
 
     # Initial conditions
     initial_state = [-1.0, -1.0, 1.0]
 
-    # Compute the trajectory
-    print(f"Computing Lorenz attractor ({num_steps} steps)...")
-    trajectory = compute_lorenz_trajectory(
+    # Stream the trajectory one point per frame, a chunk at a time
+    chunks = iter_lorenz_chunks(
         initial_state=initial_state,
         num_steps=num_steps,
         dt=dt,
+        chunk_size=1000,
         sigma=sigma,
         rho=rho,
         beta=beta
     )
-    print("Computation complete!")
-
-    # Extract x, y, z for easier access
-    x = trajectory[:, 0]
-    y = trajectory[:, 1]
-    z = trajectory[:, 2]
+    points = (point for chunk in chunks for point in chunk)
+    trail = deque(maxlen=args.trail)
 
     # Set up the figure and 3D axis
     fig = plt.figure(figsize=(10, 7))
@@ -68,8 +83,13 @@ def main():
 
     # Update function for the animation
     def update(num):
-        line.set_data(x[:num], y[:num])
-        line.set_3d_properties(z[:num])
+        point = next(points, None)
+        if point is None:  # run finished; keep the final picture
+            return line,
+        trail.append(point)
+        x, y, z = np.array(trail).T
+        line.set_data(x, y)
+        line.set_3d_properties(z)
         return line,
 
     # Create the animation
@@ -77,7 +97,8 @@ def main():
         fig, update,
         frames=num_steps,
         interval=1,
-        blit=True
+        blit=True,
+        cache_frame_data=False
     )
 
     plt.show()
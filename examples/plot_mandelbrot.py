@@ -3,8 +3,15 @@ Mandelbrot set visualization example.
 
 This script demonstrates how to use the mandelbrot computation module
 and visualize the results with matplotlib.
+
+Usage:
+    python examples/plot_mandelbrot.py
+    python examples/plot_mandelbrot.py --center -0.743643887 0.131825904 \\
+        --zoom 10000 --max-iter 2000
+    python examples/plot_mandelbrot.py --smooth
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -13,26 +20,66 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import matplotlib.pyplot as plt
-from src.fractals.mandelbrot import mandelbrot
+from src.fractals.mandelbrot import (
+    render, Viewport, DEFAULT_BOUNDS, DEFAULT_CENTER,
+)
+from src.fractals.mandelbrot_parallel import render_tiled
+from src.fractals.mandelbrot_subdivision import render_subdivided
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Plot the Mandelbrot set.")
+    parser.add_argument('--width', type=int, default=1500)
+    parser.add_argument('--height', type=int, default=1000)
+    parser.add_argument('--max-iter', type=int, default=100)
+    parser.add_argument('--center', type=float, nargs=2, default=None,
+                        metavar=('X', 'Y'),
+                        help='view centre (default: the whole set, or '
+                             'the middle of it with --zoom)')
+    parser.add_argument('--zoom', type=float, default=None,
+                        help='magnification around --center (default: 1)')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('--subdivide', action='store_true',
+                        help='Mariani-Silver subdivision (single process); '
+                             'fast on interior-heavy views')
+    parser.add_argument('--smooth', action='store_true',
+                        help='continuous colouring from normalized '
+                             'iteration counts (single process)')
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv=None):
     """Generate and display the Mandelbrot set."""
-    # Computation parameters
-    h, w = 1000, 1500
-    max_iter = 100
+    args = parse_args(argv)
+    if args.center is None and args.zoom is None:
+        viewport = Viewport.from_bounds(DEFAULT_BOUNDS, args.width,
+                                        args.height)
+    else:
+        center = DEFAULT_CENTER if args.center is None else tuple(args.center)
+        zoom = 1.0 if args.zoom is None else args.zoom
+        viewport = Viewport.from_center(center, zoom, args.width, args.height)
 
     # Compute the Mandelbrot set
-    print(f"Computing Mandelbrot set ({h}x{w}, max_iter={max_iter})...")
-    result = mandelbrot(h, w, max_iter)
+    print(f"Computing Mandelbrot set ({args.height}x{args.width}, "
+          f"max_iter={args.max_iter})...")
+    if args.smooth:
+        image = render(viewport, args.max_iter, cardioid=True,
+                       periodicity=True, smooth=True)
+    elif args.subdivide:
+        image = render_subdivided(viewport, args.max_iter)
+    else:
+        image = render_tiled(viewport, args.max_iter,
+                             processes=args.processes, cardioid=True,
+                             periodicity=True)
     print("Computation complete!")
 
     # Visualization
     plt.figure(figsize=(12, 8))
     plt.imshow(
-        result,
+        image.smooth if args.smooth else image.divtime,
         cmap='magma',
-        extent=[-2, 0.8, -1.4, 1.4],
+        extent=image.extent,
         origin='lower'
     )
     plt.title("Mandelbrot Set")
@@ -0,0 +1,70 @@
+"""
+Deep-zoom Mandelbrot example using perturbation theory.
+
+Renders magnifications far beyond float64 (e.g. 1e50) from a centre given
+as decimal strings, which are kept in full precision.
+
+Usage:
+    python examples/plot_mandelbrot_deep.py
+    python examples/plot_mandelbrot_deep.py --center 0 1 --zoom 1e50 \\
+        --max-iter 1000
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import matplotlib.pyplot as plt
+from src.fractals.mandelbrot_perturbation import DeepViewport, render_deep
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Plot a deep zoom into the Mandelbrot set.")
+    parser.add_argument('--width', type=int, default=600)
+    parser.add_argument('--height', type=int, default=400)
+    parser.add_argument('--max-iter', type=int, default=1000)
+    parser.add_argument('--center', nargs=2, default=['0', '1'],
+                        metavar=('X', 'Y'),
+                        help='view centre as decimal strings '
+                             '(default: the Misiurewicz point i)')
+    parser.add_argument('--zoom', type=float, default=1e30,
+                        help='magnification around --center')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Generate and display a deep zoom."""
+    args = parse_args(argv)
+    viewport = DeepViewport(args.center, args.zoom, args.width, args.height)
+
+    print(f"Computing {args.height}x{args.width} at zoom {args.zoom:g} "
+          f"({viewport.precision} digits, max_iter={args.max_iter})...")
+    image = render_deep(viewport, args.max_iter)
+    print("Computation complete!")
+
+    # Axes show the offset from the centre, as absolute coordinates are
+    # indistinguishable in float64 at these depths.
+    half_x = viewport.spacing * (args.width - 1) / 2
+    half_y = viewport.spacing * (args.height - 1) / 2
+    plt.figure(figsize=(12, 8))
+    plt.imshow(
+        image.divtime,
+        cmap='magma',
+        extent=[-half_x, half_x, -half_y, half_y],
+        origin='lower'
+    )
+    plt.title(f"Mandelbrot Set at {args.center[0]} + {args.center[1]}i, "
+              f"zoom {args.zoom:g}")
+    plt.xlabel("Real offset")
+    plt.ylabel("Imaginary offset")
+    plt.colorbar(label='Iteration count')
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Out-of-core Mandelbrot render.
+
+Renders a (possibly gigapixel) view tile by tile into a memory-mapped
+``.npy`` file with bounded memory. Re-running the same command after an
+interruption resumes where it stopped. The result can be opened with
+``src.fractals.mandelbrot_streaming.load_render``.
+
+Usage:
+    python examples/render_mandelbrot_to_disk.py --width 40000 \\
+        --height 40000 --max-iter 1000 --output runs/mandelbrot_40k.npy
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.fractals.mandelbrot import Viewport, DEFAULT_BOUNDS, DEFAULT_CENTER
+from src.fractals.mandelbrot_parallel import DEFAULT_TILE_SIZE
+from src.fractals.mandelbrot_streaming import render_to_file
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render the Mandelbrot set into a memory-mapped file.")
+    parser.add_argument('--width', type=int, default=20000)
+    parser.add_argument('--height', type=int, default=20000)
+    parser.add_argument('--max-iter', type=int, default=500)
+    parser.add_argument('--center', type=float, nargs=2, default=None,
+                        metavar=('X', 'Y'),
+                        help='view centre (default: the whole set, or '
+                             'the middle of it with --zoom)')
+    parser.add_argument('--zoom', type=float, default=None,
+                        help='magnification around --center (default: 1)')
+    parser.add_argument('--tile-size', type=int, default=DEFAULT_TILE_SIZE)
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--output', type=Path, required=True,
+                        help='output .npy file')
+    parser.add_argument('--restart', action='store_true',
+                        help='overwrite instead of resuming')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Render the view described by the command line to disk."""
+    args = parse_args(argv)
+    if args.center is None and args.zoom is None:
+        viewport = Viewport.from_bounds(DEFAULT_BOUNDS, args.width,
+                                        args.height)
+    else:
+        center = DEFAULT_CENTER if args.center is None else tuple(args.center)
+        zoom = 1.0 if args.zoom is None else args.zoom
+        viewport = Viewport.from_center(center, zoom, args.width, args.height)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+
+    print(f"Rendering {args.height}x{args.width} (max_iter={args.max_iter}) "
+          f"to {args.output}...")
+    start = time.perf_counter()
+    image = render_to_file(viewport, args.max_iter, args.output,
+                           tile_size=args.tile_size,
+                           processes=args.processes,
+                           resume=not args.restart)
+    elapsed = time.perf_counter() - start
+    print(f"Done in {elapsed:.1f} s ({image.divtime.dtype} pixels)")
+
+
+if __name__ == "__main__":
+    main()
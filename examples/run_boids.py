@@ -3,8 +3,12 @@ Boids flocking simulation visualization with PyOpenGL.
 
 This script demonstrates how to use the boids computation module
 and visualize the results as an animated 3D flocking simulation.
+
+Pass ``--replay <dir>`` to play back a recording made by
+run_boids_headless.py instead of simulating live.
 """
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -19,11 +23,10 @@ from OpenGL.GL import *
 from OpenGL.GLU import *
 
 from src.simulations.boids import (
-    Boid, normalize, separation, alignment, cohesion, get_boid_color,
-    create_flock,
-    DEFAULT_MAX_SPEED, DEFAULT_MAX_FORCE,
-    DEFAULT_SEPARATION_RADIUS, DEFAULT_ALIGNMENT_RADIUS, DEFAULT_COHESION_RADIUS,
+    SpatialGrid, normalize, normalize_rows, spawn_flock, BOID_COLORS,
 )
+from src.simulations.boids_recording import BoidsRecording
+from src.simulations.boids_scheduler import FixedStepScheduler
 
 
 def draw_boid(position, velocity, color=(1.0, 1.0, 1.0), size=1.0):
@@ -59,14 +62,141 @@ def draw_boid(position, velocity, color=(1.0, 1.0, 1.0), size=1.0):
     glPopMatrix()
 
 
+# Boid triangle in draw_boid()'s local frame. glMultMatrixf() reads the
+# row-major matrix as columns, so local x maps to ``right`` and local y to
+# ``up`` (the triangle points along right, as in draw_boid()).
+BOID_TRIANGLE = np.array([
+    [2.0, 0.0, 0.0],
+    [-2.0, 1.0, 0.0],
+    [-2.0, -1.0, 0.0],
+], dtype=np.float32)
+
+BOID_PALETTE = np.array(BOID_COLORS, dtype=np.float32)
+
+
+def flock_orientations(velocities):
+    """Bulk version of draw_boid()'s frame: (right, up) axes for every boid.
+
+    Uses the same construction as draw_boid() (forward = normalized
+    velocity, right = forward x world-up, up = right x forward), so batched
+    boids look identical to immediate-mode ones.
+    """
+    forward = normalize_rows(np.asarray(velocities, dtype=np.float32))
+    right = np.cross(forward, np.array([0.0, 1.0, 0.0], dtype=np.float32))
+    up = np.cross(right, forward)
+    return right, up
+
+
+def flock_triangles(positions, velocities, colors, size=1.0):
+    """Build vertex and colour arrays for drawing the whole flock at once.
+
+    Args:
+        positions: (N, 3) boid positions.
+        velocities: (N, 3) boid velocities.
+        colors: (N,) colour classes (indices into BOID_COLORS).
+        size: Boid scale factor.
+
+    Returns:
+        tuple: (vertices, vertex_colors), both float32 arrays of shape
+        (3N, 3) ready to upload as GL_TRIANGLES.
+    """
+    right, up = flock_orientations(velocities)
+    local = BOID_TRIANGLE * size
+    vertices = (np.asarray(positions, dtype=np.float32)[:, None, :]
+                + local[None, :, 0, None] * right[:, None, :]
+                + local[None, :, 1, None] * up[:, None, :])
+    vertex_colors = np.repeat(BOID_PALETTE[np.asarray(colors)], 3, axis=0)
+    return vertices.reshape(-1, 3), vertex_colors
+
+
+class FlockRenderer:
+    """Draws a whole flock with one batched draw call per frame.
+
+    Vertex positions and colours for every boid are computed in bulk,
+    streamed into two vertex buffer objects and drawn with a single
+    glDrawArrays(GL_TRIANGLES) call, so the number of GL calls per frame
+    does not depend on flock size. Requires an active OpenGL context.
+    """
+
+    def __init__(self, size=1.0):
+        self.size = size
+        self.vertex_buffer, self.color_buffer = glGenBuffers(2)
+
+    def draw(self, positions, velocities, colors):
+        vertices, vertex_colors = flock_triangles(positions, velocities,
+                                                  colors, self.size)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vertex_buffer)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices,
+                     GL_STREAM_DRAW)
+        glVertexPointer(3, GL_FLOAT, 0, None)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.color_buffer)
+        glBufferData(GL_ARRAY_BUFFER, vertex_colors.nbytes, vertex_colors,
+                     GL_STREAM_DRAW)
+        glColorPointer(3, GL_FLOAT, 0, None)
+
+        glDrawArrays(GL_TRIANGLES, 0, len(vertices))
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def delete(self):
+        glDeleteBuffers(2, [self.vertex_buffer, self.color_buffer])
+
+
+def simulated_frames(bounds, num_boids, spawn_area_size, weights,
+                     steps_per_second=60.0):
+    """Yield (positions, velocities, colors) from a live simulation.
+
+    The flock runs at a fixed timestep on a background thread; each frame
+    interpolates between the two most recent complete steps, so the frame
+    rate does not change the simulation speed.
+    """
+    # Boids wrap at the bounds, so let them see neighbours across the seams
+    flock = spawn_flock(num_boids, bounds / 2, spawn_area_size,
+                        index=SpatialGrid(bounds, periodic=True),
+                        periodic=True)
+    separation_weight, alignment_weight, cohesion_weight = weights
+    scheduler = FixedStepScheduler(
+        flock, bounds, steps_per_second,
+        separation_weight=separation_weight,
+        alignment_weight=alignment_weight,
+        cohesion_weight=cohesion_weight,
+    )
+    with scheduler:
+        while True:
+            yield scheduler.interpolated()
+
+
+def replayed_frames(path):
+    """Yield (positions, velocities, colors) from a recording, looping."""
+    recording = BoidsRecording(path)
+    # Re-iterate rather than cycle(), which would keep every frame (and so
+    # every chunk memmap) alive after the first pass.
+    while recording.num_frames:
+        for _, positions, velocities, colors in recording:
+            yield positions, velocities, colors
+
+
 def main():
     """Run the boids flocking simulation with OpenGL visualization."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--replay', type=Path, default=None,
+                        help='play back a recording directory')
+    args = parser.parse_args()
 
     # Simulation parameters
     WIDTH, HEIGHT = 800, 600
     DEPTH = 800
     NUM_BOIDS = 50
     SPAWN_AREA_SIZE = 200
+    STEPS_PER_SECOND = 60.0  # simulation rate
+    MAX_FPS = 120  # render rate cap, independent of the simulation
 
     # Force weights
     SEPARATION_WEIGHT = 1.5
@@ -79,9 +209,18 @@ def main():
     gluPerspective(45, (WIDTH / HEIGHT), 0.1, 2000.0)
     glTranslatef(-WIDTH / 2, -HEIGHT / 2, -1000)
 
-    # Create initial flock
-    center = np.array([WIDTH / 2, HEIGHT / 2, DEPTH / 2])
-    boids = create_flock(NUM_BOIDS, center, SPAWN_AREA_SIZE)
+    bounds = np.array([WIDTH, HEIGHT, DEPTH])
+    if args.replay is not None:
+        frames = replayed_frames(args.replay)
+    else:
+        frames = simulated_frames(
+            bounds, NUM_BOIDS, SPAWN_AREA_SIZE,
+            (SEPARATION_WEIGHT, ALIGNMENT_WEIGHT, COHESION_WEIGHT),
+            STEPS_PER_SECOND)
+
+    # Boids drawn at 1.5x size (50% larger), whole flock in one draw call
+    renderer = FlockRenderer(size=1.5)
+    clock = pygame.time.Clock()
 
     # Main loop
     running = True
@@ -93,30 +232,14 @@ def main():
         # Clear screen
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
-        # Update and draw boids
-        for boid in boids:
-            # Calculate steering forces
-            separation_force = separation(boid, boids, DEFAULT_SEPARATION_RADIUS)
-            alignment_force = alignment(boid, boids, DEFAULT_ALIGNMENT_RADIUS)
-            cohesion_force = cohesion(boid, boids, DEFAULT_COHESION_RADIUS)
-
-            # Apply forces with weights
-            boid.acceleration += separation_force * SEPARATION_WEIGHT
-            boid.acceleration += alignment_force * ALIGNMENT_WEIGHT
-            boid.acceleration += cohesion_force * COHESION_WEIGHT
-
-            # Update position
-            boid.update(np.array([WIDTH, HEIGHT, DEPTH]))
-
-            # Get color based on neighbor proximity
-            color = get_boid_color(boid, boids)
-
-            # Draw boid with color at 1.5x size (50% larger)
-            draw_boid(boid.position, boid.velocity, color, size=1.5)
+        positions, velocities, colors = next(frames)
+        renderer.draw(positions, velocities, colors)
 
         pygame.display.flip()
-        pygame.time.wait(10)
+        clock.tick(MAX_FPS)
 
+    frames.close()
+    renderer.delete()
     pygame.quit()
 
 
@@ -0,0 +1,101 @@
+"""
+Headless boids simulation runner.
+
+Advances a flock as fast as possible without a display and streams
+snapshots to a chunked binary recording, which can be replayed later with
+``python examples/run_boids.py --replay <dir>`` or read with
+``src.simulations.boids_recording.BoidsRecording``.
+
+Usage:
+    python examples/run_boids_headless.py --boids 10000 --steps 1000 \\
+        --stride 10 --output runs/flock_10k
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from src.simulations.boids import SpatialGrid, spawn_flock, SPAWN_SHAPES
+from src.simulations.boids_parallel import ParallelFlockStepper
+from src.simulations.boids_recording import (
+    BoidsRecorder, run_headless, DEFAULT_CHUNK_FRAMES,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run the boids simulation headless and record it.")
+    parser.add_argument('--boids', type=int, default=1000)
+    parser.add_argument('--steps', type=int, default=1000)
+    parser.add_argument('--stride', type=int, default=1,
+                        help='steps between recorded snapshots')
+    parser.add_argument('--output', type=Path, default=None,
+                        help='recording directory (omit to only simulate)')
+    parser.add_argument('--chunk-frames', type=int,
+                        default=DEFAULT_CHUNK_FRAMES)
+    parser.add_argument('--bounds', type=float, nargs=3,
+                        default=[800.0, 600.0, 800.0])
+    parser.add_argument('--spawn-area', type=float, default=200.0)
+    parser.add_argument('--spawn', choices=SPAWN_SHAPES, default='cube')
+    parser.add_argument('--clusters', type=int, default=4,
+                        help='number of clusters for --spawn clusters')
+    parser.add_argument('--periodic', action='store_true',
+                        help='minimum-image distances across the bounds')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='worker processes (>1 uses slab decomposition)')
+    parser.add_argument('--seed', type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the simulation described by the command line."""
+    args = parse_args(argv)
+    bounds = np.array(args.bounds)
+
+    flock = spawn_flock(
+        args.boids, bounds / 2, args.spawn_area, shape=args.spawn,
+        seed=args.seed, num_clusters=args.clusters,
+        index=SpatialGrid(bounds, periodic=args.periodic),
+        periodic=args.periodic,
+    )
+
+    recorder = None
+    if args.output is not None:
+        recorder = BoidsRecorder(
+            args.output, args.boids, stride=args.stride,
+            chunk_frames=args.chunk_frames,
+            metadata={'bounds': args.bounds, 'periodic': args.periodic,
+                      'spawn': args.spawn, 'seed': args.seed},
+        )
+
+    stepper = None
+    if args.processes > 1:
+        stepper = ParallelFlockStepper(flock, bounds,
+                                       processes=args.processes)
+
+    print(f"Simulating {args.boids} boids for {args.steps} steps...")
+    start = time.perf_counter()
+    try:
+        frames = run_headless(flock, bounds, args.steps, recorder,
+                              stepper=stepper)
+    finally:
+        if stepper is not None:
+            stepper.close()
+        if recorder is not None:
+            recorder.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"Done in {elapsed:.2f} s ({args.steps / elapsed:.1f} steps/s)")
+    if recorder is not None:
+        print(f"Recorded {frames} frames to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
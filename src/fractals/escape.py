@@ -0,0 +1,172 @@
+"""
+Shared escape-time iteration kernel.
+
+This module provides pure computation functions; visualization is handled
+separately.
+
+iterate_escape() runs any iteration ``z -> step(z, c)`` over an array of
+starting points until ``|z| > 2``, keeping only the live points in
+compacted arrays. The Mandelbrot set, Julia sets, Multibrot sets and the
+Burning Ship all differ only in their starting ``z``, their ``c`` and
+their step function, so they share this loop together with its
+periodicity check and its smooth/distance outputs.
+"""
+
+import numpy as np
+
+# Escaped points are iterated on to this radius before the smooth count and
+# distance estimate are taken; |z| passes it within a few iterations.
+CONTINUOUS_RADIUS = 2.0**10
+MAX_EXTRA_ITERATIONS = 64
+
+
+def quadratic_step(z, c):
+    """The Mandelbrot/Julia iteration ``z**2 + c``."""
+    return z**2 + c
+
+
+def quadratic_derivative(z, dz):
+    """``d/dc`` of quadratic_step() applied to a derivative ``dz``."""
+    return 2 * z * dz + 1
+
+
+def _store_continuous(i, z, dz, c, escaped, flat_smooth, flat_distance,
+                      step, derivative, degree):
+    """Scatter smooth counts and distance estimates of escaping points.
+
+    The points are iterated a few more times, until ``|z|`` exceeds
+    CONTINUOUS_RADIUS, so that both formulas are close to their large-radius
+    limits.
+    """
+    extra = np.zeros(z.shape, dtype=int)
+    for _ in range(MAX_EXTRA_ITERATIONS):
+        pending = np.abs(z) <= CONTINUOUS_RADIUS
+        if not pending.any():
+            break
+        if dz is not None:
+            dz[pending] = derivative(z[pending], dz[pending])
+        z[pending] = step(z[pending], c[pending])
+        extra += pending
+
+    modulus = np.abs(z)
+    if flat_smooth is not None:
+        flat_smooth[escaped] = (i + extra + 1
+                                - np.log2(np.log2(modulus)) / np.log2(degree))
+    if flat_distance is not None:
+        flat_distance[escaped] = 2 * modulus * np.log(modulus) / np.abs(dz)
+
+
+def iterate_escape(z, c, max_iter, step=quadratic_step, derivative=None,
+                   degree=2, skip=None, periodicity=False, smooth_out=None,
+                   distance_out=None):
+    """
+    Escape times of the iteration ``z -> step(z, c)`` from given start points.
+
+    Only points that have not escaped yet are iterated: their flat indices,
+    ``z`` and ``c`` values are kept in compacted arrays that shrink as points
+    escape, and each escape time is scattered back into the output. Every
+    live point goes through exactly the same arithmetic as in a full-grid
+    iteration, so the result is identical to iterating the whole array.
+
+    ``periodicity`` compares every ``z`` with a copy saved at iterations
+    1, 2, 4, 8, ... (Brent's method). When a point's ``z`` equals its saved
+    value exactly, the deterministic float iteration has entered a cycle
+    and will repeat it forever, so the point is retired with max_iter.
+    This check never changes the result.
+
+    Continuous outputs for high-quality colouring are computed in the same
+    pass, without storing orbits: when a point escapes, it alone is
+    iterated ``k`` more times (typically 2-4) until ``|z|`` exceeds
+    CONTINUOUS_RADIUS, and then
+
+    - ``smooth_out`` receives the normalized iteration count
+      ``i + k + 1 - log(log2|z|) / log(degree)``, which varies continuously
+      across the bands of the integer count, and
+    - ``distance_out`` receives the exterior distance estimate
+      ``2 |z| ln|z| / |dz|``, where ``dz`` is the derivative carried by
+      ``derivative``; the true distance from the point to the set lies
+      between about a quarter of it and it.
+
+    Points that never escape get max_iter and 0 respectively.
+
+    Args:
+        z (array-like): Complex starting points of any shape.
+        c (array-like): Complex parameters, broadcastable to ``z``.
+        max_iter (int): Maximum number of iterations to test for divergence
+        step (callable): ``step(z, c)`` returning the next ``z``
+            elementwise.
+        derivative (callable): ``derivative(z, dz)`` returning the next
+            ``dz``; needed for distance_out only.
+        degree (int): Degree of the step as a polynomial in ``z``, which
+            sets the rate the smooth count is normalized by.
+        skip (numpy.ndarray): Optional boolean mask of the shape of ``z``;
+            masked points get max_iter without being iterated.
+        periodicity (bool): Retire points whose orbit has become periodic.
+        smooth_out (numpy.ndarray): Optional C-contiguous float array of
+            the shape of ``z`` to fill with normalized iteration counts.
+        distance_out (numpy.ndarray): Optional C-contiguous float array of
+            the shape of ``z`` to fill with distance estimates.
+
+    Returns:
+        numpy.ndarray: Integer array of the same shape as ``z`` holding the
+                      iteration at which each point diverged (``|z| > 2``),
+                      or max_iter for points that never did.
+
+    Raises:
+        ValueError: If distance_out is given without a derivative.
+    """
+    z = np.asarray(z, dtype=complex)
+    c = np.broadcast_to(np.asarray(c, dtype=complex), z.shape)
+    if distance_out is not None and derivative is None:
+        raise ValueError("distance estimates need a derivative")
+    divtime = max_iter + np.zeros(z.shape, dtype=int)
+    flat_divtime = divtime.reshape(-1)
+
+    live = np.arange(z.size)
+    if skip is not None:
+        live = live[~np.asarray(skip).reshape(-1)]
+    c_live = c.reshape(-1)[live]
+    z = z.reshape(-1)[live]
+    saved = z.copy() if periodicity else None
+    next_save = 1
+
+    flat_smooth = flat_distance = dz = None
+    if smooth_out is not None:
+        smooth_out[...] = max_iter
+        flat_smooth = smooth_out.reshape(-1)
+    if distance_out is not None:
+        distance_out[...] = 0
+        flat_distance = distance_out.reshape(-1)
+        dz = np.ones_like(z)
+
+    for i in range(max_iter):
+        if live.size == 0:
+            break
+        if dz is not None:
+            dz = derivative(z, dz)
+        z = step(z, c_live)
+        diverge = z*np.conj(z) > 2**2
+        retire = diverge
+        if periodicity:
+            retire = diverge | (z == saved)
+        if retire.any():
+            escaped = live[diverge]
+            flat_divtime[escaped] = i
+            if flat_smooth is not None or flat_distance is not None:
+                _store_continuous(i, z[diverge],
+                                  None if dz is None else dz[diverge],
+                                  c_live[diverge], escaped, flat_smooth,
+                                  flat_distance, step, derivative, degree)
+            keep = ~retire
+            live = live[keep]
+            z = z[keep]
+            c_live = c_live[keep]
+            if periodicity:
+                saved = saved[keep]
+            if dz is not None:
+                dz = dz[keep]
+        if periodicity and i + 1 == next_save:
+            saved = z.copy()
+            next_save *= 2
+
+    return divtime
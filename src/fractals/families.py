@@ -0,0 +1,255 @@
+"""
+Julia, Multibrot and Burning Ship fractals on the shared escape-time kernel.
+
+This module provides pure computation functions; visualization is handled
+separately.
+
+Each fractal is a small object that names its starting ``z``, its ``c``
+and its step function; iteration, periodicity checking and smooth output
+all come from iterate_escape(), as for the Mandelbrot set. The objects
+have the same escape_time()/render() API as the mandelbrot module and can
+be passed as ``fractal`` to render_tiled() and TilePyramid. Escape times
+follow escape_time()'s convention: the first iterate after the starting
+point is iteration 0.
+"""
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from src.fractals.escape import (
+    iterate_escape, quadratic_step, quadratic_derivative,
+)
+from src.fractals.mandelbrot import (
+    MandelbrotImage, escape_time as mandelbrot_escape_time,
+)
+
+
+class EscapeTimeFractal(ABC):
+    """Base class of the escape-time fractals.
+
+    Subclasses implement key, start() and step(), and set ``degree`` (the
+    polynomial degree of the step in ``z``) and ``derivative`` (for
+    distance estimates, or None where there is none).
+    """
+
+    degree = 2
+    derivative = None
+
+    @property
+    @abstractmethod
+    def key(self):
+        """Short name identifying the fractal, e.g. for cache keys."""
+
+    @abstractmethod
+    def start(self, points):
+        """Return the starting ``z`` and the ``c`` for each point."""
+
+    @abstractmethod
+    def step(self, z, c):
+        """One iteration, elementwise."""
+
+    def escape_time(self, points, max_iter, cardioid=False,
+                    periodicity=False, smooth_out=None, distance_out=None):
+        """
+        Escape times for an arbitrary array of points.
+
+        Args:
+            points (array-like): Complex points of any shape.
+            max_iter (int): Maximum number of iterations to test for
+                divergence
+            cardioid (bool): Only supported by the Mandelbrot set.
+            periodicity (bool): Retire points whose orbit has become
+                periodic; see iterate_escape().
+            smooth_out (numpy.ndarray): Optional float array to fill with
+                normalized iteration counts.
+            distance_out (numpy.ndarray): Optional float array to fill
+                with distance estimates.
+
+        Returns:
+            numpy.ndarray: Integer escape times of the shape of ``points``.
+
+        Raises:
+            ValueError: If an option is not supported by this fractal.
+        """
+        if cardioid:
+            raise ValueError(f"{self.key} has no cardioid pre-test")
+        z, c = self.start(np.asarray(points, dtype=complex))
+        return iterate_escape(z, c, max_iter, step=self.step,
+                              derivative=self.derivative,
+                              degree=self.degree, periodicity=periodicity,
+                              smooth_out=smooth_out,
+                              distance_out=distance_out)
+
+    def render(self, viewport, max_iter, cardioid=False, periodicity=False,
+               smooth=False, distance=False):
+        """
+        Compute the fractal over a viewport.
+
+        Args:
+            viewport (Viewport): Region and resolution to render.
+            max_iter (int): Maximum number of iterations to test for
+                divergence
+            cardioid (bool): Only supported by the Mandelbrot set.
+            periodicity (bool): Retire periodic orbits early.
+            smooth (bool): Also compute normalized iteration counts.
+            distance (bool): Also compute distance estimates.
+
+        Returns:
+            MandelbrotImage: The escape times with the viewport and
+            max_iter, and the smooth and distance arrays if requested.
+        """
+        smooth_out = np.empty(viewport.shape, np.float32) if smooth else None
+        distance_out = (np.empty(viewport.shape, np.float32) if distance
+                        else None)
+        divtime = self.escape_time(viewport.grid(), max_iter,
+                                   cardioid=cardioid,
+                                   periodicity=periodicity,
+                                   smooth_out=smooth_out,
+                                   distance_out=distance_out)
+        return MandelbrotImage(divtime, viewport, max_iter, smooth=smooth_out,
+                               distance=distance_out)
+
+    def __eq__(self, other):
+        if not isinstance(other, EscapeTimeFractal):
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.key}>"
+
+
+class Mandelbrot(EscapeTimeFractal):
+    """The Mandelbrot set, ``z -> z**2 + c`` from ``z = c``.
+
+    Delegates to mandelbrot.escape_time(), so it is bit-identical to it
+    and supports the cardioid pre-test.
+    """
+
+    derivative = staticmethod(quadratic_derivative)
+
+    @property
+    def key(self):
+        return "mandelbrot"
+
+    def start(self, points):
+        return points, points
+
+    def step(self, z, c):
+        return quadratic_step(z, c)
+
+    def escape_time(self, points, max_iter, cardioid=False,
+                    periodicity=False, smooth_out=None, distance_out=None):
+        return mandelbrot_escape_time(points, max_iter, cardioid=cardioid,
+                                      periodicity=periodicity,
+                                      smooth_out=smooth_out,
+                                      distance_out=distance_out)
+
+
+class Multibrot(EscapeTimeFractal):
+    """Multibrot set of integer degree ``d``: ``z -> z**d + c`` from ``z = c``.
+
+    Args:
+        degree: Exponent ``d``, at least 2; 2 is the Mandelbrot set.
+    """
+
+    def __init__(self, degree):
+        if int(degree) != degree or degree < 2:
+            raise ValueError(f"degree must be an integer >= 2, got {degree}")
+        self.degree = int(degree)
+
+    @property
+    def key(self):
+        return f"multibrot-{self.degree}"
+
+    def start(self, points):
+        return points, points
+
+    def step(self, z, c):
+        return z**self.degree + c
+
+    def derivative(self, z, dz):
+        return self.degree * z**(self.degree - 1) * dz + 1
+
+
+class Julia(EscapeTimeFractal):
+    """Filled Julia set of ``z -> z**2 + c`` for a fixed ``c``.
+
+    Each point is a starting ``z``; distance estimates use ``dz/dz0``.
+
+    Args:
+        c: The complex parameter.
+    """
+
+    def __init__(self, c):
+        self.c = complex(c)
+
+    @property
+    def key(self):
+        return f"julia({self.c.real!r},{self.c.imag!r})"
+
+    def start(self, points):
+        return points, self.c
+
+    def step(self, z, c):
+        return quadratic_step(z, c)
+
+    @staticmethod
+    def derivative(z, dz):
+        return 2 * z * dz
+
+
+class BurningShip(EscapeTimeFractal):
+    """Burning Ship fractal, ``z -> (|Re z| + i |Im z|)**2 + c`` from ``z = c``.
+
+    The map is not holomorphic, so there is no distance estimate. With
+    ``origin='lower'`` the ship is drawn upside down; flip the imaginary
+    axis for the usual picture.
+    """
+
+    @property
+    def key(self):
+        return "burning-ship"
+
+    def start(self, points):
+        return points, points
+
+    def step(self, z, c):
+        folded = np.abs(z.real) + 1j*np.abs(z.imag)
+        return folded**2 + c
+
+
+def render_julia_batch(viewport, cs, max_iter, periodicity=False,
+                       smooth=False):
+    """
+    Render the Julia sets of many parameters in one vectorized pass.
+
+    All parameters are iterated together as a single (K, height, width)
+    stack, so an animation sweep pays the per-iteration overhead once
+    rather than once per frame.
+
+    Args:
+        viewport (Viewport): Region and resolution shared by every frame.
+        cs (array-like): The K complex parameters.
+        max_iter (int): Maximum number of iterations to test for divergence
+        periodicity (bool): Retire periodic orbits early.
+        smooth (bool): Also compute normalized iteration counts.
+
+    Returns:
+        list: One MandelbrotImage per parameter, in the order of ``cs``;
+        identical to ``Julia(c).render(viewport, max_iter)`` for each.
+    """
+    cs = np.asarray(cs, dtype=complex).reshape(-1)
+    shape = (cs.size,) + viewport.shape
+    z = np.broadcast_to(viewport.grid(), shape)
+    c = cs[:, None, None]
+    smooth_out = np.empty(shape, np.float32) if smooth else None
+    divtime = iterate_escape(z, c, max_iter, periodicity=periodicity,
+                             smooth_out=smooth_out)
+    return [MandelbrotImage(divtime[k], viewport, max_iter,
+                            smooth=None if smooth_out is None
+                            else smooth_out[k])
+            for k in range(cs.size)]
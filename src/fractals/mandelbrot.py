@@ -7,13 +7,206 @@ Visualization is handled separately.
 
 import numpy as np
 
+from src.fractals.escape import iterate_escape, quadratic_derivative
+
+# Region of the complex plane rendered by mandelbrot(): (x_min, x_max,
+# y_min, y_max), real axis first.
+DEFAULT_BOUNDS = (-2.0, 0.8, -1.4, 1.4)
+
+# Center and height of the default view; Viewport.from_center() zoom 1.
+DEFAULT_CENTER = complex(-0.6, 0.0)
+DEFAULT_SPAN = 2.8
+
+
+class Viewport:
+    """A rectangular region of the complex plane sampled on a pixel grid.
+
+    Pixel centres run from the minimum to the maximum bound inclusive on
+    both axes, as in ``np.ogrid[y_min:y_max:height*1j, x_min:x_max:width*1j]``;
+    row 0 is ``y_min``.
+
+    Args:
+        x_min, x_max: Real-axis bounds.
+        y_min, y_max: Imaginary-axis bounds.
+        width: Number of pixel columns.
+        height: Number of pixel rows.
+    """
+
+    def __init__(self, x_min, x_max, y_min, y_max, width, height):
+        if width < 1 or height < 1:
+            raise ValueError(
+                f"viewport needs at least one pixel, got {width}x{height}")
+        self.x_min = float(x_min)
+        self.x_max = float(x_max)
+        self.y_min = float(y_min)
+        self.y_max = float(y_max)
+        self.width = int(width)
+        self.height = int(height)
+
+    @classmethod
+    def from_bounds(cls, bounds, width, height):
+        """Create a viewport from ``(x_min, x_max, y_min, y_max)``."""
+        return cls(*bounds, width, height)
+
+    @classmethod
+    def from_center(cls, center, zoom, width, height):
+        """Create a viewport of square pixels around a point.
+
+        Args:
+            center: Complex number (or (x, y) pair) at the middle of the view.
+            zoom: Magnification; at zoom 1 the top and bottom pixel centres
+                are DEFAULT_SPAN apart and every doubling halves the span.
+                A single-row view has DEFAULT_SPAN / zoom between columns.
+            width: Number of pixel columns.
+            height: Number of pixel rows.
+        """
+        if not isinstance(center, complex):
+            try:
+                center = complex(*center)
+            except TypeError:
+                center = complex(center)
+        # Pixel centres span (width - 1) x (height - 1) pixel spacings
+        spacing = DEFAULT_SPAN / zoom / max(height - 1, 1)
+        half_x = spacing * (width - 1) / 2
+        half_y = spacing * (height - 1) / 2
+        return cls(center.real - half_x, center.real + half_x,
+                   center.imag - half_y, center.imag + half_y, width, height)
+
+    @property
+    def shape(self):
+        """Output array shape, (height, width)."""
+        return (self.height, self.width)
+
+    @property
+    def bounds(self):
+        """``(x_min, x_max, y_min, y_max)``."""
+        return (self.x_min, self.x_max, self.y_min, self.y_max)
+
+    @property
+    def extent(self):
+        """Bounds in the order matplotlib's ``imshow(extent=...)`` expects."""
+        return [self.x_min, self.x_max, self.y_min, self.y_max]
+
+    @property
+    def center(self):
+        """Complex point at the middle of the view."""
+        return complex((self.x_min + self.x_max) / 2,
+                       (self.y_min + self.y_max) / 2)
+
+    @property
+    def pixel_size(self):
+        """Distance between neighbouring pixel centres as (dx, dy)."""
+        dx = (self.x_max - self.x_min) / max(self.width - 1, 1)
+        dy = (self.y_max - self.y_min) / max(self.height - 1, 1)
+        return dx, dy
+
+    def axes(self):
+        """Pixel-centre coordinates as broadcastable (y, x) arrays.
+
+        Returns:
+            tuple: ``y`` of shape (height, 1) and ``x`` of shape (1, width).
+        """
+        return np.ogrid[self.y_min:self.y_max:self.height*1j,
+                        self.x_min:self.x_max:self.width*1j]
+
+    def grid(self, rows=slice(None), cols=slice(None)):
+        """Complex array of the pixel centres.
+
+        Args:
+            rows: Optional slice of pixel rows.
+            cols: Optional slice of pixel columns.
+
+        Returns:
+            numpy.ndarray: ``grid()[rows, cols]``, computed from the full
+            axes so a tile has exactly the values of the whole grid.
+        """
+        y, x = self.axes()
+        return x[:, cols] + y[rows]*1j
+
+    def to_dict(self):
+        """JSON-serialisable description of the viewport."""
+        return {"x_min": self.x_min, "x_max": self.x_max,
+                "y_min": self.y_min, "y_max": self.y_max,
+                "width": self.width, "height": self.height}
+
+    def __eq__(self, other):
+        if not isinstance(other, Viewport):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return (f"Viewport(x_min={self.x_min!r}, x_max={self.x_max!r}, "
+                f"y_min={self.y_min!r}, y_max={self.y_max!r}, "
+                f"width={self.width}, height={self.height})")
+
+
+class MandelbrotImage:
+    """Escape times of a viewport together with the region they cover.
+
+    Attributes:
+        divtime: (height, width) integer escape times.
+        viewport: The Viewport that was rendered.
+        max_iter: Iteration limit used; pixels equal to it never escaped.
+        smooth: Optional float32 normalized iteration counts, or None.
+        distance: Optional float32 distance estimates, or None.
+    """
+
+    def __init__(self, divtime, viewport, max_iter, smooth=None,
+                 distance=None):
+        self.divtime = divtime
+        self.viewport = viewport
+        self.max_iter = max_iter
+        self.smooth = smooth
+        self.distance = distance
+
+    @property
+    def extent(self):
+        """Bounds for ``imshow(extent=...)``; see Viewport.extent."""
+        return self.viewport.extent
+
+
+def render(viewport, max_iter, cardioid=False, periodicity=False,
+           smooth=False, distance=False):
+    """
+    Compute the Mandelbrot set over a viewport.
+
+    The cost depends only on the viewport's own pixel count, however small
+    the region is.
+
+    Args:
+        viewport (Viewport): Region and resolution to render.
+        max_iter (int): Maximum number of iterations to test for divergence
+        cardioid (bool): Skip the main cardioid and period-2 bulb; see
+            escape_time().
+        periodicity (bool): Retire periodic orbits early; see escape_time().
+        smooth (bool): Also compute normalized iteration counts.
+        distance (bool): Also compute distance estimates.
+
+    Returns:
+        MandelbrotImage: The escape times with the viewport and max_iter,
+        and the smooth and distance arrays if requested.
+
+    Example:
+        >>> view = Viewport.from_center(-0.745 + 0.113j, 1000, 300, 200)
+        >>> render(view, max_iter=500).divtime.shape
+        (200, 300)
+    """
+    smooth_out = np.empty(viewport.shape, np.float32) if smooth else None
+    distance_out = np.empty(viewport.shape, np.float32) if distance else None
+    divtime = escape_time(viewport.grid(), max_iter, cardioid=cardioid,
+                          periodicity=periodicity, smooth_out=smooth_out,
+                          distance_out=distance_out)
+    return MandelbrotImage(divtime, viewport, max_iter, smooth=smooth_out,
+                           distance=distance_out)
+
 
 def mandelbrot(h, w, max_iter):
     """
     Compute the Mandelbrot set over a grid.
 
     Calculates the number of iterations before each point in the complex plane
-    diverges (or reaches max_iter if it doesn't diverge).
+    diverges (or reaches max_iter if it doesn't diverge). The region is fixed
+    to DEFAULT_BOUNDS; use render() with a Viewport for any other region.
 
     Args:
         h (int): Height of the output array (vertical resolution)
@@ -32,16 +225,73 @@ def mandelbrot(h, w, max_iter):
         >>> result.dtype
         dtype('int64')
     """
-    y, x = np.ogrid[-1.4:1.4:h*1j, -2:0.8:w*1j]
-    c = x + y*1j
-    z = c
-    divtime = max_iter + np.zeros(z.shape, dtype=int)
+    viewport = Viewport.from_bounds(DEFAULT_BOUNDS, w, h)
+    return escape_time(viewport.grid(), max_iter)
+
+
+def in_cardioid_or_bulb(c):
+    """
+    Test whether points lie inside the main cardioid or the period-2 bulb.
+
+    Both regions are known analytically to belong to the Mandelbrot set, so
+    their points never escape. Points exactly on either boundary test False.
+
+    Args:
+        c (array-like): Complex points of any shape.
+
+    Returns:
+        numpy.ndarray: Boolean array of the same shape as ``c``.
+    """
+    c = np.asarray(c, dtype=complex)
+    x = c.real
+    y2 = c.imag * c.imag
+    q = (x - 0.25)**2 + y2
+    cardioid = q * (q + (x - 0.25)) < 0.25 * y2
+    bulb = (x + 1)**2 + y2 < 1 / 16
+    return cardioid | bulb
+
+
+def escape_time(c, max_iter, cardioid=False, periodicity=False,
+                smooth_out=None, distance_out=None):
+    """
+    Compute Mandelbrot escape times for an arbitrary array of points.
 
-    for i in range(max_iter):
-        z = z**2 + c
-        diverge = z*np.conj(z) > 2**2
-        div_now = diverge & (divtime == max_iter)
-        divtime[div_now] = i
-        z[diverge] = 2
+    The points are iterated with the shared iterate_escape() kernel, which
+    keeps only the points that have not escaped yet in compacted arrays;
+    the result is identical to iterating the whole array.
 
-    return divtime
+    Two optional early exits retire points that can be shown never to
+    escape, which is where interior-heavy views spend their time:
+
+    - ``cardioid`` gives points inside the main cardioid or the period-2
+      bulb max_iter without iterating them (see in_cardioid_or_bulb()).
+      The iteration of such a point settles on an attracting cycle; only
+      points within rounding distance of the boundary, whose float orbits
+      take millions of iterations to settle, could differ.
+    - ``periodicity`` retires points whose float orbit has become exactly
+      periodic (see iterate_escape()). This check never changes the result.
+
+    ``smooth_out`` and ``distance_out`` receive normalized iteration counts
+    and exterior distance estimates (with ``dz/dc``) from the same pass;
+    see iterate_escape().
+
+    Args:
+        c (array-like): Complex points of any shape.
+        max_iter (int): Maximum number of iterations to test for divergence
+        cardioid (bool): Skip points in the main cardioid and period-2 bulb.
+        periodicity (bool): Retire points whose orbit has become periodic.
+        smooth_out (numpy.ndarray): Optional C-contiguous float array of
+            the shape of ``c`` to fill with normalized iteration counts.
+        distance_out (numpy.ndarray): Optional C-contiguous float array of
+            the shape of ``c`` to fill with distance estimates.
+
+    Returns:
+        numpy.ndarray: Integer array of the same shape as ``c`` holding the
+                      iteration at which each point diverged (``|z| > 2``),
+                      or max_iter for points that never did.
+    """
+    c = np.asarray(c, dtype=complex)
+    skip = in_cardioid_or_bulb(c) if cardioid else None
+    return iterate_escape(c, c, max_iter, derivative=quadratic_derivative,
+                          skip=skip, periodicity=periodicity,
+                          smooth_out=smooth_out, distance_out=distance_out)
@@ -0,0 +1,197 @@
+"""
+Tiled, multi-process Mandelbrot rendering.
+
+This module provides pure computation functions; visualization is handled
+separately.
+
+The viewport is cut into square tiles that are handed to a process pool
+one at a time (``imap_unordered`` with a chunk size of 1), so workers that
+draw cheap tiles outside the set simply take more of them while others are
+busy with expensive tiles inside it. Each tile's points are sliced from the
+full viewport axes and iterated with escape_time(), so the result is
+identical to a serial render() whatever the tile size or process count.
+
+Workers either send finished tiles back to be written into the output
+array, or, when the output is a SharedArray, write them straight into
+shared memory so nothing is copied.
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.fractals.mandelbrot import escape_time, MandelbrotImage
+
+DEFAULT_TILE_SIZE = 256
+
+# Per-process state, set up by _attach_worker()
+_worker = {}
+
+
+def tiles(viewport, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Split a viewport's pixel grid into tiles.
+
+    Args:
+        viewport (Viewport): Viewport to split.
+        tile_size (int): Edge length of a tile in pixels; tiles on the
+            right and bottom edges may be smaller.
+
+    Returns:
+        list: ``(row_slice, col_slice)`` pairs covering every pixel once,
+        in row-major order.
+    """
+    return [
+        (slice(row, min(row + tile_size, viewport.height)),
+         slice(col, min(col + tile_size, viewport.width)))
+        for row in range(0, viewport.height, tile_size)
+        for col in range(0, viewport.width, tile_size)
+    ]
+
+
+def render_tile(viewport, rows, cols, max_iter, fractal=None, **options):
+    """Escape times of one tile of a viewport.
+
+    ``fractal`` is an escape-time fractal from the families module
+    (default: the Mandelbrot set) and ``options`` are escape_time()'s
+    early-exit flags (cardioid, periodicity).
+    """
+    points = viewport.grid(rows, cols)
+    if fractal is None:
+        return escape_time(points, max_iter, **options)
+    return fractal.escape_time(points, max_iter, **options)
+
+
+class SharedArray:
+    """A numpy array backed by a ``multiprocessing.shared_memory`` block.
+
+    Pass it as ``out`` to render_tiled() to have the workers write their
+    tiles into it directly. The creator owns the block: close() (or leaving
+    the ``with`` block) releases and unlinks it. Drop every view of
+    ``array`` first, including the divtime of images rendered into it;
+    close() raises BufferError while views are still alive.
+
+    Args:
+        shape: Array shape.
+        dtype: Array dtype.
+
+    Attributes:
+        array: The shared numpy array.
+        name: Name of the shared memory block.
+    """
+
+    def __init__(self, shape, dtype=int):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = max(int(np.prod(self.shape)) * self.dtype.itemsize, 1)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self.name = self._shm.name
+        self.array = np.ndarray(self.shape, dtype=self.dtype,
+                                buffer=self._shm.buf)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release and unlink the shared memory block."""
+        if self._shm is None:
+            return
+        self.array = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+
+def _attach_worker(viewport, max_iter, options, shared):
+    """Pool initializer: remember what this worker renders and where to."""
+    _worker.clear()
+    _worker["viewport"] = viewport
+    _worker["max_iter"] = max_iter
+    _worker["options"] = options
+    _worker["shared"] = shared
+
+
+def _render_worker_tile(tile):
+    """Worker task: render one tile, into shared memory if there is one.
+
+    The shared block is attached for the duration of the task only, so no
+    handle outlives it.
+    """
+    rows, cols = tile
+    divtime = render_tile(_worker["viewport"], rows, cols,
+                          _worker["max_iter"], **_worker["options"])
+    if _worker["shared"] is None:
+        return rows, cols, divtime
+
+    name, shape, dtype = _worker["shared"]
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        out = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        out[rows, cols] = divtime
+        del out
+    finally:
+        shm.close()
+    return rows, cols, None
+
+
+def render_tiled(viewport, max_iter, processes=None,
+                 tile_size=DEFAULT_TILE_SIZE, out=None, cardioid=False,
+                 periodicity=False, fractal=None):
+    """
+    Compute the Mandelbrot set over a viewport on a pool of processes.
+
+    Args:
+        viewport (Viewport): Region and resolution to render.
+        max_iter (int): Maximum number of iterations to test for divergence
+        processes (int): Number of worker processes (default: CPU count).
+            With 1 the tiles are rendered in this process, without a pool.
+        tile_size (int): Edge length of a tile in pixels.
+        out (numpy.ndarray or SharedArray): Optional preallocated integer
+            output of the viewport's shape. Workers write a SharedArray in
+            place; any other array is filled tile by tile as results
+            arrive.
+        cardioid (bool): Skip the main cardioid and period-2 bulb; see
+            escape_time().
+        periodicity (bool): Retire periodic orbits early; see escape_time().
+        fractal (EscapeTimeFractal): Render this fractal from the families
+            module instead of the Mandelbrot set.
+
+    Returns:
+        MandelbrotImage: The escape times (``out``, or ``out.array`` for a
+        SharedArray) with the viewport and max_iter; identical to
+        ``render(viewport, max_iter)``, or to ``fractal.render()``.
+    """
+    processes = processes or multiprocessing.cpu_count()
+    shared = None
+    if isinstance(out, SharedArray):
+        shared = (out.name, out.shape, out.dtype)
+        out = out.array
+    elif out is None:
+        out = np.empty(viewport.shape, dtype=int)
+    if out.shape != viewport.shape:
+        raise ValueError(f"output shape {out.shape} does not match the "
+                         f"viewport shape {viewport.shape}")
+
+    options = {"cardioid": cardioid, "periodicity": periodicity,
+               "fractal": fractal}
+    work = tiles(viewport, tile_size)
+    if processes == 1:
+        for rows, cols in work:
+            out[rows, cols] = render_tile(viewport, rows, cols, max_iter,
+                                          **options)
+        return MandelbrotImage(out, viewport, max_iter)
+
+    # Leaving the block terminates the pool, so a failing tile (or Ctrl-C)
+    # is raised at once instead of after the remaining tiles.
+    with multiprocessing.Pool(processes, initializer=_attach_worker,
+                              initargs=(viewport, max_iter, options,
+                                        shared)) as pool:
+        for rows, cols, divtime in pool.imap_unordered(_render_worker_tile,
+                                                       work):
+            if divtime is not None:
+                out[rows, cols] = divtime
+    return MandelbrotImage(out, viewport, max_iter)
@@ -0,0 +1,211 @@
+"""
+Deep-zoom Mandelbrot tile pyramid with a persistent on-disk cache.
+
+This module provides pure computation functions; visualization is handled
+separately.
+
+Level 0 is a single square tile covering the root region; every level
+down splits each tile into four, so level L has 2**L x 2**L tiles of
+``tile_size`` x ``tile_size`` pixels. Tile ``(x, y)`` grows along the real
+axis with ``x`` and along the imaginary axis with ``y``, and like a
+Viewport its row 0 is the tile's lowest imaginary coordinate. Pixels sit
+at the centres of a regular grid, so neighbouring tiles abut without
+sharing pixels.
+
+Rendered tiles are stored as ``.npy`` files in a cache directory keyed by
+(level, x, y, max_iter) and evicted least-recently-used once the cache
+grows beyond ``max_bytes``. Use is tracked in memory and also stamped on
+the files' modification times, so the LRU order survives restarts and
+repeat sessions are served from disk.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from src.fractals.mandelbrot import render, Viewport, DEFAULT_BOUNDS
+from src.fractals.mandelbrot_streaming import divtime_dtype
+
+DEFAULT_PYRAMID_TILE_SIZE = 256
+DEFAULT_CACHE_BYTES = 1 << 30
+CONFIG_FILE = "pyramid.json"
+
+
+class TileCache:
+    """Size-bounded, least-recently-used store of tile arrays on disk.
+
+    Args:
+        directory: Cache directory (created if missing).
+        max_bytes: Largest total size of the cached files.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_CACHE_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # name -> size in bytes, least recently used first
+        files = sorted(self.directory.glob("*.npy"),
+                       key=lambda path: path.stat().st_mtime_ns)
+        self._sizes = OrderedDict((path.name, path.stat().st_size)
+                                  for path in files)
+
+    @property
+    def total_bytes(self):
+        """Combined size of the cached files."""
+        return sum(self._sizes.values())
+
+    def __len__(self):
+        return len(self._sizes)
+
+    def __contains__(self, name):
+        return name in self._sizes
+
+    def get(self, name):
+        """Return the array stored under ``name``, or None on a miss."""
+        if name not in self._sizes:
+            self.misses += 1
+            return None
+        path = self.directory / name
+        array = np.load(path)
+        os.utime(path)
+        self._sizes.move_to_end(name)
+        self.hits += 1
+        return array
+
+    def put(self, name, array):
+        """Store ``array`` under ``name`` and evict down to max_bytes."""
+        path = self.directory / name
+        partial = path.with_name(path.name + ".partial")
+        with open(partial, "wb") as handle:
+            np.save(handle, array)
+        os.replace(partial, path)
+        self._sizes[name] = path.stat().st_size
+        self._sizes.move_to_end(name)
+        self._evict()
+
+    def _evict(self):
+        # The newest entry is kept even if it alone exceeds max_bytes.
+        while self.total_bytes > self.max_bytes and len(self._sizes) > 1:
+            name, _ = self._sizes.popitem(last=False)
+            (self.directory / name).unlink(missing_ok=True)
+
+
+class TilePyramid:
+    """Mandelbrot tiles addressed by (level, x, y, max_iter), cached on disk.
+
+    Args:
+        cache_dir: Directory of the tile cache. A directory belongs to one
+            pyramid geometry; opening it with another raises ValueError.
+        tile_size: Tile edge length in pixels.
+        max_bytes: Size bound of the cache.
+        root_bounds: ``(x_min, x_max, y_min, y_max)`` of the level-0 tile;
+            must be square. Defaults to DEFAULT_BOUNDS.
+        fractal: Escape-time fractal from the families module to render
+            instead of the Mandelbrot set; part of the cache's identity.
+    """
+
+    def __init__(self, cache_dir, tile_size=DEFAULT_PYRAMID_TILE_SIZE,
+                 max_bytes=DEFAULT_CACHE_BYTES, root_bounds=DEFAULT_BOUNDS,
+                 fractal=None):
+        x_min, x_max, y_min, y_max = (float(b) for b in root_bounds)
+        if not np.isclose(x_max - x_min, y_max - y_min):
+            raise ValueError(f"root bounds {root_bounds} are not square")
+        self.tile_size = tile_size
+        self.root_bounds = (x_min, x_max, y_min, y_max)
+        self.fractal = fractal
+        self.cache = TileCache(cache_dir, max_bytes)
+        self._check_config()
+
+    def _check_config(self):
+        config = {"tile_size": self.tile_size,
+                  "root_bounds": list(self.root_bounds)}
+        if self.fractal is not None:
+            config["fractal"] = self.fractal.key
+        path = self.cache.directory / CONFIG_FILE
+        if path.exists():
+            existing = json.loads(path.read_text())
+            if existing != config:
+                raise ValueError(f"{self.cache.directory} caches a different "
+                                 f"pyramid ({existing})")
+        else:
+            path.write_text(json.dumps(config, indent=2))
+
+    def tile_viewport(self, level, x, y):
+        """
+        Viewport of one tile.
+
+        Args:
+            level (int): Zoom level, 0 for the root tile.
+            x (int): Column index, 0 to 2**level - 1 along the real axis.
+            y (int): Row index, 0 to 2**level - 1 along the imaginary axis.
+
+        Returns:
+            Viewport: The tile's region at ``tile_size`` x ``tile_size``.
+        """
+        count = 1 << level
+        if level < 0 or not (0 <= x < count and 0 <= y < count):
+            raise ValueError(f"no tile ({x}, {y}) at level {level}")
+        x_min, x_max, y_min, y_max = self.root_bounds
+        extent = (x_max - x_min) / count
+        pixel = extent / self.tile_size
+        left = x_min + x * extent
+        bottom = y_min + y * extent
+        return Viewport(left + pixel / 2, left + extent - pixel / 2,
+                        bottom + pixel / 2, bottom + extent - pixel / 2,
+                        self.tile_size, self.tile_size)
+
+    @staticmethod
+    def tile_name(level, x, y, max_iter):
+        """Cache key of a tile."""
+        return f"L{level}_X{x}_Y{y}_I{max_iter}.npy"
+
+    def get_tile(self, level, x, y, max_iter):
+        """
+        Escape times of one tile, rendered on first request.
+
+        Args:
+            level (int): Zoom level.
+            x (int): Column index.
+            y (int): Row index.
+            max_iter (int): Maximum number of iterations.
+
+        Returns:
+            numpy.ndarray: (tile_size, tile_size) escape times in the
+            smallest unsigned dtype that holds max_iter.
+        """
+        viewport = self.tile_viewport(level, x, y)
+        name = self.tile_name(level, x, y, max_iter)
+        tile = self.cache.get(name)
+        if tile is None:
+            if self.fractal is None:
+                image = render(viewport, max_iter)
+            else:
+                image = self.fractal.render(viewport, max_iter)
+            tile = image.divtime.astype(divtime_dtype(max_iter))
+            self.cache.put(name, tile)
+        return tile
+
+    def tiles_for_viewport(self, viewport, level):
+        """
+        Indices of the level's tiles that overlap a viewport.
+
+        Returns:
+            list: ``(x, y)`` pairs, row by row from the lowest y.
+        """
+        x_min, x_max, y_min, y_max = self.root_bounds
+        count = 1 << level
+        extent = (x_max - x_min) / count
+
+        def index_range(low, high, origin):
+            first = int(np.floor((low - origin) / extent))
+            last = int(np.ceil((high - origin) / extent)) - 1
+            return range(max(first, 0), min(max(last, first), count - 1) + 1)
+
+        return [(x, y)
+                for y in index_range(viewport.y_min, viewport.y_max, y_min)
+                for x in index_range(viewport.x_min, viewport.x_max, x_min)]
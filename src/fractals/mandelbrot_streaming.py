@@ -0,0 +1,157 @@
+"""
+Out-of-core Mandelbrot rendering to memory-mapped files.
+
+This module provides pure computation functions; visualization is handled
+separately.
+
+render_to_file() renders a viewport tile by tile straight into a ``.npy``
+file opened as a memory map, so peak memory is bounded by the tile size
+rather than the image size. Escape times are stored in the smallest
+unsigned integer type that holds ``max_iter``. Two files sit next to the
+output and make the render resumable::
+
+    <name>.json       viewport, max_iter, tile size and dtype
+    <name>.tiles.npy  one byte per tile, set once the tile is on disk
+
+A tile is only marked complete after its pixels have been flushed, so a
+render that is interrupted and restarted with the same arguments skips the
+finished tiles and redoes only the rest.
+"""
+
+import json
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+
+from src.fractals.mandelbrot import MandelbrotImage, Viewport
+from src.fractals.mandelbrot_parallel import (
+    tiles, render_tile, DEFAULT_TILE_SIZE,
+)
+
+
+def divtime_dtype(max_iter):
+    """Smallest unsigned integer dtype that holds every value 0..max_iter."""
+    return np.dtype(np.min_scalar_type(max_iter))
+
+
+def _sidecar_paths(path):
+    path = Path(path)
+    return (path.with_name(path.stem + ".json"),
+            path.with_name(path.stem + ".tiles.npy"))
+
+
+def _render_task(task):
+    """Worker task: one tile's escape times, already in the file dtype."""
+    index, viewport, rows, cols, max_iter, dtype = task
+    return index, render_tile(viewport, rows, cols, max_iter).astype(dtype)
+
+
+def _open_outputs(path, viewport, max_iter, tile_size, dtype, resume):
+    """Open (or create) the output and tile map; return both memmaps."""
+    metadata_path, tiles_path = _sidecar_paths(path)
+    metadata = {"viewport": viewport.to_dict(), "max_iter": max_iter,
+                "tile_size": tile_size, "dtype": dtype.str}
+    num_tiles = len(tiles(viewport, tile_size))
+
+    if resume and metadata_path.exists():
+        existing = json.loads(metadata_path.read_text())
+        if existing != metadata:
+            raise ValueError(
+                f"{path} holds a different render ({existing}); pass "
+                f"resume=False to overwrite it"
+            )
+        out = np.load(path, mmap_mode="r+")
+        done = np.load(tiles_path, mmap_mode="r+")
+        return out, done
+
+    # Write the metadata last: its presence means the files are complete.
+    metadata_path.unlink(missing_ok=True)
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype,
+                                    shape=viewport.shape)
+    done = np.lib.format.open_memmap(tiles_path, mode="w+", dtype=np.uint8,
+                                     shape=(num_tiles,))
+    out.flush()
+    done.flush()
+    metadata_path.write_text(json.dumps(metadata, indent=2))
+    return out, done
+
+
+def render_to_file(viewport, max_iter, path, tile_size=DEFAULT_TILE_SIZE,
+                   processes=1, resume=True):
+    """
+    Render a viewport tile by tile into a memory-mapped ``.npy`` file.
+
+    Args:
+        viewport (Viewport): Region and resolution to render.
+        max_iter (int): Maximum number of iterations to test for divergence
+        path (str or Path): Output ``.npy`` file.
+        tile_size (int): Edge length of a tile in pixels; bounds the
+            working memory (about 40 bytes per tile pixel).
+        processes (int): Worker processes; with 1 (the default) tiles are
+            rendered in this process.
+        resume (bool): Continue an interrupted render of the same viewport,
+            max_iter and tile size at ``path``, skipping finished tiles.
+            With False any existing render at ``path`` is overwritten.
+
+    Returns:
+        MandelbrotImage: Escape times as a read-only memmap of the file,
+        with the viewport and max_iter.
+
+    Raises:
+        ValueError: If ``resume`` is set and ``path`` holds a render with
+            different parameters.
+    """
+    dtype = divtime_dtype(max_iter)
+    out, done = _open_outputs(path, viewport, max_iter, tile_size, dtype,
+                              resume)
+    all_tiles = tiles(viewport, tile_size)
+    work = [(index, viewport, rows, cols, max_iter, dtype)
+            for index, (rows, cols) in enumerate(all_tiles)
+            if not done[index]]
+
+    def store(index, divtime):
+        out[all_tiles[index]] = divtime
+        out.flush()
+        done[index] = 1
+        done.flush()
+
+    if processes == 1:
+        for task in work:
+            store(*_render_task(task))
+    elif work:
+        pool = multiprocessing.Pool(processes)
+        try:
+            for result in pool.imap_unordered(_render_task, work):
+                store(*result)
+        finally:
+            pool.close()
+            pool.join()
+
+    del out, done
+    return load_render(path)
+
+
+def load_render(path):
+    """
+    Open a render written by render_to_file().
+
+    Args:
+        path (str or Path): The ``.npy`` output file.
+
+    Returns:
+        MandelbrotImage: Escape times as a read-only memmap, with the
+        viewport and max_iter.
+
+    Raises:
+        ValueError: If some tiles have not been rendered yet.
+    """
+    metadata_path, tiles_path = _sidecar_paths(path)
+    metadata = json.loads(metadata_path.read_text())
+    done = np.load(tiles_path)
+    if not done.all():
+        raise ValueError(f"{path} is incomplete: {int((done == 0).sum())} "
+                         f"of {done.size} tiles missing")
+    return MandelbrotImage(np.load(path, mmap_mode="r"),
+                           Viewport(**metadata["viewport"]),
+                           metadata["max_iter"])
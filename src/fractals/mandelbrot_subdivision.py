@@ -0,0 +1,120 @@
+"""
+Mariani-Silver subdivision rendering of the Mandelbrot set.
+
+This module provides pure computation functions; visualization is handled
+separately.
+
+Instead of iterating every pixel, each rectangle's border is evaluated
+first. If every border pixel has the same escape time the whole interior
+is filled with it; otherwise the rectangle is split into four along its
+middle row and column (the split lines become the children's borders)
+until it is at most ``min_size`` pixels across, where the remaining
+interior pixels are evaluated with the per-pixel escape_time() kernel.
+All rectangles of one subdivision level are evaluated in a single batched
+escape_time() call.
+
+The fill relies on the set (and each escape-time band) being connected,
+which holds for the true set but not always at pixel resolution: a
+filament or band narrower than a pixel that crosses no sampled border can
+be filled over. Views dominated by the set's interior, where most of the
+cost lies, are typically reproduced exactly while evaluating only a small
+fraction of the pixels.
+"""
+
+import numpy as np
+
+from src.fractals.mandelbrot import escape_time, MandelbrotImage
+
+DEFAULT_MIN_SIZE = 8
+
+_UNKNOWN = -1
+
+
+def _border(r0, r1, c0, c1, width):
+    """Flat indices of the border of the inclusive rectangle."""
+    cols = np.arange(c0, c1 + 1)
+    rows = np.arange(r0 + 1, r1)
+    return np.unique(np.concatenate([
+        r0 * width + cols, r1 * width + cols,
+        rows * width + c0, rows * width + c1,
+    ]))
+
+
+def _evaluate(flat_c, flat_divtime, indices, max_iter):
+    """Escape times for the not yet known pixels among ``indices``."""
+    indices = indices[flat_divtime[indices] == _UNKNOWN]
+    if indices.size:
+        flat_divtime[indices] = escape_time(flat_c[indices], max_iter)
+    return indices.size
+
+
+def subdivided_escape_time(c, max_iter, min_size=DEFAULT_MIN_SIZE):
+    """
+    Escape times of a 2D grid of points by Mariani-Silver subdivision.
+
+    Args:
+        c (array-like): Complex (h, w) grid of points, e.g. Viewport.grid().
+        max_iter (int): Maximum number of iterations to test for divergence
+        min_size (int): Rectangles at most this many pixels across are
+            evaluated pixel by pixel instead of being split further.
+
+    Returns:
+        tuple: ``(divtime, evaluated)`` where divtime is the integer (h, w)
+        escape-time array and evaluated is the number of pixels that were
+        actually iterated.
+    """
+    c = np.asarray(c, dtype=complex)
+    h, w = c.shape
+    divtime = np.full((h, w), _UNKNOWN, dtype=int)
+    flat_c = c.reshape(-1)
+    flat_divtime = divtime.reshape(-1)
+    evaluated = 0
+
+    rects = [(0, h - 1, 0, w - 1)]
+    while rects:
+        borders = [_border(*rect, w) for rect in rects]
+        evaluated += _evaluate(flat_c, flat_divtime,
+                               np.unique(np.concatenate(borders)), max_iter)
+
+        leaves = []
+        children = []
+        for (r0, r1, c0, c1), border in zip(rects, borders):
+            if r1 - r0 < 2 or c1 - c0 < 2:
+                continue  # no interior: the border is the whole rectangle
+            values = flat_divtime[border]
+            if np.all(values == values[0]):
+                divtime[r0 + 1:r1, c0 + 1:c1] = values[0]
+            elif r1 - r0 <= min_size or c1 - c0 <= min_size:
+                leaves.append((r0, r1, c0, c1))
+            else:
+                rm = (r0 + r1) // 2
+                cm = (c0 + c1) // 2
+                children += [(r0, rm, c0, cm), (r0, rm, cm, c1),
+                             (rm, r1, c0, cm), (rm, r1, cm, c1)]
+
+        if leaves:
+            interior = np.concatenate([
+                (np.arange(r0 + 1, r1)[:, None] * w
+                 + np.arange(c0 + 1, c1)[None, :]).reshape(-1)
+                for r0, r1, c0, c1 in leaves
+            ])
+            evaluated += _evaluate(flat_c, flat_divtime, interior, max_iter)
+        rects = children
+
+    return divtime, evaluated
+
+
+def render_subdivided(viewport, max_iter, min_size=DEFAULT_MIN_SIZE):
+    """
+    Compute the Mandelbrot set over a viewport by Mariani-Silver subdivision.
+
+    Args:
+        viewport (Viewport): Region and resolution to render.
+        max_iter (int): Maximum number of iterations to test for divergence
+        min_size (int): Smallest rectangle that is still subdivided.
+
+    Returns:
+        MandelbrotImage: The escape times with the viewport and max_iter.
+    """
+    divtime, _ = subdivided_escape_time(viewport.grid(), max_iter, min_size)
+    return MandelbrotImage(divtime, viewport, max_iter)
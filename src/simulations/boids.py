@@ -14,6 +14,25 @@ DEFAULT_SEPARATION_RADIUS = 25.0
 DEFAULT_ALIGNMENT_RADIUS = 50.0
 DEFAULT_COHESION_RADIUS = 50.0
 
+# Default force weights (matching examples/run_boids.py)
+DEFAULT_SEPARATION_WEIGHT = 1.5
+DEFAULT_ALIGNMENT_WEIGHT = 1.0
+DEFAULT_COHESION_WEIGHT = 1.0
+
+# Upper bound on the number of boid pairs held in memory at once by the
+# vectorized neighbour computations.
+PAIR_BLOCK_SIZE = 2 ** 21
+
+# Proximity colour classes and their RGB colours (see get_boid_color)
+COLOR_CROWDED = 0
+COLOR_ISOLATED = 1
+COLOR_COMFORTABLE = 2
+BOID_COLORS = (
+    (1.0, 0.0, 0.0),  # red: crowded
+    (1.0, 1.0, 0.0),  # yellow: isolated
+    (0.0, 1.0, 0.0),  # green: comfortable
+)
+
 
 class Boid:
     def __init__(self, position, velocity):
@@ -49,6 +68,23 @@ def limit_magnitude(v, max_magnitude):
     return v
 
 
+def normalize_rows(v):
+    """Vectorized normalize(): scale each row of an (N, 3) array to unit length.
+
+    Zero rows are returned unchanged, as in normalize().
+    """
+    norms = np.linalg.norm(v, axis=1, keepdims=True)
+    return np.divide(v, norms, out=np.array(v, dtype=np.result_type(v, norms)),
+                     where=norms != 0)
+
+
+def limit_magnitude_rows(v, max_magnitude):
+    """Vectorized limit_magnitude(): clamp each row of an (N, 3) array."""
+    mags = np.linalg.norm(v, axis=1, keepdims=True)
+    over = mags > max_magnitude
+    return np.where(over, v / np.where(over, mags, 1) * max_magnitude, v)
+
+
 def separation(boid, boids, radius,
                max_speed=DEFAULT_MAX_SPEED, max_force=DEFAULT_MAX_FORCE):
     steering = np.zeros(3)
@@ -139,14 +175,14 @@ def get_boid_color(boid, boids,
 
     # Red if too crowded
     if close_neighbors > 0:
-        return (1.0, 0.0, 0.0)
+        return BOID_COLORS[COLOR_CROWDED]
 
     # Yellow if isolated (no neighbors within cohesion radius)
     if nearby_neighbors == 0:
-        return (1.0, 1.0, 0.0)
+        return BOID_COLORS[COLOR_ISOLATED]
 
     # Green if comfortable spacing (neighbors present but not too close)
-    return (0.0, 1.0, 0.0)
+    return BOID_COLORS[COLOR_COMFORTABLE]
 
 
 def create_flock(num_boids, center, spawn_area_size=200):
@@ -176,3 +212,580 @@ def create_flock(num_boids, center, spawn_area_size=200):
         ])
         flock.append(Boid(position, velocity))
     return flock
+
+
+def _steer(desired_sum, counts, velocities, max_speed, max_force,
+           offset=None):
+    """Turn per-boid neighbour sums into Reynolds steering forces.
+
+    Mirrors the tail of separation()/alignment()/cohesion(): average the sum,
+    optionally subtract an offset (cohesion subtracts the boid's position),
+    steer towards it at max_speed and limit the result to max_force. Boids
+    with no neighbours get a zero force.
+    """
+    has_neighbours = counts > 0
+    desired = desired_sum / np.maximum(counts, 1)[:, None]
+    if offset is not None:
+        desired = desired - offset
+    steering = normalize_rows(desired) * max_speed - velocities
+    steering = limit_magnitude_rows(steering, max_force)
+    return np.where(has_neighbours[:, None], steering, 0.0)
+
+
+def _sum_rows(index, values, n):
+    """Sum rows of ``values`` (P, 3) into an (n, 3) float64 array by ``index``."""
+    return np.stack([
+        np.bincount(index, weights=values[:, k], minlength=n)
+        for k in range(3)
+    ], axis=1)
+
+
+def minimum_image(displacement, bounds):
+    """Map displacements to their shortest image in a periodic world.
+
+    In a toroidal world of size ``bounds`` (the wrapping done by
+    Boid.update()), a displacement and the same displacement shifted by any
+    multiple of the bounds describe the same pair of points. This returns
+    the shortest of them, so boids near opposite faces are seen as close.
+
+    Args:
+        displacement: (..., 3) array of displacements.
+        bounds: World size [width, height, depth].
+
+    Returns:
+        numpy.ndarray: Displacements with each component in
+        [-bounds / 2, bounds / 2].
+    """
+    bounds = np.asarray(bounds, dtype=np.asarray(displacement).dtype)
+    return displacement - bounds * np.round(displacement / bounds)
+
+
+def _same_bounds(a, b):
+    """True if two optional periodic bounds describe the same world."""
+    if a is None or b is None:
+        return a is None and b is None
+    return np.allclose(a, b)
+
+
+class BruteForceIndex:
+    """Neighbour index that compares every boid against every other boid.
+
+    Candidate pairs are found from blocks of the full pairwise distance
+    matrix, so a query costs O(N^2) distance computations. This is the
+    reference the faster indexes are checked against.
+
+    Args:
+        radius: Largest neighbour distance the index must report.
+        periodic_bounds: World size for periodic (toroidal) distances, or
+            None for plain Euclidean distances.
+    """
+
+    def __init__(self, radius=max(DEFAULT_ALIGNMENT_RADIUS,
+                                  DEFAULT_COHESION_RADIUS),
+                 periodic_bounds=None):
+        self.radius = radius
+        self.periodic_bounds = (None if periodic_bounds is None
+                                else np.asarray(periodic_bounds,
+                                                dtype=np.float64))
+        self._positions = np.zeros((0, 3), dtype=np.float32)
+
+    def rebuild(self, positions):
+        """Index a new snapshot of boid positions."""
+        self._positions = np.asarray(positions)
+
+    def candidate_pairs(self, block_size=PAIR_BLOCK_SIZE, queries=None):
+        """Yield ``(i, j)`` index arrays of boid pairs closer than ``radius``.
+
+        Pairs are ordered boids (both (i, j) and (j, i) appear); a boid is
+        never paired with itself. At most ``block_size`` distances are held
+        in memory at a time. ``queries`` restricts ``i`` to the given boid
+        indices (default: all boids).
+        """
+        positions = self._positions
+        n = len(positions)
+        if queries is None:
+            queries = np.arange(n)
+        rows = max(1, block_size // max(n, 1))
+        for start in range(0, len(queries), rows):
+            block = queries[start:start + rows]
+            diff = positions[block, None, :] - positions[None, :, :]
+            if self.periodic_bounds is not None:
+                diff = minimum_image(diff, self.periodic_bounds)
+            dist = np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+            near = dist <= self.radius
+            near[np.arange(len(block)), block] = False
+            i, j = np.nonzero(near)
+            yield block[i], j
+
+
+class SpatialGrid:
+    """Uniform-grid spatial hash over the simulation bounds.
+
+    The bounds are divided into cells at least ``cell_size`` wide along each
+    axis, so every neighbour closer than ``cell_size`` lies in the same or an
+    adjacent cell. Rebuilding is a stable sort of boids by cell id, and a
+    query only looks at the 27 surrounding cells; at a fixed boid density the
+    cost of a step grows linearly with flock size.
+
+    With ``periodic=True`` the grid wraps around, so cells on opposite faces
+    are adjacent and boids across the seam are reported as candidates.
+
+    Args:
+        bounds: World size [width, height, depth].
+        cell_size: Minimum cell edge; must be at least the largest radius
+            used in neighbour queries.
+        periodic: Treat the world as toroidal.
+    """
+
+    def __init__(self, bounds, cell_size=max(DEFAULT_ALIGNMENT_RADIUS,
+                                             DEFAULT_COHESION_RADIUS),
+                 periodic=False):
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+        self.radius = cell_size
+        self.periodic_bounds = self.bounds if periodic else None
+        self.dims = np.maximum((self.bounds // cell_size).astype(np.int64), 1)
+        self.cell_extent = self.bounds / self.dims
+        self.num_cells = int(np.prod(self.dims))
+        self.rebuild(np.zeros((0, 3), dtype=np.float32))
+
+    def cell_coords(self, positions):
+        """Return the (N, 3) integer cell coordinates of positions.
+
+        On a periodic grid positions are wrapped into the bounds first;
+        otherwise positions outside them fall into the edge cells.
+        """
+        positions = np.asarray(positions)
+        if self.periodic_bounds is not None:
+            positions = np.mod(positions, self.periodic_bounds)
+        coords = np.floor(positions / self.cell_extent)
+        return np.clip(coords, 0, self.dims - 1).astype(np.int64)
+
+    def rebuild(self, positions):
+        """Re-bin a new snapshot of boid positions."""
+        self._coords = self.cell_coords(positions)
+        cell_ids = np.ravel_multi_index(self._coords.T, self.dims)
+        # Stable, so boids within a cell stay in ascending index order.
+        self.order = np.argsort(cell_ids, kind='stable')
+        self.cell_count = np.bincount(cell_ids, minlength=self.num_cells)
+        self.cell_start = np.cumsum(self.cell_count) - self.cell_count
+
+    def _neighbour_cells(self, coords):
+        """Yield, per cell offset, the neighbour cell ids of ``coords``.
+
+        Cells that fall outside the grid are reported as -1. A periodic grid
+        wraps instead; along axes with fewer than three cells the offsets are
+        reduced so no cell is visited twice.
+        """
+        if self.periodic_bounds is None:
+            offsets = [(-1, 0, 1)] * 3
+        else:
+            offsets = [(0,) if d == 1 else (0, 1) if d == 2 else (-1, 0, 1)
+                       for d in self.dims]
+        for dx in offsets[0]:
+            for dy in offsets[1]:
+                for dz in offsets[2]:
+                    neighbour = coords + (dx, dy, dz)
+                    if self.periodic_bounds is not None:
+                        neighbour %= self.dims
+                    inside = np.all((neighbour >= 0)
+                                    & (neighbour < self.dims), axis=1)
+                    ids = np.full(len(coords), -1, dtype=np.int64)
+                    ids[inside] = np.ravel_multi_index(
+                        neighbour[inside].T, self.dims)
+                    yield ids
+
+    def neighbours(self, point):
+        """Return indices of boids in the cells around ``point``.
+
+        The result is a superset of the boids within ``radius`` of the point
+        and can be used to narrow the ``boids`` list passed to the per-boid
+        functions (separation(), get_boid_color(), ...).
+        """
+        coords = self.cell_coords(np.reshape(point, (1, 3)))
+        found = []
+        for ids in self._neighbour_cells(coords):
+            if ids[0] >= 0:
+                start = self.cell_start[ids[0]]
+                found.append(self.order[start:start + self.cell_count[ids[0]]])
+        return np.concatenate(found)
+
+    def candidate_pairs(self, block_size=PAIR_BLOCK_SIZE, queries=None):
+        """Yield ``(i, j)`` index arrays of boids in neighbouring cells.
+
+        Every ordered pair of distinct boids closer than ``radius`` appears
+        exactly once; pairs further apart may also appear. Query boids are
+        split into blocks of about ``block_size`` candidate pairs.
+        ``queries`` restricts ``i`` to the given boid indices (default: all
+        boids).
+
+        For each query boid the neighbours are listed cell by cell in a
+        fixed offset order, and in ascending index order within a cell, so
+        the sequence of ``j`` for a boid depends only on the grid contents
+        and not on the blocking or on ``queries``.
+        """
+        if queries is None:
+            queries = np.arange(len(self.order))
+        n = len(queries)
+        if n == 0:
+            return
+        neighbour_ids = list(self._neighbour_cells(self._coords[queries]))
+        per_query = sum(
+            np.where(ids >= 0, self.cell_count[np.maximum(ids, 0)], 0)
+            for ids in neighbour_ids
+        )
+        block_ends = np.searchsorted(
+            np.cumsum(per_query),
+            np.arange(block_size, per_query.sum() + block_size, block_size),
+            side='right',
+        )
+        start = 0
+        for stop in np.unique(np.clip(block_ends, 1, n)):
+            block = queries[start:stop]
+            i_parts, j_parts = [], []
+            for ids in neighbour_ids:
+                ids = ids[start:stop]
+                valid = ids >= 0
+                counts = np.where(valid, self.cell_count[np.maximum(ids, 0)], 0)
+                total = counts.sum()
+                first = np.repeat(self.cell_start[np.maximum(ids, 0)], counts)
+                rank = np.arange(total) - np.repeat(np.cumsum(counts) - counts,
+                                                    counts)
+                i_parts.append(np.repeat(block, counts))
+                j_parts.append(self.order[first + rank])
+            i = np.concatenate(i_parts)
+            j = np.concatenate(j_parts)
+            distinct = i != j
+            yield i[distinct], j[distinct]
+            start = stop
+
+
+def flock_neighbour_pass(positions, velocities,
+                         separation_radius=DEFAULT_SEPARATION_RADIUS,
+                         alignment_radius=DEFAULT_ALIGNMENT_RADIUS,
+                         cohesion_radius=DEFAULT_COHESION_RADIUS,
+                         max_speed=DEFAULT_MAX_SPEED,
+                         max_force=DEFAULT_MAX_FORCE, index=None,
+                         periodic_bounds=None, queries=None):
+    """Fused neighbour pass: all steering forces and colour classes at once.
+
+    Visits each candidate neighbour pair once, computes its distance once and
+    accumulates the separation, alignment and cohesion sums together with the
+    crowded/nearby counts used by get_boid_color(). The result is the
+    vectorized equivalent of calling separation(), alignment(), cohesion()
+    and get_boid_color() for every boid against the same snapshot.
+
+    Args:
+        positions: (N, 3) array of boid positions.
+        velocities: (N, 3) array of boid velocities.
+        separation_radius: Neighbour radius for separation; half of it is
+            the crowded threshold for colouring.
+        alignment_radius: Neighbour radius for alignment.
+        cohesion_radius: Neighbour radius for cohesion and for the isolated
+            threshold for colouring.
+        max_speed: Desired speed of the steering target.
+        max_force: Maximum magnitude of each steering force.
+        index: Neighbour index (BruteForceIndex or SpatialGrid). It is
+            rebuilt from ``positions`` before use. Defaults to brute force.
+        periodic_bounds: World size for a toroidal world. Displacements then
+            use the minimum image, so boids see neighbours across the
+            wrapped faces. The index must be built for the same bounds.
+        queries: Indices of the boids to compute results for (default: all).
+            Every boid is still available as a neighbour. Results then have
+            one row per query, in ``queries`` order.
+
+    Returns:
+        tuple: (separation, alignment, cohesion, colors) where the forces are
+        float64 arrays of shape (N, 3) and ``colors`` is an (N,) int8 array of
+        COLOR_CROWDED / COLOR_ISOLATED / COLOR_COMFORTABLE classes; use
+        ``BOID_COLORS`` to map a class to RGB.
+    """
+    positions = np.asarray(positions, dtype=np.float32)
+    velocities64 = np.asarray(velocities, dtype=np.float64)
+    n = len(positions)
+    largest_radius = max(separation_radius, alignment_radius, cohesion_radius)
+    if index is None:
+        index = BruteForceIndex(largest_radius, periodic_bounds)
+    elif index.radius < largest_radius:
+        raise ValueError(
+            f"index radius {index.radius} is smaller than the largest "
+            f"neighbour radius {largest_radius}"
+        )
+    if not _same_bounds(index.periodic_bounds, periodic_bounds):
+        raise ValueError(
+            f"index periodic bounds {index.periodic_bounds} do not match "
+            f"periodic_bounds {periodic_bounds}"
+        )
+    index.rebuild(positions)
+    crowded_threshold = separation_radius / 2
+
+    separation_sum = np.zeros((n, 3))
+    alignment_sum = np.zeros((n, 3))
+    cohesion_sum = np.zeros((n, 3))
+    separation_count = np.zeros(n)
+    alignment_count = np.zeros(n)
+    cohesion_count = np.zeros(n)
+    crowded_count = np.zeros(n)
+    nearby_count = np.zeros(n)
+
+    for i, j in index.candidate_pairs(queries=queries):
+        diff = positions[i] - positions[j]
+        if periodic_bounds is not None:
+            diff = minimum_image(diff, periodic_bounds)
+        dist = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        nonzero = dist > 0
+
+        close = nonzero & (dist < separation_radius)
+        separation_sum += _sum_rows(i[close],
+                                    diff[close] / dist[close, None], n)
+        separation_count += np.bincount(i[close], minlength=n)
+
+        aligned = nonzero & (dist < alignment_radius)
+        alignment_sum += _sum_rows(i[aligned], velocities64[j[aligned]], n)
+        alignment_count += np.bincount(i[aligned], minlength=n)
+
+        cohesive = nonzero & (dist < cohesion_radius)
+        if periodic_bounds is None:
+            neighbour_positions = positions[j[cohesive]]
+        else:
+            # The image of boid j nearest to boid i
+            neighbour_positions = positions[i[cohesive]] - diff[cohesive]
+        cohesion_sum += _sum_rows(i[cohesive], neighbour_positions, n)
+        cohesion_count += np.bincount(i[cohesive], minlength=n)
+
+        # Colour counts include coincident boids, like get_boid_color().
+        crowded_count += np.bincount(i[dist < crowded_threshold], minlength=n)
+        nearby_count += np.bincount(i[dist < cohesion_radius], minlength=n)
+
+    if queries is not None:
+        positions = positions[queries]
+        velocities64 = velocities64[queries]
+        separation_sum, separation_count = (separation_sum[queries],
+                                            separation_count[queries])
+        alignment_sum, alignment_count = (alignment_sum[queries],
+                                          alignment_count[queries])
+        cohesion_sum, cohesion_count = (cohesion_sum[queries],
+                                        cohesion_count[queries])
+        crowded_count = crowded_count[queries]
+        nearby_count = nearby_count[queries]
+
+    colors = np.full(len(positions), COLOR_COMFORTABLE, dtype=np.int8)
+    colors[nearby_count == 0] = COLOR_ISOLATED
+    colors[crowded_count > 0] = COLOR_CROWDED
+
+    positions64 = positions.astype(np.float64)
+    return (
+        _steer(separation_sum, separation_count, velocities64,
+               max_speed, max_force),
+        _steer(alignment_sum, alignment_count, velocities64,
+               max_speed, max_force),
+        _steer(cohesion_sum, cohesion_count, velocities64,
+               max_speed, max_force, offset=positions64),
+        colors,
+    )
+
+
+def flock_steering(positions, velocities,
+                   separation_radius=DEFAULT_SEPARATION_RADIUS,
+                   alignment_radius=DEFAULT_ALIGNMENT_RADIUS,
+                   cohesion_radius=DEFAULT_COHESION_RADIUS,
+                   max_speed=DEFAULT_MAX_SPEED, max_force=DEFAULT_MAX_FORCE,
+                   index=None, periodic_bounds=None):
+    """Compute separation, alignment and cohesion for a whole flock at once.
+
+    Same as flock_neighbour_pass() without the colour classes.
+
+    Returns:
+        tuple: (separation, alignment, cohesion) float64 arrays of shape (N, 3).
+    """
+    return flock_neighbour_pass(
+        positions, velocities, separation_radius, alignment_radius,
+        cohesion_radius, max_speed, max_force, index=index,
+        periodic_bounds=periodic_bounds,
+    )[:3]
+
+
+class Flock:
+    """Array-backed flock: the state of N boids in contiguous (N, 3) arrays.
+
+    Row ``i`` of ``positions``, ``velocities`` and ``accelerations`` is boid
+    ``i``. Unlike a list of Boid objects, the whole flock is advanced with
+    array operations, and every steering force in a step is computed from the
+    same snapshot before any boid moves.
+
+    Args:
+        positions: (N, 3) array-like of boid positions.
+        velocities: (N, 3) array-like of boid velocities.
+        index: Neighbour index used for steering (BruteForceIndex or
+            SpatialGrid); rebuilt every step. Defaults to brute force.
+        periodic: Use minimum-image distances across the wrapped bounds, so
+            the flock holds together at the seams. A SpatialGrid index must
+            then be created with ``periodic=True``.
+    """
+
+    def __init__(self, positions, velocities, index=None, periodic=False):
+        self.positions = np.array(positions, dtype=np.float32).reshape(-1, 3)
+        self.velocities = np.array(velocities, dtype=np.float32).reshape(-1, 3)
+        if self.positions.shape != self.velocities.shape:
+            raise ValueError(
+                f"positions {self.positions.shape} and velocities "
+                f"{self.velocities.shape} must have the same shape"
+            )
+        self.accelerations = np.zeros_like(self.positions)
+        self.index = index
+        self.periodic = periodic
+
+    def __len__(self):
+        return len(self.positions)
+
+    @classmethod
+    def from_boids(cls, boids):
+        """Build a Flock from a list of Boid instances."""
+        flock = cls([b.position for b in boids], [b.velocity for b in boids])
+        flock.accelerations[:] = [b.acceleration for b in boids]
+        return flock
+
+    def to_boids(self):
+        """Return the flock as a list of Boid instances (copies of the rows)."""
+        boids = []
+        for position, velocity, acceleration in zip(
+                self.positions, self.velocities, self.accelerations):
+            boid = Boid(position, velocity)
+            boid.acceleration = acceleration.copy()
+            boids.append(boid)
+        return boids
+
+    def steering_forces(self, separation_radius=DEFAULT_SEPARATION_RADIUS,
+                        alignment_radius=DEFAULT_ALIGNMENT_RADIUS,
+                        cohesion_radius=DEFAULT_COHESION_RADIUS,
+                        max_speed=DEFAULT_MAX_SPEED,
+                        max_force=DEFAULT_MAX_FORCE, bounds=None):
+        """Return (separation, alignment, cohesion) forces for every boid.
+
+        ``bounds`` is required for a periodic flock.
+        """
+        return flock_steering(
+            self.positions, self.velocities,
+            separation_radius, alignment_radius, cohesion_radius,
+            max_speed, max_force, index=self.index,
+            periodic_bounds=self._periodic_bounds(bounds),
+        )
+
+    def _periodic_bounds(self, bounds):
+        """Bounds to use for minimum-image distances, or None."""
+        if not self.periodic:
+            return None
+        if bounds is None:
+            raise ValueError("bounds are required for a periodic flock")
+        return np.asarray(bounds, dtype=np.float64)
+
+    def update(self, bounds, max_speed=DEFAULT_MAX_SPEED):
+        """Integrate one step for every boid; vectorized Boid.update()."""
+        self.velocities += self.accelerations
+        self.velocities[:] = limit_magnitude_rows(self.velocities, max_speed)
+        self.positions += self.velocities
+        self.positions[:] = np.mod(self.positions,
+                                   np.asarray(bounds, dtype=np.float32))
+        self.accelerations[:] = 0
+
+    def step(self, bounds,
+             separation_weight=DEFAULT_SEPARATION_WEIGHT,
+             alignment_weight=DEFAULT_ALIGNMENT_WEIGHT,
+             cohesion_weight=DEFAULT_COHESION_WEIGHT,
+             separation_radius=DEFAULT_SEPARATION_RADIUS,
+             alignment_radius=DEFAULT_ALIGNMENT_RADIUS,
+             cohesion_radius=DEFAULT_COHESION_RADIUS,
+             max_speed=DEFAULT_MAX_SPEED, max_force=DEFAULT_MAX_FORCE):
+        """Advance the whole flock by one simulation step.
+
+        Computes the three steering forces for all boids, adds them to the
+        accelerations with the given weights and integrates.
+
+        Args:
+            bounds: World size [width, height, depth]; positions wrap at it.
+            separation_weight: Weight applied to the separation force.
+            alignment_weight: Weight applied to the alignment force.
+            cohesion_weight: Weight applied to the cohesion force.
+            separation_radius: Neighbour radius for separation.
+            alignment_radius: Neighbour radius for alignment.
+            cohesion_radius: Neighbour radius for cohesion.
+            max_speed: Maximum boid speed.
+            max_force: Maximum magnitude of each steering force.
+
+        Returns:
+            numpy.ndarray: (N,) colour classes of the flock at the start of
+            the step, computed in the same neighbour pass as the forces.
+        """
+        sep, ali, coh, colors = flock_neighbour_pass(
+            self.positions, self.velocities,
+            separation_radius, alignment_radius, cohesion_radius,
+            max_speed, max_force, index=self.index,
+            periodic_bounds=self._periodic_bounds(bounds),
+        )
+        self.accelerations += sep * separation_weight
+        self.accelerations += ali * alignment_weight
+        self.accelerations += coh * cohesion_weight
+        self.update(bounds, max_speed)
+        return colors
+
+
+SPAWN_SHAPES = ("cube", "sphere", "clusters")
+
+
+def spawn_flock(num_boids, center, spawn_area_size=200, shape="cube",
+                seed=None, num_clusters=4, cluster_radius=None,
+                index=None, periodic=False):
+    """Create an array-backed Flock from bulk random draws.
+
+    Vectorized, reproducible counterpart of create_flock(): all positions
+    and velocities come from a few array draws of a numpy.random.Generator,
+    with no per-boid objects.
+
+    Args:
+        num_boids: Number of boids to create.
+        center: 3D center point as array-like [x, y, z].
+        spawn_area_size: Edge of the spawn cube, or diameter of the sphere.
+            For "clusters", cluster centres are drawn in this cube.
+        shape: "cube" (uniform in a cube, like create_flock()), "sphere"
+            (uniform in a ball) or "clusters" (uniform balls around
+            ``num_clusters`` random cluster centres).
+        seed: Seed or numpy.random.Generator; the same seed always gives
+            the same flock.
+        num_clusters: Number of clusters for the "clusters" shape.
+        cluster_radius: Radius of each cluster (default: a quarter of
+            spawn_area_size).
+        index: Neighbour index for the Flock.
+        periodic: Periodic flag for the Flock.
+
+    Returns:
+        Flock: Boids with velocities uniform in [-1, 1) per component.
+    """
+    rng = np.random.default_rng(seed)
+    center = np.asarray(center, dtype=np.float64)
+    half = spawn_area_size / 2
+
+    if shape == "cube":
+        positions = center + rng.uniform(-half, half, (num_boids, 3))
+    elif shape == "sphere":
+        positions = center + _uniform_ball(rng, num_boids, half)
+    elif shape == "clusters":
+        if cluster_radius is None:
+            cluster_radius = spawn_area_size / 4
+        centers = center + rng.uniform(-half, half, (num_clusters, 3))
+        membership = rng.integers(0, num_clusters, num_boids)
+        positions = (centers[membership]
+                     + _uniform_ball(rng, num_boids, cluster_radius))
+    else:
+        raise ValueError(
+            f"unknown spawn shape {shape!r}; expected one of {SPAWN_SHAPES}"
+        )
+
+    velocities = rng.uniform(-1, 1, (num_boids, 3))
+    return Flock(positions, velocities, index=index, periodic=periodic)
+
+
+def _uniform_ball(rng, count, radius):
+    """Draw ``count`` points uniformly inside a ball around the origin."""
+    directions = rng.standard_normal((count, 3))
+    directions = normalize_rows(directions)
+    radii = radius * np.cbrt(rng.random(count))
+    return directions * radii[:, None]
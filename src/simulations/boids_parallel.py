@@ -0,0 +1,236 @@
+"""
+Multi-core boids stepping by spatial domain decomposition.
+
+Pure computation module - no visualization.
+
+The world is cut along x into slabs of whole SpatialGrid cells. Boid state
+lives in ``multiprocessing.shared_memory`` arrays; each worker reads the
+boids of its slab plus a one-cell halo on either side straight from shared
+memory, computes the steering forces and colour classes of the boids it
+owns, and writes them into a shared output array. The main process then
+integrates the whole flock.
+
+Within a slab the worker uses a SpatialGrid with the same cell geometry as
+the serial grid, and the halo makes every owned boid's 27 neighbour cells
+complete, so each boid sees the same neighbours in the same order as in
+the serial step. The result is therefore bit-identical to
+``Flock.step()`` with ``SpatialGrid(bounds, cell_size, periodic)`` as its
+index, independent of the number of processes.
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.simulations.boids import (
+    SpatialGrid, flock_neighbour_pass,
+    DEFAULT_MAX_SPEED, DEFAULT_MAX_FORCE,
+    DEFAULT_SEPARATION_RADIUS, DEFAULT_ALIGNMENT_RADIUS,
+    DEFAULT_COHESION_RADIUS, DEFAULT_SEPARATION_WEIGHT,
+    DEFAULT_ALIGNMENT_WEIGHT, DEFAULT_COHESION_WEIGHT,
+)
+
+# Slabs created per worker process; more slabs than workers lets the pool
+# balance uneven slabs dynamically.
+DEFAULT_SLABS_PER_PROCESS = 4
+
+# Per-process view of the shared arrays, set up by _attach_worker()
+_worker = {}
+
+
+def _shared_array(shape, dtype):
+    """Allocate a zeroed numpy array backed by a new shared memory block."""
+    size = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    array[...] = 0
+    return shm, array
+
+
+def _attach_worker(layout, bounds, cell_size, periodic):
+    """Pool initializer: map the shared arrays into this worker."""
+    _worker.clear()
+    for key, (name, shape, dtype) in layout.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _worker[key + "_shm"] = shm
+        _worker[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _worker["grid"] = SpatialGrid(bounds, cell_size, periodic=periodic)
+
+
+def _slab_members(column, lo, hi, dims_x, periodic):
+    """Return masks of boids owned by slab [lo, hi) and of slab plus halo."""
+    owned = (column >= lo) & (column < hi)
+    if periodic:
+        halo = {(lo - 1) % dims_x, hi % dims_x}
+    else:
+        halo = {c for c in (lo - 1, hi) if 0 <= c < dims_x}
+    local = owned | np.isin(column, list(halo))
+    return owned, local
+
+
+def _step_slab(task):
+    """Worker task: forces and colours for the boids of one slab."""
+    lo, hi, radii, max_speed, max_force = task
+    grid = _worker["grid"]
+    positions = _worker["positions"]
+    owned, local = _slab_members(_worker["columns"], lo, hi, grid.dims[0],
+                                 grid.periodic_bounds is not None)
+
+    # Ascending global order keeps each cell's boids in the serial order.
+    local_ids = np.nonzero(local)[0]
+    owned_ids = np.nonzero(owned)[0]
+    sep, ali, coh, colors = flock_neighbour_pass(
+        positions[local_ids], _worker["velocities"][local_ids],
+        *radii, max_speed, max_force,
+        index=grid, periodic_bounds=grid.periodic_bounds,
+        queries=np.nonzero(owned[local_ids])[0],
+    )
+    _worker["forces"][0, owned_ids] = sep
+    _worker["forces"][1, owned_ids] = ali
+    _worker["forces"][2, owned_ids] = coh
+    _worker["colors"][owned_ids] = colors
+
+
+class ParallelFlockStepper:
+    """Steps a Flock on a pool of worker processes, one slab per task.
+
+    On construction the flock's positions and velocities are moved into
+    shared memory and the Flock's arrays are replaced with views of it, so
+    ``flock.step()``-style code keeps working on the same object. Call
+    close() (or use the stepper as a context manager) to copy the state back
+    into ordinary arrays and release the pool and shared memory.
+
+    Args:
+        flock: Flock to advance. Its ``periodic`` flag is honoured; its
+            ``index`` is ignored in favour of the slab grids.
+        bounds: World size [width, height, depth].
+        processes: Number of worker processes (default: CPU count).
+        cell_size: Grid cell size; must be at least the largest radius.
+        slabs_per_process: Number of slabs per worker for load balancing.
+    """
+
+    def __init__(self, flock, bounds, processes=None,
+                 cell_size=max(DEFAULT_ALIGNMENT_RADIUS,
+                               DEFAULT_COHESION_RADIUS),
+                 slabs_per_process=DEFAULT_SLABS_PER_PROCESS):
+        self.flock = flock
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+        self.grid = SpatialGrid(self.bounds, cell_size,
+                                periodic=flock.periodic)
+        self.processes = processes or multiprocessing.cpu_count()
+        self.num_slabs = max(1, min(int(self.grid.dims[0]),
+                                    self.processes * slabs_per_process))
+
+        n = len(flock)
+        self._shm = {}
+        layout = {}
+        for key, shape, dtype in (("positions", (n, 3), np.float32),
+                                  ("velocities", (n, 3), np.float32),
+                                  ("forces", (3, n, 3), np.float64),
+                                  ("colors", (n,), np.int8),
+                                  ("columns", (n,), np.int64)):
+            shm, array = _shared_array(shape, dtype)
+            self._shm[key] = shm
+            setattr(self, "_" + key, array)
+            layout[key] = (shm.name, shape, dtype)
+
+        self._positions[:] = flock.positions
+        self._velocities[:] = flock.velocities
+        flock.positions = self._positions
+        flock.velocities = self._velocities
+
+        self._pool = multiprocessing.Pool(
+            self.processes, initializer=_attach_worker,
+            initargs=(layout, self.bounds, cell_size, flock.periodic),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def slabs(self):
+        """Split the grid's x columns into slabs holding similar boid counts.
+
+        Also publishes every boid's column to the workers, so it must be
+        called after the positions change and before the slabs are stepped.
+
+        Returns:
+            list: ``(lo, hi)`` column ranges covering every column once.
+        """
+        dims_x = int(self.grid.dims[0])
+        self._columns[:] = self.grid.cell_coords(self._positions)[:, 0]
+        cumulative = np.cumsum(np.bincount(self._columns, minlength=dims_x))
+        targets = cumulative[-1] * np.arange(1, self.num_slabs) / self.num_slabs
+        cuts = np.searchsorted(cumulative, targets, side='right') + 1
+        edges = np.unique(np.concatenate([[0], np.clip(cuts, 1, dims_x),
+                                          [dims_x]]))
+        return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+    def steering_forces(self, separation_radius=DEFAULT_SEPARATION_RADIUS,
+                        alignment_radius=DEFAULT_ALIGNMENT_RADIUS,
+                        cohesion_radius=DEFAULT_COHESION_RADIUS,
+                        max_speed=DEFAULT_MAX_SPEED,
+                        max_force=DEFAULT_MAX_FORCE):
+        """Compute forces and colours for every boid on the worker pool.
+
+        Returns:
+            tuple: (separation, alignment, cohesion, colors) as returned by
+            flock_neighbour_pass(); the arrays are views of shared memory
+            that the next call overwrites.
+        """
+        radii = (separation_radius, alignment_radius, cohesion_radius)
+        largest_radius = max(radii)
+        if self.grid.radius < largest_radius:
+            raise ValueError(
+                f"grid cell size {self.grid.radius} is smaller than the "
+                f"largest neighbour radius {largest_radius}"
+            )
+        tasks = [(lo, hi, radii, max_speed, max_force)
+                 for lo, hi in self.slabs()]
+        for _ in self._pool.imap_unordered(_step_slab, tasks):
+            pass
+        return (self._forces[0], self._forces[1], self._forces[2],
+                self._colors)
+
+    def step(self, separation_weight=DEFAULT_SEPARATION_WEIGHT,
+             alignment_weight=DEFAULT_ALIGNMENT_WEIGHT,
+             cohesion_weight=DEFAULT_COHESION_WEIGHT,
+             separation_radius=DEFAULT_SEPARATION_RADIUS,
+             alignment_radius=DEFAULT_ALIGNMENT_RADIUS,
+             cohesion_radius=DEFAULT_COHESION_RADIUS,
+             max_speed=DEFAULT_MAX_SPEED, max_force=DEFAULT_MAX_FORCE):
+        """Advance the flock by one step; parallel equivalent of Flock.step().
+
+        Returns:
+            numpy.ndarray: (N,) colour classes of the flock at the start of
+            the step.
+        """
+        sep, ali, coh, colors = self.steering_forces(
+            separation_radius, alignment_radius, cohesion_radius,
+            max_speed, max_force,
+        )
+        flock = self.flock
+        flock.accelerations += sep * separation_weight
+        flock.accelerations += ali * alignment_weight
+        flock.accelerations += coh * cohesion_weight
+        flock.update(self.bounds, max_speed)
+        return colors.copy()
+
+    def close(self):
+        """Stop the workers and move the flock back to ordinary memory."""
+        if self._pool is None:
+            return
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
+        self.flock.positions = self._positions.copy()
+        self.flock.velocities = self._velocities.copy()
+        for key in self._shm:
+            setattr(self, "_" + key, None)
+        for shm in self._shm.values():
+            shm.close()
+            shm.unlink()
+        self._shm = {}
@@ -0,0 +1,216 @@
+"""
+Headless boids runs and binary trajectory recordings.
+
+Pure computation module - no visualization.
+
+A recording is a directory holding ``recording.json`` (metadata) and chunked
+``.npy`` files, one per field per chunk of frames::
+
+    positions_00000.npy   (chunk_frames, N, 3) float32
+    velocities_00000.npy  (chunk_frames, N, 3) float32
+    colors_00000.npy      (chunk_frames, N)    int8
+    steps_00000.npy       (chunk_frames,)      int64
+
+Chunks are written through memory maps and read back the same way, so
+neither recording nor replay needs the whole run in memory.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_CHUNK_FRAMES = 256
+METADATA_FILE = "recording.json"
+
+# Recorded fields: name -> (per-boid shape, dtype)
+_FIELDS = {
+    "positions": ((3,), np.float32),
+    "velocities": ((3,), np.float32),
+    "colors": ((), np.int8),
+}
+
+
+def _chunk_path(path, field, chunk):
+    return Path(path) / f"{field}_{chunk:05d}.npy"
+
+
+class BoidsRecorder:
+    """Streams flock snapshots into a chunked recording directory.
+
+    Args:
+        path: Output directory (created if missing).
+        num_boids: Number of boids in every frame.
+        stride: Simulation steps between recorded frames (metadata only).
+        chunk_frames: Frames per chunk file.
+        metadata: Extra JSON-serialisable values stored with the recording.
+    """
+
+    def __init__(self, path, num_boids, stride=1,
+                 chunk_frames=DEFAULT_CHUNK_FRAMES, metadata=None):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.num_boids = num_boids
+        self.stride = stride
+        self.chunk_frames = chunk_frames
+        self.metadata = dict(metadata or {})
+        self.num_frames = 0
+        self._chunk = {}
+        self._write_metadata()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write_metadata(self):
+        metadata = {
+            "num_boids": self.num_boids,
+            "num_frames": self.num_frames,
+            "stride": self.stride,
+            "chunk_frames": self.chunk_frames,
+            "metadata": self.metadata,
+        }
+        (self.path / METADATA_FILE).write_text(json.dumps(metadata, indent=2))
+
+    def _open_chunk(self, chunk):
+        self._chunk = {
+            field: np.lib.format.open_memmap(
+                _chunk_path(self.path, field, chunk), mode="w+",
+                dtype=dtype, shape=(self.chunk_frames, self.num_boids) + shape,
+            )
+            for field, (shape, dtype) in _FIELDS.items()
+        }
+        self._chunk["steps"] = np.lib.format.open_memmap(
+            _chunk_path(self.path, "steps", chunk), mode="w+",
+            dtype=np.int64, shape=(self.chunk_frames,),
+        )
+
+    def _flush_chunk(self):
+        for array in self._chunk.values():
+            array.flush()
+        self._chunk = {}
+        self._write_metadata()
+
+    def write(self, step, positions, velocities, colors):
+        """Append one frame: the flock state after ``step`` steps."""
+        chunk, row = divmod(self.num_frames, self.chunk_frames)
+        if row == 0:
+            self._open_chunk(chunk)
+        self._chunk["positions"][row] = positions
+        self._chunk["velocities"][row] = velocities
+        self._chunk["colors"][row] = colors
+        self._chunk["steps"][row] = step
+        self.num_frames += 1
+        if row == self.chunk_frames - 1:
+            self._flush_chunk()
+
+    def close(self):
+        """Flush the last (possibly partial) chunk and finalise metadata."""
+        if self._chunk:
+            self._flush_chunk()
+        self._write_metadata()
+
+
+class BoidsRecording:
+    """Read-only, memory-mapped view of a recording made by BoidsRecorder.
+
+    Frames are indexed from 0 to ``len(recording) - 1``; each frame is a
+    ``(step, positions, velocities, colors)`` tuple.
+
+    Args:
+        path: Recording directory.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        info = json.loads((self.path / METADATA_FILE).read_text())
+        self.num_boids = info["num_boids"]
+        self.num_frames = info["num_frames"]
+        self.stride = info["stride"]
+        self.chunk_frames = info["chunk_frames"]
+        self.metadata = info["metadata"]
+        self._cache = (None, None)
+
+    def __len__(self):
+        return self.num_frames
+
+    def _load_chunk(self, chunk):
+        if self._cache[0] != chunk:
+            self._cache = (chunk, {
+                field: np.load(_chunk_path(self.path, field, chunk),
+                               mmap_mode="r")
+                for field in ("steps",) + tuple(_FIELDS)
+            })
+        return self._cache[1]
+
+    def __getitem__(self, frame):
+        if frame < 0:
+            frame += self.num_frames
+        if not 0 <= frame < self.num_frames:
+            raise IndexError(f"frame {frame} out of range "
+                             f"(recording has {self.num_frames} frames)")
+        chunk, row = divmod(frame, self.chunk_frames)
+        arrays = self._load_chunk(chunk)
+        return (int(arrays["steps"][row]), arrays["positions"][row],
+                arrays["velocities"][row], arrays["colors"][row])
+
+    def __iter__(self):
+        for frame in range(self.num_frames):
+            yield self[frame]
+
+    @property
+    def steps(self):
+        """Simulation step of every recorded frame."""
+        num_chunks = -(-self.num_frames // self.chunk_frames)
+        steps = [np.load(_chunk_path(self.path, "steps", chunk))
+                 for chunk in range(num_chunks)]
+        return np.concatenate(steps or [np.zeros(0, dtype=np.int64)])[
+            :self.num_frames]
+
+
+def run_headless(flock, bounds, num_steps, recorder=None, stride=None,
+                 stepper=None, **step_kwargs):
+    """Advance a flock as fast as possible, optionally recording snapshots.
+
+    No rendering and no frame pacing: the loop only calls ``flock.step()``.
+    Every ``stride`` steps the state at the start of the step is recorded
+    together with the colour classes computed for it in the same pass.
+
+    Args:
+        flock: Flock to advance.
+        bounds: World size [width, height, depth].
+        num_steps: Number of steps to simulate.
+        recorder: Optional BoidsRecorder receiving the snapshots.
+        stride: Steps between recorded snapshots; defaults to the
+            recorder's stride, and must match it when both are given.
+        stepper: Optional ParallelFlockStepper driving ``flock``; its step()
+            is used instead of ``flock.step()``.
+        **step_kwargs: Passed to the step call (weights, radii, ...).
+
+    Returns:
+        int: Number of snapshots recorded.
+    """
+    if recorder is not None:
+        if stride is None:
+            stride = recorder.stride
+        elif stride != recorder.stride:
+            raise ValueError(
+                f"stride {stride} does not match the recorder's stride "
+                f"{recorder.stride}"
+            )
+    recorded = 0
+    for step in range(num_steps):
+        record = recorder is not None and step % stride == 0
+        if record:
+            positions = flock.positions.copy()
+            velocities = flock.velocities.copy()
+        if stepper is None:
+            colors = flock.step(bounds, **step_kwargs)
+        else:
+            colors = stepper.step(**step_kwargs)
+        if record:
+            recorder.write(step, positions, velocities, colors)
+            recorded += 1
+    return recorded
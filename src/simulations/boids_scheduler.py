@@ -0,0 +1,210 @@
+"""
+Fixed-timestep boids scheduling, decoupled from rendering.
+
+Pure computation module - no visualization.
+
+A FixedStepScheduler advances a Flock at a fixed number of steps per second
+on a background thread. Every completed step is published as an immutable
+FlockSnapshot; the two most recent snapshots form a front buffer that a
+renderer can read at any frame rate and interpolate between, while the
+simulation thread fills the next one. Forces within a step are always
+computed from a single snapshot of the flock (Flock.step() is synchronous),
+so frame rate and simulation rate are fully independent.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from src.simulations.boids import flock_neighbour_pass, minimum_image
+
+DEFAULT_STEPS_PER_SECOND = 60.0
+
+# Most steps run in one tick when the simulation falls behind; beyond this
+# the scheduler drops time instead of spiralling.
+DEFAULT_MAX_CATCH_UP = 5
+
+
+class FlockSnapshot:
+    """Immutable copy of the flock state after a completed step.
+
+    Attributes:
+        step: Number of steps completed.
+        time: Clock time at which the snapshot was published.
+        positions: (N, 3) float32 positions.
+        velocities: (N, 3) float32 velocities.
+        colors: (N,) colour classes from the neighbour pass of the step
+            that produced this state, i.e. of the state one step earlier
+            (the initial snapshot has the classes of the initial state).
+    """
+
+    def __init__(self, step, time, positions, velocities, colors):
+        self.step = step
+        self.time = time
+        self.positions = positions
+        self.velocities = velocities
+        self.colors = colors
+        for array in (positions, velocities, colors):
+            array.flags.writeable = False
+
+
+def interpolate_snapshots(previous, current, alpha, bounds=None):
+    """Blend two snapshots' positions and velocities.
+
+    Args:
+        previous: Earlier FlockSnapshot.
+        current: Later FlockSnapshot.
+        alpha: Blend factor; 0 gives ``previous``, 1 gives ``current``.
+        bounds: World size. When given, positions move along the minimum
+            image, so boids that wrapped at the bounds do not sweep across
+            the whole world, and the result is wrapped back into the bounds.
+
+    Returns:
+        tuple: (positions, velocities, colors); colours are taken from the
+        nearer snapshot.
+    """
+    delta = current.positions - previous.positions
+    if bounds is not None:
+        delta = minimum_image(delta, bounds)
+    positions = previous.positions + np.float32(alpha) * delta
+    if bounds is not None:
+        positions = np.mod(positions, np.asarray(bounds, dtype=np.float32))
+    velocities = (previous.velocities
+                  + np.float32(alpha) * (current.velocities
+                                         - previous.velocities))
+    colors = current.colors if alpha >= 0.5 else previous.colors
+    return positions, velocities, colors
+
+
+class FixedStepScheduler:
+    """Runs a flock at a fixed timestep on a background thread.
+
+    Args:
+        flock: Flock to advance. Only the scheduler thread may touch it
+            while the scheduler is running.
+        bounds: World size [width, height, depth].
+        steps_per_second: Fixed simulation rate.
+        stepper: Optional ParallelFlockStepper driving ``flock``.
+        max_catch_up: Most steps run back to back when behind schedule.
+        clock: Monotonic time source in seconds.
+        **step_kwargs: Passed to the step call (weights, radii, ...).
+    """
+
+    def __init__(self, flock, bounds, steps_per_second=DEFAULT_STEPS_PER_SECOND,
+                 stepper=None, max_catch_up=DEFAULT_MAX_CATCH_UP,
+                 clock=time.perf_counter, **step_kwargs):
+        self.flock = flock
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+        self.dt = 1.0 / steps_per_second
+        self.stepper = stepper
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+        self.step_kwargs = step_kwargs
+        self.steps = 0
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._next_time = None
+
+        # Front buffer: the two most recent complete states.
+        *_, colors = flock_neighbour_pass(
+            flock.positions, flock.velocities, index=flock.index,
+            periodic_bounds=self.bounds if flock.periodic else None)
+        initial = self._snapshot(colors, clock())
+        self._previous = initial
+        self._current = initial
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _snapshot(self, colors, now):
+        return FlockSnapshot(self.steps, now, self.flock.positions.copy(),
+                             self.flock.velocities.copy(),
+                             np.array(colors, dtype=np.int8))
+
+    def _step(self):
+        if self.stepper is None:
+            colors = self.flock.step(self.bounds, **self.step_kwargs)
+        else:
+            colors = self.stepper.step(**self.step_kwargs)
+        self.steps += 1
+        return colors
+
+    def advance(self, num_steps=1):
+        """Run steps immediately and publish the result (no pacing)."""
+        for _ in range(num_steps):
+            colors = self._step()
+            self._publish(colors)
+
+    def _publish(self, colors):
+        snapshot = self._snapshot(colors, self.clock())
+        with self._lock:
+            self._previous, self._current = self._current, snapshot
+
+    def tick(self, now=None):
+        """Run every step that is due at ``now``; return how many ran."""
+        now = self.clock() if now is None else now
+        if self._next_time is None:
+            self._next_time = now
+        due = int((now - self._next_time) // self.dt) + 1
+        if due <= 0:
+            return 0
+        if due > self.max_catch_up:
+            # Too far behind: drop the backlog rather than spiral.
+            self._next_time = now - (self.max_catch_up - 1) * self.dt
+            due = self.max_catch_up
+        self.advance(due)
+        self._next_time += due * self.dt
+        return due
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.tick()
+            delay = self._next_time - self.clock()
+            if delay > 0:
+                self._stop.wait(delay)
+
+    def start(self):
+        """Start stepping on a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._next_time = None
+        self._thread = threading.Thread(target=self._run,
+                                        name="boids-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread after its current step."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def latest(self):
+        """Return the (previous, current) pair of complete snapshots."""
+        with self._lock:
+            return self._previous, self._current
+
+    def interpolated(self, now=None, wrap=True):
+        """Flock state for rendering at ``now``, between the last two steps.
+
+        The blend factor is the time since the newest snapshot was published
+        as a fraction of the timestep, clamped to [0, 1], so rendering runs
+        at most one step behind the simulation.
+
+        Returns:
+            tuple: (positions, velocities, colors) arrays owned by the caller.
+        """
+        previous, current = self.latest()
+        now = self.clock() if now is None else now
+        alpha = min(max((now - current.time) / self.dt, 0.0), 1.0)
+        return interpolate_snapshots(previous, current, alpha,
+                                     self.bounds if wrap else None)
@@ -2,15 +2,183 @@
 Lorenz attractor computation.
 
 Pure computation module - no visualization.
+
+Fixed-step integration uses forward Euler (the original scheme) or
+classic fourth-order Runge-Kutta; solve_lorenz_adaptive() integrates with
+the adaptive Dormand-Prince 5(4) pair, whose step size follows the local
+error, and interpolates between its steps with the scheme's continuous
+extension (dense output).
+
+The fixed-step loops run in pure Python by default, or compiled with Numba
+when it is installed (see lorenz_numba); both give bit-identical results.
 """
 
 import numpy as np
 
+INTEGRATORS = ("euler", "rk4")
+BACKENDS = ("auto", "python", "numba")
+
+# Steps per chunk of iter_lorenz_chunks(): 65536 x 3 float64 = 1.5 MiB
+DEFAULT_CHUNK_SIZE = 65536
+
+# Dormand-Prince 5(4) tableau. The fifth-order weights are the last row of
+# A (first same as last); E is the difference to the embedded fourth-order
+# solution and D the coefficients of the dense-output polynomial.
+DOPRI_C = (0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0)
+DOPRI_A = (
+    (),
+    (1/5,),
+    (3/40, 9/40),
+    (44/45, -56/15, 32/9),
+    (19372/6561, -25360/2187, 64448/6561, -212/729),
+    (9017/3168, -355/33, 46732/5247, 49/176, -5103/18656),
+    (35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84),
+)
+DOPRI_E = (71/57600, 0.0, -71/16695, 71/1920, -17253/339200, 22/525,
+           -1/40)
+DOPRI_D = (-12715105075/11282082432, 0.0, 87487479700/32700410799,
+           -10690763975/1880347072, 701980252875/199316789632,
+           -1453857185/822651844, 69997945/29380423)
+
+
+def lorenz_derivative(state, sigma=10.0, rho=28.0, beta=8.0/3.0):
+    """
+    Time derivative of Lorenz states.
+
+    Args:
+        state: States of shape (..., 3)
+        sigma: Prandtl number, broadcastable to state[..., 0]
+        rho: Rayleigh number, broadcastable to state[..., 0]
+        beta: Geometric factor, broadcastable to state[..., 0]
+
+    Returns:
+        numpy.ndarray: d[x, y, z]/dt with the shape of state
+    """
+    state = np.asarray(state, dtype=float)
+    x, y, z = state[..., 0], state[..., 1], state[..., 2]
+    return np.stack([sigma * (y - x), x * (rho - z) - y, x * y - beta * z],
+                    axis=-1)
+
+
+def _euler_step(x, y, z, dt, sigma, rho, beta):
+    """One forward Euler step on components (floats or arrays)."""
+    # Lorenz equations
+    dx = sigma * (y - x) * dt
+    dy = (x * (rho - z) - y) * dt
+    dz = (x * y - beta * z) * dt
+    return x + dx, y + dy, z + dz
+
+
+def _rates(x, y, z, sigma, rho, beta):
+    """Lorenz equations on components (floats or arrays)."""
+    return sigma * (y - x), x * (rho - z) - y, x * y - beta * z
+
+
+def _rk4_step(x, y, z, dt, sigma, rho, beta):
+    """One classic Runge-Kutta step on components (floats or arrays)."""
+    half = 0.5 * dt
+    k1x, k1y, k1z = _rates(x, y, z, sigma, rho, beta)
+    k2x, k2y, k2z = _rates(x + half * k1x, y + half * k1y, z + half * k1z,
+                           sigma, rho, beta)
+    k3x, k3y, k3z = _rates(x + half * k2x, y + half * k2y, z + half * k2z,
+                           sigma, rho, beta)
+    k4x, k4y, k4z = _rates(x + dt * k3x, y + dt * k3y, z + dt * k3z,
+                           sigma, rho, beta)
+    sixth = dt / 6
+    return (x + sixth * (k1x + 2 * k2x + 2 * k3x + k4x),
+            y + sixth * (k1y + 2 * k2y + 2 * k3y + k4y),
+            z + sixth * (k1z + 2 * k2z + 2 * k3z + k4z))
+
+
+_STEPS = {"euler": _euler_step, "rk4": _rk4_step}
+
+
+def _check_method(method):
+    if method not in INTEGRATORS:
+        raise ValueError(f"unknown integrator {method!r}; expected one of "
+                         f"{INTEGRATORS}")
+
+
+_compiled = {}
+
+
+def _load_compiled():
+    """The lorenz_numba module, or None when Numba is not installed."""
+    if "module" not in _compiled:
+        try:
+            from src.simulations import lorenz_numba
+        except ImportError:
+            lorenz_numba = None
+        _compiled["module"] = lorenz_numba
+    return _compiled["module"]
+
+
+def numba_available():
+    """Whether the compiled backend can be used."""
+    return _load_compiled() is not None
+
+
+def _compiled_kernel(backend, method, ensemble):
+    """Compiled loop for the backend, or None to run in pure Python."""
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}; expected one of "
+                         f"{BACKENDS}")
+    if backend == "python":
+        return None
+    compiled = _load_compiled()
+    if compiled is None:
+        if backend == "numba":
+            raise ImportError("backend='numba' needs numba installed")
+        return None
+    return compiled.kernel(method, ensemble)
+
+
+def _prepare(initial_state, sigma, rho, beta):
+    """Split a (3,) or (M, 3) state into components and shape parameters.
+
+    A single state becomes Python floats, which step much faster than
+    three-element arrays; an ensemble becomes column arrays with the
+    parameters broadcast to one value per member.
+    """
+    initial_state = np.asarray(initial_state, dtype=float)
+    if initial_state.shape == (3,):
+        return (tuple(float(v) for v in initial_state),
+                (float(sigma), float(rho), float(beta)))
+    if initial_state.ndim != 2 or initial_state.shape[1] != 3:
+        raise ValueError(f"initial state must have shape (3,) or (M, 3), "
+                         f"got {initial_state.shape}")
+    num_members = initial_state.shape[0]
+    params = tuple(np.ascontiguousarray(np.broadcast_to(
+        np.asarray(p, dtype=float), (num_members,))) for p in (sigma, rho, beta))
+    return tuple(initial_state.T.copy()), params
+
+
+def _integrate_into(out, state, dt, params, method, backend):
+    """Fill ``out[k]`` with the state after k + 1 steps; return the last."""
+    kernel = _compiled_kernel(backend, method, out.ndim == 3)
+    if kernel is not None:
+        return kernel(out, *state, dt, *params)
+
+    step = _STEPS[method]
+    x, y, z = state
+    if out.ndim == 2:
+        for row in range(len(out)):
+            x, y, z = step(x, y, z, dt, *params)
+            out[row] = [x, y, z]
+    else:
+        for row in range(len(out)):
+            x, y, z = step(x, y, z, dt, *params)
+            out[row, :, 0] = x
+            out[row, :, 1] = y
+            out[row, :, 2] = z
+    return x, y, z
+
 
 def compute_lorenz_trajectory(initial_state, num_steps, dt,
-                              sigma=10.0, rho=28.0, beta=8.0/3.0):
+                              sigma=10.0, rho=28.0, beta=8.0/3.0,
+                              method="euler", backend="auto"):
     """
-    Compute Lorenz attractor trajectory using Euler integration.
+    Compute a Lorenz attractor trajectory with a fixed-step integrator.
 
     Args:
         initial_state: Initial [x, y, z] coordinates
@@ -19,26 +187,311 @@ def compute_lorenz_trajectory(initial_state, num_steps, dt,
         sigma: Prandtl number (default: 10.0)
         rho: Rayleigh number (default: 28.0)
         beta: Geometric factor (default: 8/3)
+        method: "euler" (default) or "rk4" for classic fourth-order
+            Runge-Kutta, which stays accurate at a much larger dt
+        backend: "auto" (default) runs the step loop compiled with Numba
+            when it is installed and in pure Python otherwise; "python"
+            or "numba" force one. The results are bit-identical.
 
     Returns:
         numpy.ndarray: Trajectory array of shape (num_steps, 3)
     """
+    _check_method(method)
+    state, params = _prepare(initial_state, sigma, rho, beta)
+    if np.ndim(state[0]) != 0:
+        raise ValueError("initial_state must be a single [x, y, z]; use "
+                         "compute_lorenz_ensemble() for several")
+
     # Create trajectory array
     trajectory = np.zeros((num_steps, 3))
 
     # Set initial state
     trajectory[0] = initial_state
 
-    # Integrate using Euler method
-    for i in range(num_steps - 1):
-        x, y, z = trajectory[i]
+    _integrate_into(trajectory[1:], state, dt, params, method, backend)
+    return trajectory
 
-        # Lorenz equations
-        dx = sigma * (y - x) * dt
-        dy = (x * (rho - z) - y) * dt
-        dz = (x * y - beta * z) * dt
 
-        # Update next state
-        trajectory[i + 1] = [x + dx, y + dy, z + dz]
+def compute_lorenz_ensemble(initial_states, num_steps, dt,
+                            sigma=10.0, rho=28.0, beta=8.0/3.0,
+                            method="euler", backend="auto"):
+    """
+    Compute many Lorenz trajectories together with a fixed-step integrator.
 
-    return trajectory
+    All members are advanced at once with array operations, one step at a
+    time. Each member performs exactly the arithmetic of
+    compute_lorenz_trajectory(), so its trajectory is bit-identical to a
+    separate single-trajectory run with the same parameters.
+
+    Args:
+        initial_states: Initial [x, y, z] coordinates, shape (M, 3)
+        num_steps: Number of integration steps
+        dt: Time step size
+        sigma: Prandtl number, a scalar or one value per member (M,)
+        rho: Rayleigh number, a scalar or one value per member (M,)
+        beta: Geometric factor, a scalar or one value per member (M,)
+        method: "euler" (default) or "rk4"; see compute_lorenz_trajectory()
+        backend: "auto", "python" or "numba"; see
+            compute_lorenz_trajectory()
+
+    Returns:
+        numpy.ndarray: Trajectories of shape (num_steps, M, 3); step i of
+        every member is the contiguous slab ``trajectories[i]``.
+    """
+    _check_method(method)
+    initial_states = np.asarray(initial_states, dtype=float)
+    if initial_states.ndim != 2 or initial_states.shape[1] != 3:
+        raise ValueError(f"initial_states must have shape (M, 3), got "
+                         f"{initial_states.shape}")
+    state, params = _prepare(initial_states, sigma, rho, beta)
+
+    trajectories = np.zeros((num_steps,) + initial_states.shape)
+    trajectories[0] = initial_states
+
+    _integrate_into(trajectories[1:], state, dt, params, method, backend)
+    return trajectories
+
+
+def iter_lorenz_chunks(initial_state, num_steps, dt,
+                       chunk_size=DEFAULT_CHUNK_SIZE, sigma=10.0, rho=28.0,
+                       beta=8.0/3.0, method="euler", backend="auto"):
+    """
+    Generate a Lorenz trajectory in fixed-size chunks.
+
+    The integration state is carried from one chunk to the next, so the
+    chunks concatenate to exactly compute_lorenz_trajectory()'s (or, for
+    an (M, 3) ensemble, compute_lorenz_ensemble()'s) result, while only
+    one chunk is held in memory at a time.
+
+    Args:
+        initial_state: Initial [x, y, z] coordinates, or an (M, 3) ensemble
+        num_steps: Total number of steps including the initial state, or
+            None to generate forever
+        dt: Time step size
+        chunk_size: Steps per chunk; the last chunk may be shorter
+        sigma: Prandtl number (default: 10.0)
+        rho: Rayleigh number (default: 28.0)
+        beta: Geometric factor (default: 8/3)
+        method: "euler" (default) or "rk4"
+        backend: "auto", "python" or "numba"; see
+            compute_lorenz_trajectory()
+
+    Yields:
+        numpy.ndarray: Chunks of shape (n, 3) or (n, M, 3), newly
+        allocated each time; the first one starts with the initial state.
+    """
+    _check_method(method)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    initial_state = np.asarray(initial_state, dtype=float)
+    state, params = _prepare(initial_state, sigma, rho, beta)
+
+    done = 0
+    while num_steps is None or done < num_steps:
+        size = chunk_size if num_steps is None else min(chunk_size,
+                                                        num_steps - done)
+        chunk = np.zeros((size,) + initial_state.shape)
+        if done == 0:
+            chunk[0] = initial_state
+            state = _integrate_into(chunk[1:], state, dt, params, method,
+                                    backend)
+        else:
+            state = _integrate_into(chunk, state, dt, params, method,
+                                    backend)
+        done += size
+        yield chunk
+
+
+def write_lorenz_trajectory(path, initial_state, num_steps, dt,
+                            chunk_size=DEFAULT_CHUNK_SIZE, sigma=10.0,
+                            rho=28.0, beta=8.0/3.0, method="euler",
+                            backend="auto"):
+    """
+    Integrate a Lorenz trajectory straight into a memory-mapped ``.npy`` file.
+
+    Memory use is bounded by one chunk however long the run is.
+
+    Args:
+        path: Output ``.npy`` file
+        initial_state: Initial [x, y, z] coordinates, or an (M, 3) ensemble
+        num_steps: Number of integration steps
+        dt: Time step size
+        chunk_size: Steps integrated and flushed at a time
+        sigma: Prandtl number (default: 10.0)
+        rho: Rayleigh number (default: 28.0)
+        beta: Geometric factor (default: 8/3)
+        method: "euler" (default) or "rk4"
+        backend: "auto", "python" or "numba"; see
+            compute_lorenz_trajectory()
+
+    Returns:
+        numpy.memmap: The trajectory, read-only, of shape (num_steps, 3)
+        or (num_steps, M, 3)
+    """
+    initial_state = np.asarray(initial_state, dtype=float)
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=float,
+                                    shape=(num_steps,) + initial_state.shape)
+    start = 0
+    for chunk in iter_lorenz_chunks(initial_state, num_steps, dt, chunk_size,
+                                    sigma, rho, beta, method, backend):
+        out[start:start + len(chunk)] = chunk
+        out.flush()
+        start += len(chunk)
+    del out
+    return np.load(path, mmap_mode="r")
+
+
+class LorenzSolution:
+    """Steps of an adaptive integration with dense output between them.
+
+    Calling the solution evaluates the Dormand-Prince continuous extension,
+    which is fourth-order accurate anywhere inside a step, so states can be
+    sampled at any times without integrating on that grid.
+
+    Attributes:
+        t: Times of the accepted steps, shape (n + 1,), from 0 to t_end.
+        states: States at those times, shape (n + 1, ..., 3).
+        rejected: Number of steps rejected by the error control.
+    """
+
+    def __init__(self, t, states, coefficients, rejected):
+        self.t = t
+        self.states = states
+        self._coefficients = coefficients
+        self.rejected = rejected
+
+    @property
+    def num_steps(self):
+        """Number of accepted steps."""
+        return len(self.t) - 1
+
+    def __call__(self, times):
+        """
+        Interpolated states at arbitrary times.
+
+        Args:
+            times: A time or array of times within [0, t_end]
+
+        Returns:
+            numpy.ndarray: States of shape times.shape + (..., 3)
+        """
+        times = np.asarray(times, dtype=float)
+        if np.any(times < self.t[0]) or np.any(times > self.t[-1]):
+            raise ValueError(f"times must lie within [{self.t[0]}, "
+                             f"{self.t[-1]}]")
+        index = np.clip(np.searchsorted(self.t, times, side="right") - 1,
+                        0, self.num_steps - 1)
+        h = self.t[index + 1] - self.t[index]
+        theta = (times - self.t[index]) / h
+        theta = theta.reshape(theta.shape + (1,) * (self.states.ndim - 1))
+        theta1 = 1 - theta
+
+        y0, ydiff, bspl, cubic, quartic = (self._coefficients[index, j]
+                                           for j in range(5))
+        return y0 + theta * (ydiff + theta1 * (bspl + theta * (
+            cubic + theta1 * quartic)))
+
+    def sample(self, num_steps, dt):
+        """
+        States on a regular grid, like compute_lorenz_trajectory().
+
+        Returns:
+            numpy.ndarray: States at 0, dt, ..., (num_steps - 1) * dt
+        """
+        return self(np.arange(num_steps) * dt)
+
+
+def _error_norm(error, y0, y1, rtol, atol):
+    scale = atol + rtol * np.maximum(np.abs(y0), np.abs(y1))
+    return np.sqrt(np.mean((error / scale) ** 2))
+
+
+def _initial_step(y0, f0, derivative, rtol, atol):
+    """Starting step size estimate (Hairer, Norsett and Wanner, II.4)."""
+    scale = atol + rtol * np.abs(y0)
+    d0 = np.sqrt(np.mean((y0 / scale) ** 2))
+    d1 = np.sqrt(np.mean((f0 / scale) ** 2))
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    f1 = derivative(y0 + h0 * f0)
+    d2 = np.sqrt(np.mean(((f1 - f0) / scale) ** 2)) / h0
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+    return min(100 * h0, h1)
+
+
+def solve_lorenz_adaptive(initial_state, t_end, sigma=10.0, rho=28.0,
+                          beta=8.0/3.0, rtol=1e-6, atol=1e-9,
+                          max_steps=10_000_000):
+    """
+    Integrate the Lorenz system with adaptive Dormand-Prince 5(4) steps.
+
+    Each step is accepted when the embedded error estimate, measured
+    against ``atol + rtol * |state|``, is at most 1, and the next step size
+    is chosen from that estimate. Only the accepted steps are stored;
+    LorenzSolution interpolates between them.
+
+    Args:
+        initial_state: Initial [x, y, z] coordinates, or an (M, 3) ensemble
+            (whose members then share one step-size sequence)
+        t_end: Integration time
+        sigma: Prandtl number (default: 10.0)
+        rho: Rayleigh number (default: 28.0)
+        beta: Geometric factor (default: 8/3)
+        rtol: Relative error tolerance per step
+        atol: Absolute error tolerance per step
+        max_steps: Largest number of attempted steps before giving up
+
+    Returns:
+        LorenzSolution: Step times, states and dense output.
+
+    Raises:
+        RuntimeError: If max_steps is exceeded.
+    """
+    def derivative(state):
+        return lorenz_derivative(state, sigma, rho, beta)
+
+    y = np.asarray(initial_state, dtype=float)
+    t = 0.0
+    k1 = derivative(y)
+    h = _initial_step(y, k1, derivative, rtol, atol)
+    times, states, coefficients = [t], [y], []
+    rejected = 0
+
+    for _ in range(max_steps):
+        if t >= t_end:
+            break
+        last = t + h >= t_end
+        if last:
+            h = t_end - t
+
+        k = [k1]
+        for row in DOPRI_A[1:]:
+            stage = y + h * sum(a * ki for a, ki in zip(row, k) if a)
+            k.append(derivative(stage))
+        y_new = stage  # the last stage is the fifth-order solution
+        error = h * sum(e * ki for e, ki in zip(DOPRI_E, k) if e)
+        err = _error_norm(error, y, y_new, rtol, atol)
+
+        if err <= 1:
+            ydiff = y_new - y
+            bspl = h * k[0] - ydiff
+            coefficients.append((y, ydiff, bspl, ydiff - h * k[6] - bspl,
+                                 h * sum(d * ki for d, ki in zip(DOPRI_D, k)
+                                         if d)))
+            t = t_end if last else t + h
+            y = y_new
+            k1 = k[6]
+            times.append(t)
+            states.append(y)
+            factor = 10.0 if err == 0 else min(10.0, 0.9 * err ** -0.2)
+        else:
+            rejected += 1
+            factor = max(0.2, 0.9 * err ** -0.2)
+        h *= factor
+    if t < t_end:
+        raise RuntimeError(f"no solution within {max_steps} steps")
+
+    return LorenzSolution(np.array(times), np.array(states),
+                          np.array(coefficients), rejected)
@@ -0,0 +1,96 @@
+"""
+Numba-compiled Lorenz integration loops.
+
+Pure computation module - no visualization.
+
+The step functions of the lorenz module are compiled as they are, without
+fastmath, so every state is computed by the same sequence of IEEE float64
+operations as in pure Python and the trajectories are bit-identical. Only
+the loop around them, which dominates the pure-Python cost, changes.
+
+Importing this module raises ImportError when Numba is not installed;
+lorenz falls back to pure Python in that case.
+"""
+
+import numba
+from numba.extending import overload
+
+from src.simulations import lorenz
+
+
+@overload(lorenz._rates)
+def _rates_overload(x, y, z, sigma, rho, beta):
+    # Lets the compiled _rk4_step call lorenz._rates like any global.
+    return lorenz._rates
+
+
+_euler_step = numba.njit(cache=True)(lorenz._euler_step)
+_rk4_step = numba.njit(cache=True)(lorenz._rk4_step)
+
+# One kernel per step function and layout: Numba only caches compiled code
+# of module-level functions that call fixed globals, not of closures or of
+# functions taking the step as an argument.
+
+
+@numba.njit(cache=True)
+def _euler_single(out, x, y, z, dt, sigma, rho, beta):
+    for row in range(out.shape[0]):
+        x, y, z = _euler_step(x, y, z, dt, sigma, rho, beta)
+        out[row, 0] = x
+        out[row, 1] = y
+        out[row, 2] = z
+    return x, y, z
+
+
+@numba.njit(cache=True)
+def _rk4_single(out, x, y, z, dt, sigma, rho, beta):
+    for row in range(out.shape[0]):
+        x, y, z = _rk4_step(x, y, z, dt, sigma, rho, beta)
+        out[row, 0] = x
+        out[row, 1] = y
+        out[row, 2] = z
+    return x, y, z
+
+
+@numba.njit(cache=True)
+def _euler_ensemble(out, x, y, z, dt, sigma, rho, beta):
+    for row in range(out.shape[0]):
+        for m in range(out.shape[1]):
+            x[m], y[m], z[m] = _euler_step(x[m], y[m], z[m], dt,
+                                           sigma[m], rho[m], beta[m])
+            out[row, m, 0] = x[m]
+            out[row, m, 1] = y[m]
+            out[row, m, 2] = z[m]
+    return x, y, z
+
+
+@numba.njit(cache=True)
+def _rk4_ensemble(out, x, y, z, dt, sigma, rho, beta):
+    for row in range(out.shape[0]):
+        for m in range(out.shape[1]):
+            x[m], y[m], z[m] = _rk4_step(x[m], y[m], z[m], dt,
+                                         sigma[m], rho[m], beta[m])
+            out[row, m, 0] = x[m]
+            out[row, m, 1] = y[m]
+            out[row, m, 2] = z[m]
+    return x, y, z
+
+
+_KERNELS = {"euler": (_euler_single, _euler_ensemble),
+            "rk4": (_rk4_single, _rk4_ensemble)}
+
+
+def kernel(method, ensemble):
+    """
+    Compiled fixed-step loop.
+
+    Args:
+        method: "euler" or "rk4"
+        ensemble: False for one state of floats, True for column arrays
+
+    Returns:
+        callable: ``kernel(out, x, y, z, dt, sigma, rho, beta)`` with the
+        contract of lorenz._integrate_into(); compiled on first use and
+        cached on disk for later processes.
+    """
+    return _KERNELS[method][ensemble]
@@ -0,0 +1,224 @@
+"""
+Parallel Lorenz parameter sweeps reduced to summary statistics.
+
+Pure computation module - no visualization.
+
+sweep_lorenz() integrates every combination of sigma, rho, beta and
+initial state, and keeps for each run only a handful of numbers (bounding
+box, mean z, number of switches between the attractor's two lobes, final
+state) instead of its trajectory. Runs are integrated in batches as
+compute_lorenz_ensemble() ensembles, streamed chunk by chunk through
+iter_lorenz_chunks() so memory is bounded by one chunk per batch, and the
+batches are spread over a process pool. Each run is integrated exactly as
+by a separate compute_lorenz_trajectory() call.
+
+The result is columnar: a dict of equal-length 1-D arrays, one entry per
+run, which ``np.savez(path, **result)`` stores as is.
+"""
+
+import multiprocessing
+
+import numpy as np
+
+from src.simulations.lorenz import iter_lorenz_chunks
+
+# Runs integrated together as one ensemble, i.e. one pool task
+DEFAULT_BATCH_SIZE = 256
+
+# Steps per streamed chunk: 4096 x 256 runs x 3 float64 = 24 MiB per batch
+DEFAULT_SWEEP_CHUNK_SIZE = 4096
+
+PARAMETER_COLUMNS = ("sigma", "rho", "beta", "x0", "y0", "z0")
+STATISTIC_COLUMNS = ("x_min", "x_max", "y_min", "y_max", "z_min", "z_max",
+                     "mean_z", "lobe_switches", "x_final", "y_final",
+                     "z_final")
+
+# Per-process state, set up by _attach_worker()
+_worker = {}
+
+
+def sweep_grid(sigma, rho, beta, initial_states):
+    """
+    All combinations of parameters and initial states, as columns.
+
+    Args:
+        sigma: Prandtl number, a scalar or a sequence of values
+        rho: Rayleigh number, a scalar or a sequence of values
+        beta: Geometric factor, a scalar or a sequence of values
+        initial_states: One [x, y, z] or a (K, 3) array of them
+
+    Returns:
+        dict: The columns of PARAMETER_COLUMNS, one entry per run, in the
+        order of ``itertools.product(sigma, rho, beta, initial_states)``.
+    """
+    values = [np.atleast_1d(np.asarray(v, dtype=float)).reshape(-1)
+              for v in (sigma, rho, beta)]
+    initial_states = np.asarray(initial_states, dtype=float).reshape(-1, 3)
+    indices = np.meshgrid(*(np.arange(len(v)) for v in values),
+                          np.arange(len(initial_states)), indexing="ij")
+    indices = [i.reshape(-1) for i in indices]
+    starts = initial_states[indices[3]]
+    return {"sigma": values[0][indices[0]], "rho": values[1][indices[1]],
+            "beta": values[2][indices[2]], "x0": starts[:, 0],
+            "y0": starts[:, 1], "z0": starts[:, 2]}
+
+
+def summarize_ensemble(initial_states, num_steps, dt, sigma=10.0, rho=28.0,
+                       beta=8.0/3.0, transient=0,
+                       chunk_size=DEFAULT_SWEEP_CHUNK_SIZE, method="euler",
+                       backend="auto"):
+    """
+    Summary statistics of Lorenz trajectories without storing them.
+
+    The statistics cover steps ``transient`` to ``num_steps - 1`` of each
+    trajectory (step 0 being the initial state), so the approach to the
+    attractor can be left out. A lobe switch is a change in the sign of
+    ``x``, i.e. a jump between the two wings of the butterfly.
+
+    Args:
+        initial_states: Initial [x, y, z] coordinates, shape (M, 3)
+        num_steps: Number of integration steps
+        dt: Time step size
+        sigma: Prandtl number, a scalar or one value per member (M,)
+        rho: Rayleigh number, a scalar or one value per member (M,)
+        beta: Geometric factor, a scalar or one value per member (M,)
+        transient: Leading steps left out of the statistics
+        chunk_size: Steps held in memory at a time
+        method: "euler" (default) or "rk4"
+        backend: "auto", "python" or "numba"; see
+            compute_lorenz_trajectory()
+
+    Returns:
+        dict: The columns of STATISTIC_COLUMNS, each of shape (M,).
+    """
+    if not 0 <= transient < num_steps:
+        raise ValueError(f"transient must be in [0, num_steps), got "
+                         f"{transient} for {num_steps} steps")
+    lo = hi = z_sum = switches = lobe = None
+    seen = 0
+    for chunk in iter_lorenz_chunks(initial_states, num_steps, dt,
+                                    chunk_size, sigma, rho, beta, method,
+                                    backend):
+        final = chunk[-1]
+        kept = chunk[max(transient - seen, 0):]
+        seen += len(chunk)
+        if len(kept) == 0:
+            continue
+        right = kept[..., 0] > 0
+        if lo is None:
+            lo, hi = kept[0].copy(), kept[0].copy()
+            z_sum = np.zeros(len(kept[0]))
+            switches = np.zeros(len(kept[0]), dtype=int)
+            lobe = right[0]
+        np.minimum(lo, kept.min(axis=0), out=lo)
+        np.maximum(hi, kept.max(axis=0), out=hi)
+        # Sum each member's contiguous row so the rounding does not depend
+        # on how many members share the batch
+        z_sum += np.ascontiguousarray(kept[..., 2].T).sum(axis=1)
+        switches += (right[0] != lobe)
+        switches += (right[1:] != right[:-1]).sum(axis=0)
+        lobe = right[-1]
+
+    return {"x_min": lo[:, 0], "x_max": hi[:, 0],
+            "y_min": lo[:, 1], "y_max": hi[:, 1],
+            "z_min": lo[:, 2], "z_max": hi[:, 2],
+            "mean_z": z_sum / (num_steps - transient),
+            "lobe_switches": switches,
+            "x_final": final[:, 0].copy(), "y_final": final[:, 1].copy(),
+            "z_final": final[:, 2].copy()}
+
+
+def _summarize_batch(grid, start, stop, settings):
+    """Statistics of runs ``start:stop`` of a sweep grid."""
+    initial_states = np.stack([grid["x0"][start:stop],
+                               grid["y0"][start:stop],
+                               grid["z0"][start:stop]], axis=1)
+    return summarize_ensemble(initial_states, sigma=grid["sigma"][start:stop],
+                              rho=grid["rho"][start:stop],
+                              beta=grid["beta"][start:stop], **settings)
+
+
+def _attach_worker(grid, settings):
+    """Pool initializer: remember the grid and integration settings."""
+    _worker.clear()
+    _worker["grid"] = grid
+    _worker["settings"] = settings
+
+
+def _summarize_worker_batch(batch):
+    """Worker task: summarize one batch of runs."""
+    start, stop = batch
+    return start, stop, _summarize_batch(_worker["grid"], start, stop,
+                                         _worker["settings"])
+
+
+def sweep_lorenz(sigma, rho, beta, initial_states, num_steps, dt,
+                 transient=0, processes=None, batch_size=DEFAULT_BATCH_SIZE,
+                 chunk_size=DEFAULT_SWEEP_CHUNK_SIZE, method="euler",
+                 backend="auto"):
+    """
+    Integrate a grid of Lorenz runs on a process pool and summarize each.
+
+    Batches of ``batch_size`` runs are handed to the pool one at a time
+    (``imap_unordered``), so a worker that finishes early takes the next
+    batch. Every run is integrated exactly as by compute_lorenz_trajectory(),
+    so the results do not depend on the batch size or process count.
+
+    Args:
+        sigma: Prandtl number, a scalar or a sequence of values
+        rho: Rayleigh number, a scalar or a sequence of values
+        beta: Geometric factor, a scalar or a sequence of values
+        initial_states: One [x, y, z] or a (K, 3) array of them
+        num_steps: Number of integration steps per run
+        dt: Time step size
+        transient: Leading steps left out of the statistics; see
+            summarize_ensemble()
+        processes: Number of worker processes (default: CPU count).
+            With 1 the batches run in this process, without a pool.
+        batch_size: Runs integrated together per task
+        chunk_size: Steps held in memory at a time per batch
+        method: "euler" (default) or "rk4"
+        backend: "auto", "python" or "numba"; see
+            compute_lorenz_trajectory()
+
+    Returns:
+        dict: The columns of PARAMETER_COLUMNS followed by those of
+        STATISTIC_COLUMNS, one entry per run in sweep_grid() order.
+
+    Example:
+        >>> result = sweep_lorenz(10.0, [10.0, 28.0], 8/3, [1.0, 1.0, 1.0],
+        ...                       num_steps=5000, dt=0.01, transient=2000)
+        >>> result["lobe_switches"].tolist()
+        [0, 18]
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    processes = processes or multiprocessing.cpu_count()
+    grid = sweep_grid(sigma, rho, beta, initial_states)
+    num_runs = len(grid["sigma"])
+    settings = {"num_steps": num_steps, "dt": dt, "transient": transient,
+                "chunk_size": chunk_size, "method": method,
+                "backend": backend}
+    work = [(start, min(start + batch_size, num_runs))
+            for start in range(0, num_runs, batch_size)]
+
+    result = dict(grid)
+    result.update({name: np.empty(num_runs, dtype=int if
+                                  name == "lobe_switches" else float)
+                   for name in STATISTIC_COLUMNS})
+
+    def store(start, stop, stats):
+        for name, values in stats.items():
+            result[name][start:stop] = values
+
+    if processes == 1:
+        for start, stop in work:
+            store(start, stop, _summarize_batch(grid, start, stop, settings))
+        return result
+
+    with multiprocessing.Pool(processes, initializer=_attach_worker,
+                              initargs=(grid, settings)) as pool:
+        for start, stop, stats in pool.imap_unordered(
+                _summarize_worker_batch, work):
+            store(start, stop, stats)
+    return result
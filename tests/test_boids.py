@@ -12,10 +12,47 @@ import pytest
 
 from src.simulations.boids import (
     normalize, limit_magnitude, Boid, separation, alignment, cohesion,
-    get_boid_color,
+    get_boid_color, Flock, normalize_rows, limit_magnitude_rows,
+    BruteForceIndex, SpatialGrid, flock_steering, flock_neighbour_pass,
+    BOID_COLORS, COLOR_CROWDED, minimum_image, spawn_flock,
+    DEFAULT_SEPARATION_RADIUS, DEFAULT_ALIGNMENT_RADIUS,
+    DEFAULT_COHESION_RADIUS, DEFAULT_SEPARATION_WEIGHT,
+    DEFAULT_ALIGNMENT_WEIGHT, DEFAULT_COHESION_WEIGHT,
 )
 
 
+def reference_step(boids, bounds):
+    """Advance a list of Boids one step with the per-boid functions.
+
+    All forces are computed from the same snapshot before any boid moves,
+    which is the ordering Flock.step() implements.
+    """
+    forces = [
+        (separation(boid, boids, DEFAULT_SEPARATION_RADIUS),
+         alignment(boid, boids, DEFAULT_ALIGNMENT_RADIUS),
+         cohesion(boid, boids, DEFAULT_COHESION_RADIUS))
+        for boid in boids
+    ]
+    for boid, (sep, ali, coh) in zip(boids, forces):
+        boid.acceleration += sep * DEFAULT_SEPARATION_WEIGHT
+        boid.acceleration += ali * DEFAULT_ALIGNMENT_WEIGHT
+        boid.acceleration += coh * DEFAULT_COHESION_WEIGHT
+        boid.update(bounds)
+
+
+def random_flock_arrays(num_boids, seed=0, spread=120.0):
+    """Positions clustered in a small box (so most boids interact)."""
+    rng = np.random.default_rng(seed)
+    positions = 400.0 + rng.uniform(-spread / 2, spread / 2, (num_boids, 3))
+    velocities = rng.uniform(-1, 1, (num_boids, 3))
+    return positions.astype(np.float32), velocities.astype(np.float32)
+
+
+def random_flock(num_boids, seed=0, spread=120.0):
+    """A Flock of random_flock_arrays()."""
+    return Flock(*random_flock_arrays(num_boids, seed, spread))
+
+
 class TestNormalizeFunction:
     """Characterization tests for the normalize() utility function."""
 
@@ -375,3 +412,439 @@ class TestBoidColorDetermination:
 
         # Should be green (0.0, 1.0, 0.0) when comfortable
         assert color == (0.0, 1.0, 0.0)
+
+
+class TestVectorizedHelpers:
+    """Row-wise versions of normalize() and limit_magnitude()."""
+
+    def test_normalize_rows_matches_normalize(self):
+        """Each row is normalized like normalize(); zero rows pass through."""
+        v = np.array([[3.0, 4.0, 0.0], [0.0, 0.0, 0.0], [1.0, 2.0, 2.0]])
+
+        result = normalize_rows(v)
+
+        for row, expected in zip(result, v):
+            assert np.allclose(row, normalize(expected))
+
+    def test_limit_magnitude_rows_matches_limit_magnitude(self):
+        """Rows above the limit are clamped, others are unchanged."""
+        v = np.array([[6.0, 8.0, 0.0], [2.0, 1.0, 0.0]])
+
+        result = limit_magnitude_rows(v, 5.0)
+
+        assert np.allclose(result[0], limit_magnitude(v[0], 5.0))
+        assert np.array_equal(result[1], v[1])
+
+
+class TestFlock:
+    """Tests for the array-backed Flock engine."""
+
+    def test_flock_stores_contiguous_float32_arrays(self):
+        """State is held as contiguous (N, 3) float32 arrays."""
+        positions, velocities = random_flock_arrays(20)
+
+        flock = Flock(positions, velocities)
+
+        assert len(flock) == 20
+        for array in (flock.positions, flock.velocities, flock.accelerations):
+            assert array.shape == (20, 3)
+            assert array.dtype == np.float32
+            assert array.flags['C_CONTIGUOUS']
+        assert np.array_equal(flock.accelerations, np.zeros((20, 3)))
+
+    def test_flock_rejects_mismatched_shapes(self):
+        """Positions and velocities must describe the same number of boids."""
+        with pytest.raises(ValueError):
+            Flock(np.zeros((3, 3)), np.zeros((2, 3)))
+
+    def test_steering_forces_match_per_boid_functions(self):
+        """Vectorized forces equal separation()/alignment()/cohesion()."""
+        positions, velocities = random_flock_arrays(40)
+        flock = Flock(positions, velocities)
+        boids = flock.to_boids()
+
+        sep, ali, coh = flock.steering_forces()
+
+        for i, boid in enumerate(boids):
+            assert np.allclose(
+                sep[i], separation(boid, boids, DEFAULT_SEPARATION_RADIUS),
+                atol=1e-6)
+            assert np.allclose(
+                ali[i], alignment(boid, boids, DEFAULT_ALIGNMENT_RADIUS),
+                atol=1e-6)
+            assert np.allclose(
+                coh[i], cohesion(boid, boids, DEFAULT_COHESION_RADIUS),
+                atol=1e-6)
+
+    def test_isolated_boid_gets_zero_force(self):
+        """A boid with no neighbours in range feels no steering force."""
+        flock = Flock([[0.0, 0.0, 0.0], [500.0, 0.0, 0.0]],
+                      [[0.5, 0.0, 0.0], [0.0, 0.5, 0.0]])
+
+        for force in flock.steering_forces():
+            assert np.array_equal(force, np.zeros((2, 3)))
+
+    def test_step_matches_boid_update_path(self):
+        """Flock.step() tracks the per-boid path over several steps."""
+        bounds = np.array([800, 600, 800])
+        positions, velocities = random_flock_arrays(30, seed=1)
+        flock = Flock(positions, velocities)
+        boids = flock.to_boids()
+
+        for _ in range(5):
+            flock.step(bounds)
+            reference_step(boids, bounds)
+
+        assert np.allclose(flock.positions,
+                           [b.position for b in boids], atol=1e-3)
+        assert np.allclose(flock.velocities,
+                           [b.velocity for b in boids], atol=1e-4)
+        assert np.array_equal(flock.accelerations, np.zeros((30, 3)))
+
+    def test_step_wraps_positions_at_bounds(self):
+        """Positions wrap toroidally, like Boid.update()."""
+        flock = Flock([[799.0, 300.0, 400.0]], [[2.0, 0.0, 0.0]])
+
+        flock.step(np.array([800, 600, 800]))
+
+        assert np.allclose(flock.positions[0], [1.0, 300.0, 400.0])
+
+    def test_round_trip_through_boids(self):
+        """from_boids() and to_boids() preserve the flock state."""
+        positions, velocities = random_flock_arrays(5)
+        flock = Flock(positions, velocities)
+
+        copy = Flock.from_boids(flock.to_boids())
+
+        assert np.array_equal(copy.positions, flock.positions)
+        assert np.array_equal(copy.velocities, flock.velocities)
+
+
+class TestSpatialGrid:
+    """Tests for the uniform-grid neighbour index."""
+
+    def test_cell_size_is_at_least_requested(self):
+        """Cells are never narrower than cell_size, so neighbours are adjacent."""
+        grid = SpatialGrid([800, 600, 820], cell_size=50.0)
+
+        assert np.array_equal(grid.dims, [16, 12, 16])
+        assert np.all(grid.cell_extent >= 50.0)
+
+    def test_candidate_pairs_cover_all_close_pairs(self):
+        """Every pair within the radius is reported exactly once."""
+        positions, _ = random_flock_arrays(200, spread=300.0)
+        grid = SpatialGrid([800, 600, 800], cell_size=50.0)
+        grid.rebuild(positions)
+        brute = BruteForceIndex(radius=50.0)
+        brute.rebuild(positions)
+
+        def close_pairs(index):
+            pairs = []
+            for i, j in index.candidate_pairs(block_size=500):
+                d = np.linalg.norm(positions[i] - positions[j], axis=1)
+                keep = d < 50.0
+                pairs.extend(zip(i[keep].tolist(), j[keep].tolist()))
+            return pairs
+
+        grid_pairs = close_pairs(grid)
+        assert len(grid_pairs) == len(set(grid_pairs))
+        assert sorted(grid_pairs) == sorted(close_pairs(brute))
+
+    def test_neighbours_narrow_per_boid_queries(self):
+        """Per-boid functions give the same answer on the grid's candidates."""
+        positions, velocities = random_flock_arrays(100, spread=300.0)
+        boids = Flock(positions, velocities).to_boids()
+        grid = SpatialGrid([800, 600, 800])
+        grid.rebuild(positions)
+
+        for boid in boids[:10]:
+            nearby = [boids[j] for j in grid.neighbours(boid.position)]
+            assert np.allclose(
+                cohesion(boid, nearby, DEFAULT_COHESION_RADIUS),
+                cohesion(boid, boids, DEFAULT_COHESION_RADIUS))
+            assert get_boid_color(boid, nearby) == get_boid_color(boid, boids)
+
+    def test_grid_steering_matches_brute_force(self):
+        """flock_steering() gives the same forces with either index."""
+        positions, velocities = random_flock_arrays(300, spread=300.0)
+
+        brute = flock_steering(positions, velocities)
+        grid = flock_steering(positions, velocities,
+                              index=SpatialGrid([800, 600, 800]))
+
+        for a, b in zip(brute, grid):
+            assert np.allclose(a, b, atol=1e-12)
+
+    def test_index_smaller_than_radius_is_rejected(self):
+        """A grid whose cells are narrower than a query radius is an error."""
+        positions, velocities = random_flock_arrays(10)
+
+        with pytest.raises(ValueError):
+            flock_steering(positions, velocities,
+                           index=SpatialGrid([800, 600, 800], cell_size=20.0))
+
+    def test_flock_steps_with_grid_index(self):
+        """A Flock with a SpatialGrid index tracks the brute-force flock."""
+        bounds = np.array([800, 600, 800])
+        positions, velocities = random_flock_arrays(100, spread=300.0)
+        brute = Flock(positions, velocities)
+        gridded = Flock(positions, velocities, index=SpatialGrid(bounds))
+
+        for _ in range(3):
+            brute.step(bounds)
+            gridded.step(bounds)
+
+        assert np.allclose(brute.positions, gridded.positions, atol=1e-4)
+
+
+class TestFusedNeighbourPass:
+    """Tests for the single pass computing forces and colour classes."""
+
+    def test_colors_match_get_boid_color(self):
+        """Colour classes map to the same RGB as get_boid_color()."""
+        positions, velocities = random_flock_arrays(150, spread=400.0)
+        boids = Flock(positions, velocities).to_boids()
+
+        for index in (None, SpatialGrid([800, 600, 800])):
+            *_, colors = flock_neighbour_pass(positions, velocities,
+                                              index=index)
+
+            assert [BOID_COLORS[c] for c in colors] == [
+                get_boid_color(boid, boids) for boid in boids]
+
+    def test_coincident_boids_are_crowded(self):
+        """Boids at the same position count as crowded but exert no force."""
+        positions = [[10.0, 10.0, 10.0], [10.0, 10.0, 10.0]]
+        velocities = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+
+        sep, ali, coh, colors = flock_neighbour_pass(positions, velocities)
+
+        assert list(colors) == [COLOR_CROWDED, COLOR_CROWDED]
+        assert np.array_equal(sep, np.zeros((2, 3)))
+
+    def test_forces_match_flock_steering(self):
+        """The fused pass returns the same forces as flock_steering()."""
+        positions, velocities = random_flock_arrays(80)
+
+        fused = flock_neighbour_pass(positions, velocities)
+        forces = flock_steering(positions, velocities)
+
+        for a, b in zip(fused[:3], forces):
+            assert np.array_equal(a, b)
+
+    @pytest.mark.parametrize("index", [None, SpatialGrid([800, 600, 800])])
+    def test_queries_select_rows(self, index):
+        """Results for a subset of boids equal the matching full-pass rows."""
+        positions, velocities = random_flock_arrays(60)
+        queries = np.array([5, 0, 42])
+
+        full = flock_neighbour_pass(positions, velocities, index=index)
+        subset = flock_neighbour_pass(positions, velocities, index=index,
+                                      queries=queries)
+
+        for a, b in zip(full, subset):
+            assert np.array_equal(a[queries], b)
+
+    def test_step_returns_colors_of_snapshot(self):
+        """Flock.step() returns the colour classes of the pre-step state."""
+        bounds = np.array([800, 600, 800])
+        positions, velocities = random_flock_arrays(50)
+        flock = Flock(positions, velocities)
+        *_, expected = flock_neighbour_pass(positions, velocities)
+
+        colors = flock.step(bounds)
+
+        assert np.array_equal(colors, expected)
+
+
+class TestPeriodicBoundaries:
+    """Tests for minimum-image neighbour distances in a toroidal world."""
+
+    bounds = np.array([800.0, 600.0, 800.0])
+
+    def test_minimum_image_picks_shortest_displacement(self):
+        """Displacements longer than half the world wrap to the other side."""
+        displacement = np.array([[796.0, -590.0, 10.0]])
+
+        result = minimum_image(displacement, self.bounds)
+
+        assert np.allclose(result, [[-4.0, 10.0, 10.0]])
+
+    def test_boids_see_each_other_across_the_seam(self):
+        """Boids near opposite faces repel only in periodic mode."""
+        positions = [[2.0, 300.0, 400.0], [798.0, 300.0, 400.0]]
+        velocities = [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+
+        sep, *_ = flock_neighbour_pass(positions, velocities)
+        periodic_sep, *_, colors = flock_neighbour_pass(
+            positions, velocities, periodic_bounds=self.bounds)
+
+        assert np.array_equal(sep, np.zeros((2, 3)))
+        assert periodic_sep[0, 0] > 0  # pushed away from x = 798 (-2)
+        assert periodic_sep[1, 0] < 0
+        assert list(colors) == [COLOR_CROWDED, COLOR_CROWDED]
+
+    def test_cohesion_targets_nearest_image(self):
+        """Cohesion steers towards the neighbour's image across the seam."""
+        positions = [[10.0, 300.0, 400.0], [790.0, 300.0, 400.0]]
+        velocities = [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+
+        _, _, coh = flock_steering(positions, velocities,
+                                   periodic_bounds=self.bounds)
+
+        assert coh[0, 0] < 0  # towards x = -10, not x = 790
+        assert coh[1, 0] > 0
+
+    def test_periodic_forces_are_translation_invariant(self):
+        """Shifting a periodic flock (with wrapping) leaves forces unchanged."""
+        rng = np.random.default_rng(3)
+        positions = rng.uniform(0, self.bounds, (300, 3)).astype(np.float32)
+        velocities = rng.uniform(-1, 1, (300, 3)).astype(np.float32)
+        shifted = np.mod(positions + np.float32(400.0),
+                         self.bounds.astype(np.float32))
+
+        original = flock_steering(positions, velocities,
+                                  periodic_bounds=self.bounds)
+        moved = flock_steering(shifted, velocities,
+                               periodic_bounds=self.bounds)
+
+        for a, b in zip(original, moved):
+            assert np.allclose(a, b, atol=1e-5)
+
+    @pytest.mark.parametrize("bounds", [
+        [800.0, 600.0, 800.0],
+        [120.0, 60.0, 800.0],  # two cells and one cell along some axes
+    ])
+    def test_periodic_grid_matches_periodic_brute_force(self, bounds):
+        """A periodic SpatialGrid gives the same results as brute force."""
+        rng = np.random.default_rng(4)
+        positions = rng.uniform(0, bounds, (400, 3)).astype(np.float32)
+        velocities = rng.uniform(-1, 1, (400, 3)).astype(np.float32)
+
+        brute = flock_neighbour_pass(positions, velocities,
+                                     periodic_bounds=bounds)
+        grid = flock_neighbour_pass(
+            positions, velocities, periodic_bounds=bounds,
+            index=SpatialGrid(bounds, periodic=True))
+
+        for a, b in zip(brute, grid):
+            assert np.allclose(a, b, atol=1e-12)
+
+    def test_periodic_grid_wraps_positions_outside_bounds(self):
+        """Boids outside [0, bounds) are binned by their wrapped position."""
+        positions = [[400.0, 650.0, 400.0], [400.0, 60.0, 400.0]]
+        velocities = [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+
+        brute = flock_neighbour_pass(positions, velocities,
+                                     periodic_bounds=self.bounds)
+        grid = flock_neighbour_pass(
+            positions, velocities, periodic_bounds=self.bounds,
+            index=SpatialGrid(self.bounds, periodic=True))
+
+        assert list(grid[-1]) == [COLOR_CROWDED, COLOR_CROWDED]
+        for a, b in zip(brute, grid):
+            assert np.allclose(a, b, atol=1e-12)
+
+    def test_periodic_grid_matches_brute_force_out_of_bounds(self):
+        """Out-of-bounds flocks, as spawned clusters can be, match too."""
+        rng = np.random.default_rng(5)
+        positions = rng.uniform(-self.bounds / 2, 1.5 * self.bounds,
+                                (400, 3)).astype(np.float32)
+        velocities = rng.uniform(-1, 1, (400, 3)).astype(np.float32)
+
+        brute = flock_neighbour_pass(positions, velocities,
+                                     periodic_bounds=self.bounds)
+        grid = flock_neighbour_pass(
+            positions, velocities, periodic_bounds=self.bounds,
+            index=SpatialGrid(self.bounds, periodic=True))
+
+        for a, b in zip(brute, grid):
+            assert np.allclose(a, b, atol=1e-12)
+
+    def test_non_periodic_index_is_rejected(self):
+        """A periodic pass needs an index built for the same world."""
+        positions, velocities = random_flock_arrays(10)
+
+        with pytest.raises(ValueError):
+            flock_neighbour_pass(positions, velocities,
+                                 periodic_bounds=self.bounds,
+                                 index=SpatialGrid(self.bounds))
+
+    def test_periodic_flock_step(self):
+        """A periodic Flock steps with a periodic grid like with brute force."""
+        positions, velocities = random_flock_arrays(100, spread=300.0)
+        brute = Flock(positions, velocities, periodic=True)
+        gridded = Flock(positions, velocities, periodic=True,
+                        index=SpatialGrid(self.bounds, periodic=True))
+
+        for _ in range(3):
+            brute.step(self.bounds)
+            gridded.step(self.bounds)
+
+        assert np.allclose(brute.positions, gridded.positions, atol=1e-4)
+
+
+class TestSpawnFlock:
+    """Tests for vectorized, seeded flock creation."""
+
+    center = np.array([400.0, 300.0, 400.0])
+
+    def test_same_seed_gives_same_flock(self):
+        """Runs are reproducible from an explicit seed."""
+        a = spawn_flock(100, self.center, seed=7)
+        b = spawn_flock(100, self.center, seed=7)
+        c = spawn_flock(100, self.center, seed=8)
+
+        assert np.array_equal(a.positions, b.positions)
+        assert np.array_equal(a.velocities, b.velocities)
+        assert not np.array_equal(a.positions, c.positions)
+
+    def test_accepts_generator(self):
+        """A numpy Generator can be passed instead of a seed."""
+        flock = spawn_flock(10, self.center, seed=np.random.default_rng(1))
+
+        assert np.array_equal(
+            flock.positions, spawn_flock(10, self.center, seed=1).positions)
+
+    def test_cube_spawn_matches_create_flock_area(self):
+        """The cube spawn fills the same box as create_flock()."""
+        flock = spawn_flock(2000, self.center, spawn_area_size=200, seed=0)
+
+        assert isinstance(flock, Flock)
+        assert flock.positions.dtype == np.float32
+        offsets = flock.positions - self.center
+        assert np.all(np.abs(offsets) <= 100.0)
+        assert np.all(np.abs(offsets).max(axis=0) > 95.0)
+        assert np.all(np.abs(flock.velocities) <= 1.0)
+
+    def test_sphere_spawn_stays_in_ball(self):
+        """The sphere spawn is uniform inside a ball of diameter spawn_area."""
+        flock = spawn_flock(2000, self.center, spawn_area_size=200,
+                            shape="sphere", seed=0)
+
+        radii = np.linalg.norm(flock.positions - self.center, axis=1)
+        assert radii.max() <= 100.0 + 1e-3
+        # Uniform in volume: half the boids lie beyond r = 100 / 2**(1/3)
+        assert abs(np.mean(radii > 100.0 / 2 ** (1 / 3)) - 0.5) < 0.05
+
+    def test_cluster_spawn_groups_boids(self):
+        """Every boid lies within cluster_radius of one of the clusters."""
+        flock = spawn_flock(500, self.center, spawn_area_size=600,
+                            shape="clusters", num_clusters=3,
+                            cluster_radius=20.0, seed=2)
+
+        # Greedy grouping: boids within 40 of each other share a cluster
+        positions = flock.positions
+        unassigned = np.ones(len(positions), dtype=bool)
+        groups = 0
+        while unassigned.any():
+            seed_boid = positions[np.argmax(unassigned)]
+            members = np.linalg.norm(positions - seed_boid, axis=1) <= 40.0
+            assert members[unassigned].any()
+            unassigned &= ~members
+            groups += 1
+        assert groups <= 3
+
+    def test_unknown_shape_is_rejected(self):
+        with pytest.raises(ValueError):
+            spawn_flock(10, self.center, shape="torus")
@@ -0,0 +1,82 @@
+"""
+Tests for the multi-core, domain-decomposed boids stepper.
+
+The parallel step must reproduce the serial Flock.step() with a SpatialGrid
+index bit for bit, whatever the number of worker processes.
+"""
+
+import numpy as np
+import pytest
+
+from src.simulations.boids import Flock, SpatialGrid
+from src.simulations.boids_parallel import ParallelFlockStepper
+
+BOUNDS = np.array([800.0, 600.0, 800.0])
+
+
+def random_state(num_boids, seed=0):
+    """Boids spread over the whole world, so every slab has neighbours."""
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, BOUNDS, (num_boids, 3)).astype(np.float32)
+    velocities = rng.uniform(-1, 1, (num_boids, 3)).astype(np.float32)
+    return positions, velocities
+
+
+class TestParallelFlockStepper:
+    """Tests for ParallelFlockStepper."""
+
+    @pytest.mark.parametrize("periodic", [False, True])
+    @pytest.mark.parametrize("processes", [1, 3])
+    def test_matches_serial_step_exactly(self, periodic, processes):
+        """Several parallel steps are bit-identical to the serial grid step."""
+        positions, velocities = random_state(1500)
+        serial = Flock(positions, velocities, periodic=periodic,
+                       index=SpatialGrid(BOUNDS, periodic=periodic))
+        parallel = Flock(positions, velocities, periodic=periodic)
+
+        with ParallelFlockStepper(parallel, BOUNDS,
+                                  processes=processes) as stepper:
+            for _ in range(3):
+                serial_colors = serial.step(BOUNDS)
+                parallel_colors = stepper.step()
+
+                assert np.array_equal(parallel_colors, serial_colors)
+                assert np.array_equal(parallel.positions, serial.positions)
+                assert np.array_equal(parallel.velocities, serial.velocities)
+
+    def test_slabs_cover_every_column_once(self):
+        """Slabs are contiguous, non-empty column ranges spanning the grid."""
+        positions, velocities = random_state(500)
+        flock = Flock(positions, velocities)
+
+        with ParallelFlockStepper(flock, BOUNDS, processes=2) as stepper:
+            slabs = stepper.slabs()
+
+        assert slabs[0][0] == 0
+        assert slabs[-1][1] == stepper.grid.dims[0]
+        for (_, hi), (lo, _) in zip(slabs, slabs[1:]):
+            assert hi == lo
+        assert all(lo < hi for lo, hi in slabs)
+
+    def test_close_returns_flock_to_private_memory(self):
+        """After close() the flock keeps its state in ordinary arrays."""
+        positions, velocities = random_state(100)
+        flock = Flock(positions, velocities)
+        stepper = ParallelFlockStepper(flock, BOUNDS, processes=1)
+        stepper.step()
+        stepped = flock.positions.copy()
+
+        stepper.close()
+
+        assert np.array_equal(flock.positions, stepped)
+        flock.step(BOUNDS)  # still usable serially
+
+    def test_rejects_radius_larger_than_cells(self):
+        """Cells narrower than a neighbour radius are an error."""
+        positions, velocities = random_state(50)
+        flock = Flock(positions, velocities)
+
+        with ParallelFlockStepper(flock, BOUNDS, processes=1,
+                                  cell_size=30.0) as stepper:
+            with pytest.raises(ValueError):
+                stepper.step()
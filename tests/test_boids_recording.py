@@ -0,0 +1,126 @@
+"""
+Tests for headless boids runs and chunked binary recordings.
+"""
+
+import numpy as np
+import pytest
+
+from src.simulations.boids import flock_neighbour_pass
+from src.simulations.boids_recording import (
+    BoidsRecorder, BoidsRecording, run_headless,
+)
+from tests.test_boids import random_flock
+
+BOUNDS = np.array([800.0, 600.0, 800.0])
+
+
+class TestBoidsRecorder:
+    """Round trips through BoidsRecorder and BoidsRecording."""
+
+    def test_frames_round_trip_across_chunks(self, tmp_path):
+        """Frames written over several (partial) chunks read back intact."""
+        rng = np.random.default_rng(1)
+        frames = [(step * 3,
+                   rng.random((6, 3), dtype=np.float32),
+                   rng.random((6, 3), dtype=np.float32),
+                   rng.integers(0, 3, 6).astype(np.int8))
+                  for step in range(7)]
+
+        with BoidsRecorder(tmp_path, num_boids=6, stride=3,
+                           chunk_frames=3) as recorder:
+            for frame in frames:
+                recorder.write(*frame)
+
+        recording = BoidsRecording(tmp_path)
+        assert len(recording) == 7
+        assert recording.stride == 3
+        assert np.array_equal(recording.steps, [0, 3, 6, 9, 12, 15, 18])
+        for expected, actual in zip(frames, recording):
+            assert actual[0] == expected[0]
+            for a, b in zip(actual[1:], expected[1:]):
+                assert np.array_equal(a, b)
+
+    def test_frames_are_memory_mapped(self, tmp_path):
+        """Replay reads frames from memory-mapped chunk files."""
+        with BoidsRecorder(tmp_path, num_boids=2) as recorder:
+            recorder.write(0, np.zeros((2, 3)), np.zeros((2, 3)),
+                           np.zeros(2))
+
+        _, positions, _, _ = BoidsRecording(tmp_path)[0]
+
+        assert isinstance(positions.base, np.memmap)
+
+    def test_out_of_range_frame_raises(self, tmp_path):
+        """Indexing past the recorded frames is an IndexError."""
+        with BoidsRecorder(tmp_path, num_boids=2) as recorder:
+            recorder.write(0, np.zeros((2, 3)), np.zeros((2, 3)),
+                           np.zeros(2))
+
+        recording = BoidsRecording(tmp_path)
+        assert np.array_equal(recording[-1][1], recording[0][1])
+        with pytest.raises(IndexError):
+            recording[1]
+
+    def test_metadata_is_stored(self, tmp_path):
+        """Extra metadata is saved alongside the frames."""
+        BoidsRecorder(tmp_path, num_boids=1,
+                      metadata={'bounds': [1, 2, 3]}).close()
+
+        assert BoidsRecording(tmp_path).metadata == {'bounds': [1, 2, 3]}
+
+
+class TestRunHeadless:
+    """Tests for run_headless()."""
+
+    def test_records_every_stride_steps(self, tmp_path):
+        """Snapshots are taken every ``stride`` steps."""
+        flock = random_flock(40, spread=200.0)
+
+        with BoidsRecorder(tmp_path, len(flock), stride=4,
+                           chunk_frames=2) as recorder:
+            recorded = run_headless(flock, BOUNDS, 10, recorder, stride=4)
+
+        assert recorded == 3
+        assert np.array_equal(BoidsRecording(tmp_path).steps, [0, 4, 8])
+
+    def test_stride_defaults_to_recorder_stride(self, tmp_path):
+        """Without an explicit stride the recorder's stride is used."""
+        flock = random_flock(40, spread=200.0)
+
+        with BoidsRecorder(tmp_path, len(flock), stride=3) as recorder:
+            run_headless(flock, BOUNDS, 7, recorder)
+
+        assert np.array_equal(BoidsRecording(tmp_path).steps, [0, 3, 6])
+
+    def test_rejects_stride_different_from_recorder(self, tmp_path):
+        """Recording at a stride the metadata does not claim is an error."""
+        flock = random_flock(40, spread=200.0)
+
+        with BoidsRecorder(tmp_path, len(flock), stride=3) as recorder:
+            with pytest.raises(ValueError):
+                run_headless(flock, BOUNDS, 7, recorder, stride=2)
+
+    def test_replay_matches_simulation(self, tmp_path):
+        """Each frame holds the state after ``step`` steps and its colours."""
+        flock = random_flock(40, spread=200.0)
+        replica = random_flock(40, spread=200.0)
+
+        with BoidsRecorder(tmp_path, len(flock), stride=2) as recorder:
+            run_headless(flock, BOUNDS, 6, recorder, stride=2)
+
+        for step, positions, velocities, colors in BoidsRecording(tmp_path):
+            *_, expected_colors = flock_neighbour_pass(replica.positions,
+                                                       replica.velocities)
+            assert np.array_equal(positions, replica.positions)
+            assert np.array_equal(velocities, replica.velocities)
+            assert np.array_equal(colors, expected_colors)
+            replica.step(BOUNDS)
+            replica.step(BOUNDS)
+
+    def test_runs_without_recorder(self):
+        """Without a recorder the flock is simply advanced."""
+        flock = random_flock(40, spread=200.0)
+        start = flock.positions.copy()
+
+        assert run_headless(flock, BOUNDS, 3) == 0
+        assert not np.array_equal(flock.positions, start)
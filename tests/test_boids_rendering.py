@@ -25,7 +25,10 @@ import pytest
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.simulations.boids import Boid, get_boid_color
+from src.simulations.boids import (
+    Boid, get_boid_color, normalize, BOID_COLORS, COLOR_CROWDED,
+    COLOR_ISOLATED, COLOR_COMFORTABLE,
+)
 
 # Import draw_boid from examples/run_boids.py (not a package, so use importlib)
 import importlib.util
@@ -35,6 +38,8 @@ spec = importlib.util.spec_from_file_location(
 run_boids_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(run_boids_module)
 draw_boid = run_boids_module.draw_boid
+flock_triangles = run_boids_module.flock_triangles
+FlockRenderer = run_boids_module.FlockRenderer
 
 
 def _has_opengl_context():
@@ -54,6 +59,28 @@ requires_display = pytest.mark.skipif(
 )
 
 
+def _pyopengl_tracks_context():
+    """Check that PyOpenGL can see the current context.
+
+    Client-side array state (glVertexPointer and friends) is stored per
+    context, which fails if PyOpenGL's platform (e.g. GLX) differs from the
+    one SDL created the context with (e.g. EGL for offscreen drivers; set
+    PYOPENGL_PLATFORM=egl there).
+    """
+    try:
+        from OpenGL import contextdata
+        contextdata.getContext()
+        return True
+    except Exception:
+        return False
+
+
+requires_vertex_arrays = pytest.mark.skipif(
+    not (_has_opengl_context() and _pyopengl_tracks_context()),
+    reason="Requires an OpenGL context visible to PyOpenGL"
+)
+
+
 @requires_display
 class TestBoidRendering:
     """Tests for boid rendering with colors.
@@ -95,3 +122,66 @@ class TestBoidRendering:
         sig = inspect.signature(draw_boid)
         params = list(sig.parameters.keys())
         assert params == ['position', 'velocity', 'color', 'size']
+
+
+def draw_boid_vertices(position, velocity, size):
+    """World-space triangle that draw_boid() renders for one boid.
+
+    glMultMatrixf() reads draw_boid()'s row-major matrix as column-major,
+    so each local vertex maps to x * right + y * up + z * forward.
+    """
+    forward = normalize(velocity)
+    right = np.cross(forward, np.array([0, 1, 0]))
+    up = np.cross(right, forward)
+    local = [(2 * size, 0, 0), (-2 * size, 1 * size, 0),
+             (-2 * size, -1 * size, 0)]
+    return np.array([position + x * right + y * up + z * forward
+                     for x, y, z in local])
+
+
+class TestBatchedFlockGeometry:
+    """Tests for the bulk geometry behind the batched renderer.
+
+    Pure NumPy, so no display is needed.
+    """
+
+    def test_triangles_match_draw_boid(self):
+        """Bulk vertices equal the per-boid draw_boid() transform."""
+        rng = np.random.default_rng(0)
+        positions = rng.uniform(0, 800, (20, 3)).astype(np.float32)
+        velocities = rng.uniform(-1, 1, (20, 3)).astype(np.float32)
+        colors = rng.integers(0, 3, 20)
+
+        vertices, _ = flock_triangles(positions, velocities, colors, size=1.5)
+
+        assert vertices.shape == (60, 3)
+        assert vertices.dtype == np.float32
+        for k in range(20):
+            expected = draw_boid_vertices(positions[k], velocities[k], 1.5)
+            assert np.allclose(vertices[3 * k:3 * k + 3], expected, atol=1e-3)
+
+    def test_vertex_colors_follow_color_classes(self):
+        """Every vertex of a boid gets the RGB of its colour class."""
+        colors = np.array([COLOR_CROWDED, COLOR_ISOLATED, COLOR_COMFORTABLE])
+
+        _, vertex_colors = flock_triangles(np.zeros((3, 3)),
+                                           np.ones((3, 3)), colors)
+
+        assert vertex_colors.shape == (9, 3)
+        for k, color in enumerate(colors):
+            for row in vertex_colors[3 * k:3 * k + 3]:
+                assert tuple(row) == BOID_COLORS[color]
+
+
+@requires_vertex_arrays
+class TestFlockRenderer:
+    """The batched renderer draws a whole flock in one call."""
+
+    def test_draws_flock(self):
+        rng = np.random.default_rng(1)
+        renderer = FlockRenderer(size=1.5)
+
+        renderer.draw(rng.uniform(0, 800, (100, 3)),
+                      rng.uniform(-1, 1, (100, 3)),
+                      rng.integers(0, 3, 100))
+        renderer.delete()
@@ -0,0 +1,147 @@
+"""
+Tests for the fixed-timestep boids scheduler.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.simulations.boids_scheduler import (
+    FixedStepScheduler, FlockSnapshot, interpolate_snapshots,
+)
+from tests.test_boids import random_flock
+
+BOUNDS = np.array([800.0, 600.0, 800.0])
+
+
+def snapshot(positions, velocities=None, colors=None, step=0):
+    positions = np.array(positions, dtype=np.float32)
+    if velocities is None:
+        velocities = np.zeros_like(positions)
+    if colors is None:
+        colors = np.zeros(len(positions), dtype=np.int8)
+    return FlockSnapshot(step, 0.0, positions,
+                         np.array(velocities, dtype=np.float32),
+                         np.array(colors, dtype=np.int8))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestInterpolation:
+    """Tests for interpolate_snapshots()."""
+
+    def test_blends_linearly(self):
+        """alpha = 0, 0.5 and 1 give previous, midpoint and current."""
+        previous = snapshot([[0.0, 0.0, 0.0]], [[1.0, 0.0, 0.0]], [0])
+        current = snapshot([[10.0, 20.0, 30.0]], [[3.0, 0.0, 0.0]], [2])
+
+        for alpha, expected, color in ((0.0, [0, 0, 0], 0),
+                                       (0.5, [5, 10, 15], 2),
+                                       (1.0, [10, 20, 30], 2)):
+            positions, velocities, colors = interpolate_snapshots(
+                previous, current, alpha)
+            assert np.allclose(positions, [expected])
+            assert list(colors) == [color]
+        assert np.allclose(velocities, [[3.0, 0.0, 0.0]])
+
+    def test_wrapped_boid_moves_across_seam(self):
+        """A boid that wrapped interpolates across the seam, not the world."""
+        previous = snapshot([[799.0, 300.0, 400.0]])
+        current = snapshot([[1.0, 300.0, 400.0]])
+
+        positions, _, _ = interpolate_snapshots(previous, current, 0.25,
+                                                BOUNDS)
+
+        assert np.allclose(positions, [[799.5, 300.0, 400.0]])
+
+    def test_snapshots_are_read_only(self):
+        """Published snapshots cannot be modified by a renderer."""
+        state = snapshot([[1.0, 2.0, 3.0]])
+
+        with pytest.raises(ValueError):
+            state.positions[0, 0] = 5.0
+
+
+class TestFixedStepScheduler:
+    """Tests for FixedStepScheduler."""
+
+    def test_advance_publishes_synchronous_steps(self):
+        """Published states match stepping the flock directly."""
+        flock = random_flock(30, spread=200.0)
+        reference = random_flock(30, spread=200.0)
+        scheduler = FixedStepScheduler(flock, BOUNDS)
+
+        scheduler.advance(3)
+        previous, current = scheduler.latest()
+
+        reference.step(BOUNDS)
+        reference.step(BOUNDS)
+        assert previous.step == 2 and current.step == 3
+        assert np.array_equal(previous.positions, reference.positions)
+        colors = reference.step(BOUNDS)
+        assert np.array_equal(current.positions, reference.positions)
+        assert np.array_equal(current.colors, colors)
+
+    def test_tick_runs_steps_at_fixed_rate(self):
+        """Steps are due every 1/steps_per_second, independent of ticks."""
+        clock = FakeClock()
+        scheduler = FixedStepScheduler(random_flock(30, spread=200.0), BOUNDS,
+                                       steps_per_second=10.0, clock=clock)
+
+        assert scheduler.tick(0.0) == 1
+        assert scheduler.tick(0.05) == 0
+        assert scheduler.tick(0.1) == 1
+        assert scheduler.tick(0.35) == 2
+        assert scheduler.steps == 4
+
+    def test_tick_limits_catch_up(self):
+        """A long stall runs at most max_catch_up steps, then resumes."""
+        scheduler = FixedStepScheduler(random_flock(30, spread=200.0), BOUNDS,
+                                       steps_per_second=10.0, max_catch_up=3,
+                                       clock=FakeClock())
+
+        scheduler.tick(0.0)
+        assert scheduler.tick(10.0) == 3
+        assert scheduler.tick(10.05) == 0
+        assert scheduler.tick(10.15) == 1
+
+    def test_interpolated_uses_time_since_publish(self):
+        """Rendering blends between the last two states by elapsed time."""
+        clock = FakeClock()
+        scheduler = FixedStepScheduler(random_flock(30, spread=200.0), BOUNDS,
+                                       steps_per_second=10.0, clock=clock)
+        scheduler.advance(1)
+        previous, current = scheduler.latest()
+
+        clock.now = 0.05
+        positions, _, _ = scheduler.interpolated()
+        expected, _, _ = interpolate_snapshots(previous, current, 0.5, BOUNDS)
+        assert np.allclose(positions, expected)
+
+        clock.now = 1.0
+        positions, _, _ = scheduler.interpolated()
+        assert np.allclose(positions, current.positions)
+
+    def test_background_thread_steps_until_stopped(self):
+        """The thread keeps stepping while the caller only reads snapshots."""
+        scheduler = FixedStepScheduler(random_flock(30, spread=200.0), BOUNDS,
+                                       steps_per_second=200.0)
+
+        with scheduler:
+            deadline = time.monotonic() + 5.0
+            while scheduler.latest()[1].step < 3:
+                assert time.monotonic() < deadline, "scheduler did not step"
+                positions, _, _ = scheduler.interpolated()
+                assert positions.shape == (30, 3)
+                time.sleep(0.005)
+        stopped_at = scheduler.steps
+        time.sleep(0.05)
+
+        assert scheduler.steps == stopped_at
@@ -0,0 +1,188 @@
+"""
+Tests for the Julia, Multibrot and Burning Ship fractals.
+
+Each fractal is checked against a naive full-grid loop, and against the
+tiling and caching machinery it shares with the Mandelbrot set.
+"""
+
+import numpy as np
+import pytest
+
+from src.fractals.mandelbrot import (
+    escape_time, render, Viewport, DEFAULT_BOUNDS,
+)
+from src.fractals.mandelbrot_parallel import render_tiled
+from src.fractals.mandelbrot_pyramid import TilePyramid
+from src.fractals.families import (
+    EscapeTimeFractal, Mandelbrot, Multibrot, Julia, BurningShip,
+    render_julia_batch,
+)
+
+SQUARE = Viewport(-1.6, 1.6, -1.6, 1.6, 48, 40)
+
+
+def reference_escape_time(z, c, max_iter, step):
+    """Naive full-grid loop with the engine's conventions."""
+    z = np.array(z, dtype=complex)
+    c = np.broadcast_to(c, z.shape)
+    divtime = max_iter + np.zeros(z.shape, dtype=int)
+    for i in range(max_iter):
+        z = step(z, c)
+        diverge = z*np.conj(z) > 2**2
+        divtime[diverge & (divtime == max_iter)] = i
+        z[diverge] = 2
+    return divtime
+
+
+class TestFamilies:
+    """Escape times of each fractal."""
+
+    def test_mandelbrot_matches_escape_time(self):
+        """The Mandelbrot object is escape_time(), options included."""
+        grid = Viewport.from_bounds(DEFAULT_BOUNDS, 60, 40).grid()
+
+        np.testing.assert_array_equal(
+            Mandelbrot().escape_time(grid, 200, cardioid=True),
+            escape_time(grid, 200))
+
+    def test_multibrot_degree_two_is_mandelbrot(self):
+        """z**2 + c through the generic kernel is bit-identical."""
+        view = Viewport.from_bounds(DEFAULT_BOUNDS, 60, 40)
+
+        np.testing.assert_array_equal(Multibrot(2).render(view, 300).divtime,
+                                      render(view, 300).divtime)
+
+    def test_multibrot_matches_reference(self):
+        """Degree 3 agrees with the naive loop."""
+        grid = SQUARE.grid()
+        expected = reference_escape_time(grid, grid, 100,
+                                         lambda z, c: z**3 + c)
+
+        np.testing.assert_array_equal(Multibrot(3).escape_time(grid, 100),
+                                      expected)
+
+    def test_multibrot_rejects_bad_degree(self):
+        """Only integer degrees of at least 2 are supported."""
+        with pytest.raises(ValueError):
+            Multibrot(1)
+        with pytest.raises(ValueError):
+            Multibrot(2.5)
+
+    def test_julia_matches_reference(self):
+        """Points are starting values and c is fixed."""
+        c = complex(-0.8, 0.156)
+        grid = SQUARE.grid()
+        expected = reference_escape_time(grid, c, 150,
+                                         lambda z, c: z**2 + c)
+
+        np.testing.assert_array_equal(Julia(c).escape_time(grid, 150),
+                                      expected)
+
+    def test_julia_of_zero_is_the_unit_disk(self):
+        """For c = 0 exactly the points with |z| <= 1 stay bounded."""
+        z = np.array([0.5, -0.9j, 0.99, 1.01, 1.5 + 0j, 3])
+
+        divtime = Julia(0).escape_time(z, 200, periodicity=True)
+
+        np.testing.assert_array_equal(divtime < 200,
+                                      [False, False, False, True, True, True])
+
+    def test_burning_ship_matches_reference(self):
+        """The folded step agrees with the naive loop."""
+        def step(z, c):
+            return (np.abs(z.real) + 1j*np.abs(z.imag))**2 + c
+
+        view = Viewport(-2.2, 1.2, -2.0, 1.0, 51, 37)
+        grid = view.grid()
+
+        np.testing.assert_array_equal(BurningShip().render(view, 120).divtime,
+                                      reference_escape_time(grid, grid, 120,
+                                                            step))
+
+    def test_unsupported_options_raise(self):
+        """The cardioid test and distance estimates are not universal."""
+        grid = SQUARE.grid()
+        with pytest.raises(ValueError):
+            Julia(-1).escape_time(grid, 50, cardioid=True)
+        with pytest.raises(ValueError):
+            BurningShip().render(SQUARE, 50, distance=True)
+
+    def test_smooth_and_distance_outputs(self):
+        """Continuous outputs come with the escape times."""
+        image = Multibrot(3).render(SQUARE, 100, smooth=True, distance=True)
+        escaped = image.divtime < 100
+
+        assert np.abs(image.smooth[escaped]
+                      - image.divtime[escaped]).max() < 4
+        assert np.all(image.distance[escaped] > 0)
+        np.testing.assert_array_equal(image.distance[~escaped], 0)
+
+    def test_key_identifies_fractal(self):
+        """Equal parameters give equal fractals and keys."""
+        assert Julia(-0.8 + 0.156j) == Julia(complex(-0.8, 0.156))
+        assert Julia(-0.8) != Julia(0.8)
+        assert Multibrot(3).key != Multibrot(4).key
+
+
+class TestJuliaBatch:
+    """Tests for render_julia_batch()."""
+
+    def test_matches_individual_renders(self):
+        """Each frame equals a separate render of its parameter."""
+        cs = [-0.8 + 0.156j, 0.285 + 0.01j, -0.4 + 0.6j, -1]
+
+        images = render_julia_batch(SQUARE, cs, 150, periodicity=True,
+                                    smooth=True)
+
+        assert len(images) == len(cs)
+        for c, image in zip(cs, images):
+            expected = Julia(c).render(SQUARE, 150, smooth=True)
+            np.testing.assert_array_equal(image.divtime, expected.divtime)
+            np.testing.assert_array_equal(image.smooth, expected.smooth)
+
+
+class TestSharedMachinery:
+    """The fractals plug into tiling and the tile pyramid."""
+
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_tiled_render_matches_serial(self, processes):
+        """render_tiled() with a fractal equals its own render()."""
+        fractal = Julia(-0.7269 + 0.1889j)
+
+        image = render_tiled(SQUARE, 200, processes=processes, tile_size=16,
+                             periodicity=True, fractal=fractal)
+
+        np.testing.assert_array_equal(image.divtime,
+                                      fractal.render(SQUARE, 200).divtime)
+
+    def test_pyramid_tiles(self, tmp_path):
+        """Tiles are rendered with the pyramid's fractal."""
+        fractal = BurningShip()
+        pyramid = TilePyramid(tmp_path, tile_size=16,
+                              root_bounds=(-2.5, 1.5, -2.0, 2.0),
+                              fractal=fractal)
+
+        tile = pyramid.get_tile(1, 0, 0, 100)
+
+        np.testing.assert_array_equal(
+            tile, fractal.render(pyramid.tile_viewport(1, 0, 0), 100).divtime)
+
+    def test_pyramid_cache_belongs_to_one_fractal(self, tmp_path):
+        """A cache of one fractal cannot be reopened for another."""
+        TilePyramid(tmp_path, tile_size=16, fractal=Julia(-1))
+
+        with pytest.raises(ValueError):
+            TilePyramid(tmp_path, tile_size=16, fractal=Julia(0.25))
+        with pytest.raises(ValueError):
+            TilePyramid(tmp_path, tile_size=16)
+
+    def test_incomplete_fractal_cannot_be_created(self):
+        """A subclass missing part of the interface fails on creation."""
+        class NoStep(EscapeTimeFractal):
+            key = "no-step"
+
+            def start(self, points):
+                return points, points
+
+        with pytest.raises(TypeError):
+            NoStep()
@@ -7,7 +7,15 @@ Following Michael Feathers' approach - one test at a time.
 import numpy as np
 import pytest
 
-from src.simulations.lorenz import compute_lorenz_trajectory
+from src.simulations import lorenz
+from src.simulations.lorenz import (
+    compute_lorenz_trajectory, compute_lorenz_ensemble,
+    solve_lorenz_adaptive, iter_lorenz_chunks, write_lorenz_trajectory,
+    numba_available,
+)
+
+needs_numba = pytest.mark.skipif(not numba_available(),
+                                 reason="numba is not installed")
 
 
 class TestLorenzCharacterization:
@@ -60,3 +68,275 @@ class TestLorenzCharacterization:
             expected_step1,
             decimal=5
         )
+
+
+class TestLorenzEnsemble:
+    """Tests for compute_lorenz_ensemble()."""
+
+    def test_returns_correct_shape(self):
+        """Should return (num_steps, M, 3) with the initial states first."""
+        initial = np.random.default_rng(0).normal(size=(5, 3))
+
+        trajectories = compute_lorenz_ensemble(initial, 50, 0.01)
+
+        assert trajectories.shape == (50, 5, 3)
+        np.testing.assert_array_equal(trajectories[0], initial)
+
+    def test_members_match_single_trajectories(self):
+        """Each member is bit-identical to compute_lorenz_trajectory()."""
+        initial = np.array([[1.0, 1.0, 1.0], [-1.0, -1.0, 1.0],
+                            [1.0, 1.0, 1.0 + 1e-9]])
+
+        trajectories = compute_lorenz_ensemble(initial, 2000, 0.01)
+
+        for member, state in enumerate(initial):
+            np.testing.assert_array_equal(
+                trajectories[:, member],
+                compute_lorenz_trajectory(state, 2000, 0.01))
+
+    def test_per_member_parameters(self):
+        """sigma/rho/beta may differ per member."""
+        initial = np.ones((3, 3))
+        rho = np.array([10.0, 18.0, 28.0])
+        sigma = np.array([10.0, 12.0, 14.0])
+
+        trajectories = compute_lorenz_ensemble(initial, 500, 0.01,
+                                               sigma=sigma, rho=rho,
+                                               beta=2.0)
+
+        for member in range(3):
+            np.testing.assert_array_equal(
+                trajectories[:, member],
+                compute_lorenz_trajectory(initial[member], 500, 0.01,
+                                          sigma=sigma[member],
+                                          rho=rho[member], beta=2.0))
+
+    def test_rejects_bad_state_shape(self):
+        """Initial states must be an (M, 3) array."""
+        with pytest.raises(ValueError):
+            compute_lorenz_ensemble([1.0, 1.0, 1.0], 10, 0.01)
+
+
+class TestLorenzIntegrators:
+    """Tests for the RK4 and adaptive Dormand-Prince integrators."""
+
+    @staticmethod
+    def reference(t_end):
+        """A tightly converged solution at t_end."""
+        return solve_lorenz_adaptive([1.0, 1.0, 1.0], t_end,
+                                     rtol=1e-12, atol=1e-12)(t_end)
+
+    def test_euler_is_the_default(self):
+        """method="euler" is the original scheme."""
+        np.testing.assert_array_equal(
+            compute_lorenz_trajectory([1.0, 1.0, 1.0], 100, 0.01),
+            compute_lorenz_trajectory([1.0, 1.0, 1.0], 100, 0.01,
+                                      method="euler"))
+
+    def test_rejects_unknown_method(self):
+        """Only the listed integrators are accepted."""
+        with pytest.raises(ValueError):
+            compute_lorenz_trajectory([1.0, 1.0, 1.0], 10, 0.01,
+                                      method="leapfrog")
+
+    def test_rk4_is_fourth_order(self):
+        """Halving dt cuts the RK4 error by about 16."""
+        expected = self.reference(1.0)
+        errors = [
+            np.abs(compute_lorenz_trajectory([1.0, 1.0, 1.0], n + 1,
+                                             1.0 / n, method="rk4")[-1]
+                   - expected).max()
+            for n in (200, 400)
+        ]
+
+        assert 12 < errors[0] / errors[1] < 20
+
+    def test_rk4_beats_euler_at_same_dt(self):
+        """At dt = 0.01 RK4 is orders of magnitude more accurate."""
+        expected = self.reference(2.0)
+        euler = compute_lorenz_trajectory([1.0, 1.0, 1.0], 201, 0.01)
+        rk4 = compute_lorenz_trajectory([1.0, 1.0, 1.0], 201, 0.01,
+                                        method="rk4")
+
+        assert (np.abs(rk4[-1] - expected).max() * 1e3
+                < np.abs(euler[-1] - expected).max())
+
+    def test_rk4_ensemble_matches_single_runs(self):
+        """The RK4 ensemble path gives each member's own trajectory."""
+        initial = np.array([[1.0, 1.0, 1.0], [-1.0, 2.0, 20.0]])
+
+        trajectories = compute_lorenz_ensemble(initial, 300, 0.01,
+                                               rho=[28.0, 35.0],
+                                               method="rk4")
+
+        np.testing.assert_allclose(
+            trajectories[:, 1],
+            compute_lorenz_trajectory(initial[1], 300, 0.01, rho=35.0,
+                                      method="rk4"),
+            rtol=1e-12, atol=1e-12)
+
+    def test_adaptive_meets_tolerance(self):
+        """Tightening rtol reduces the error and adds steps."""
+        expected = self.reference(5.0)
+        loose = solve_lorenz_adaptive([1.0, 1.0, 1.0], 5.0, rtol=1e-5)
+        tight = solve_lorenz_adaptive([1.0, 1.0, 1.0], 5.0, rtol=1e-9)
+
+        assert loose.t[-1] == 5.0
+        assert tight.num_steps > loose.num_steps
+        assert np.abs(tight(5.0) - expected).max() < 1e-5
+        assert (np.abs(tight(5.0) - expected).max()
+                < np.abs(loose(5.0) - expected).max())
+
+    def test_dense_output_matches_steps_and_fine_grid(self):
+        """Interpolation hits the step states and a fine RK4 grid."""
+        solution = solve_lorenz_adaptive([1.0, 1.0, 1.0], 2.0, rtol=1e-10,
+                                         atol=1e-10)
+        fine = compute_lorenz_trajectory([1.0, 1.0, 1.0], 20001, 1e-4,
+                                         method="rk4")
+
+        np.testing.assert_allclose(solution(solution.t), solution.states,
+                                   atol=1e-12)
+        np.testing.assert_allclose(solution.sample(20001, 1e-4), fine,
+                                   atol=1e-6)
+        assert solution(1.0).shape == (3,)
+
+    def test_dense_output_rejects_times_outside_run(self):
+        """Extrapolation is not supported."""
+        solution = solve_lorenz_adaptive([1.0, 1.0, 1.0], 1.0)
+
+        with pytest.raises(ValueError):
+            solution(1.5)
+
+    def test_adaptive_ensemble(self):
+        """An (M, 3) ensemble is integrated with shared steps."""
+        initial = np.array([[1.0, 1.0, 1.0], [1.0, 1.0, 1.0 + 1e-3]])
+
+        solution = solve_lorenz_adaptive(initial, 1.0, rtol=1e-10,
+                                         atol=1e-10)
+
+        assert solution.states.shape == (solution.num_steps + 1, 2, 3)
+        np.testing.assert_allclose(solution(1.0)[0], self.reference(1.0),
+                                   atol=1e-7)
+
+
+class TestLorenzStreaming:
+    """Tests for iter_lorenz_chunks() and write_lorenz_trajectory()."""
+
+    @pytest.mark.parametrize("method", ["euler", "rk4"])
+    def test_chunks_concatenate_to_trajectory(self, method):
+        """State carries across chunks bit for bit."""
+        expected = compute_lorenz_trajectory([1.0, 2.0, 3.0], 1000, 0.01,
+                                             method=method)
+
+        chunks = list(iter_lorenz_chunks([1.0, 2.0, 3.0], 1000, 0.01,
+                                         chunk_size=128, method=method))
+
+        assert [len(chunk) for chunk in chunks] == [128] * 7 + [104]
+        np.testing.assert_array_equal(np.concatenate(chunks), expected)
+
+    def test_ensemble_chunks(self):
+        """An (M, 3) ensemble streams like compute_lorenz_ensemble()."""
+        initial = np.array([[1.0, 1.0, 1.0], [-5.0, 3.0, 20.0]])
+        expected = compute_lorenz_ensemble(initial, 300, 0.01,
+                                           rho=[28.0, 35.0])
+
+        chunks = list(iter_lorenz_chunks(initial, 300, 0.01, chunk_size=64,
+                                         rho=[28.0, 35.0]))
+
+        np.testing.assert_array_equal(np.concatenate(chunks), expected)
+
+    def test_endless_stream(self):
+        """With num_steps=None the generator never stops by itself."""
+        stream = iter_lorenz_chunks([1.0, 1.0, 1.0], None, 0.01,
+                                    chunk_size=100)
+        chunks = [next(stream) for _ in range(5)]
+
+        np.testing.assert_array_equal(
+            np.concatenate(chunks),
+            compute_lorenz_trajectory([1.0, 1.0, 1.0], 500, 0.01))
+
+    def test_write_to_memmap(self, tmp_path):
+        """The file holds the trajectory and is returned memory-mapped."""
+        path = tmp_path / "lorenz.npy"
+
+        trajectory = write_lorenz_trajectory(path, [1.0, 1.0, 1.0], 1000,
+                                             0.01, chunk_size=300)
+
+        assert isinstance(trajectory, np.memmap)
+        np.testing.assert_array_equal(
+            trajectory, compute_lorenz_trajectory([1.0, 1.0, 1.0], 1000,
+                                                  0.01))
+        np.testing.assert_array_equal(np.load(path), trajectory)
+
+    def test_rejects_bad_chunk_size(self):
+        """Chunks must hold at least one step."""
+        with pytest.raises(ValueError):
+            next(iter_lorenz_chunks([1.0, 1.0, 1.0], 10, 0.01, chunk_size=0))
+
+
+class TestLorenzBackends:
+    """The compiled backend must reproduce pure Python bit for bit."""
+
+    @needs_numba
+    @pytest.mark.parametrize("method", ["euler", "rk4"])
+    def test_numba_trajectory_is_bit_identical(self, method):
+        """A single trajectory is the same on both backends."""
+        expected = compute_lorenz_trajectory([1.0, 1.0, 1.0], 20000, 0.005,
+                                             rho=35.0, method=method,
+                                             backend="python")
+
+        trajectory = compute_lorenz_trajectory([1.0, 1.0, 1.0], 20000, 0.005,
+                                               rho=35.0, method=method,
+                                               backend="numba")
+
+        np.testing.assert_array_equal(trajectory, expected)
+
+    @needs_numba
+    @pytest.mark.parametrize("method", ["euler", "rk4"])
+    def test_numba_ensemble_is_bit_identical(self, method):
+        """Ensembles with per-member parameters match too."""
+        initial = np.random.default_rng(3).normal(0.0, 5.0, (20, 3))
+        sigma = np.linspace(8.0, 12.0, 20)
+        expected = compute_lorenz_ensemble(initial, 2000, 0.01, sigma=sigma,
+                                           method=method, backend="python")
+
+        trajectories = compute_lorenz_ensemble(initial, 2000, 0.01,
+                                               sigma=sigma, method=method,
+                                               backend="numba")
+
+        np.testing.assert_array_equal(trajectories, expected)
+
+    @needs_numba
+    def test_numba_chunks_carry_state(self):
+        """Streaming on the compiled backend concatenates seamlessly."""
+        chunks = list(iter_lorenz_chunks([1.0, 1.0, 1.0], 1000, 0.01,
+                                         chunk_size=128, backend="numba"))
+
+        np.testing.assert_array_equal(
+            np.concatenate(chunks),
+            compute_lorenz_trajectory([1.0, 1.0, 1.0], 1000, 0.01,
+                                      backend="python"))
+
+    def test_auto_falls_back_without_numba(self, monkeypatch):
+        """backend="auto" runs in pure Python when numba is missing."""
+        expected = compute_lorenz_trajectory([1.0, 1.0, 1.0], 500, 0.01,
+                                             backend="python")
+        monkeypatch.setattr(lorenz, "_load_compiled", lambda: None)
+
+        trajectory = compute_lorenz_trajectory([1.0, 1.0, 1.0], 500, 0.01)
+
+        np.testing.assert_array_equal(trajectory, expected)
+
+    def test_numba_backend_requires_numba(self, monkeypatch):
+        """Asking for numba explicitly fails loudly when it is missing."""
+        monkeypatch.setattr(lorenz, "_load_compiled", lambda: None)
+
+        with pytest.raises(ImportError):
+            compute_lorenz_trajectory([1.0, 1.0, 1.0], 10, 0.01,
+                                      backend="numba")
+
+    def test_rejects_unknown_backend(self):
+        """Only the listed backends are accepted."""
+        with pytest.raises(ValueError):
+            compute_lorenz_trajectory([1.0, 1.0, 1.0], 10, 0.01,
+                                      backend="cuda")
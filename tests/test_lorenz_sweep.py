@@ -0,0 +1,150 @@
+"""
+Tests for parallel Lorenz parameter sweeps.
+
+Each run's statistics must be those of its full trajectory, and must not
+depend on the batch size or the number of worker processes.
+"""
+
+import multiprocessing
+import time
+
+import numpy as np
+import pytest
+
+from src.simulations import lorenz_sweep
+from src.simulations.lorenz import compute_lorenz_trajectory
+from src.simulations.lorenz_sweep import (
+    sweep_grid, summarize_ensemble, sweep_lorenz, PARAMETER_COLUMNS,
+    STATISTIC_COLUMNS,
+)
+
+INITIAL_STATES = [[1.0, 1.0, 1.0], [-3.0, 2.0, 20.0]]
+
+
+class TestSweepGrid:
+    """Tests for sweep_grid()."""
+
+    def test_product_order(self):
+        """Runs follow itertools.product(sigma, rho, beta, states)."""
+        grid = sweep_grid([9.0, 10.0], [20.0, 28.0, 35.0], 8/3,
+                          INITIAL_STATES)
+
+        assert set(grid) == set(PARAMETER_COLUMNS)
+        assert len(grid["sigma"]) == 2 * 3 * 1 * 2
+        np.testing.assert_array_equal(grid["sigma"][:6], 9.0)
+        np.testing.assert_array_equal(grid["rho"][:6],
+                                      [20.0, 20.0, 28.0, 28.0, 35.0, 35.0])
+        np.testing.assert_array_equal(grid["z0"][:2], [1.0, 20.0])
+
+    def test_single_initial_state(self):
+        """One [x, y, z] is a grid of one state."""
+        grid = sweep_grid(10.0, [28.0, 35.0], 8/3, [1.0, 2.0, 3.0])
+
+        np.testing.assert_array_equal(grid["y0"], [2.0, 2.0])
+
+
+class TestSummarizeEnsemble:
+    """Tests for summarize_ensemble()."""
+
+    def test_matches_full_trajectories(self):
+        """Statistics equal those computed from stored trajectories."""
+        rho = np.array([15.0, 28.0])
+        stats = summarize_ensemble(INITIAL_STATES, 3000, 0.01, rho=rho,
+                                   transient=500, chunk_size=333)
+
+        assert set(stats) == set(STATISTIC_COLUMNS)
+        for m in range(2):
+            full = compute_lorenz_trajectory(INITIAL_STATES[m], 3000, 0.01,
+                                             rho=rho[m])
+            kept = full[500:]
+            np.testing.assert_array_equal(
+                [stats["x_min"][m], stats["y_min"][m], stats["z_min"][m]],
+                kept.min(axis=0))
+            np.testing.assert_array_equal(
+                [stats["x_max"][m], stats["y_max"][m], stats["z_max"][m]],
+                kept.max(axis=0))
+            assert stats["mean_z"][m] == pytest.approx(kept[:, 2].mean())
+            switches = np.count_nonzero(np.diff(kept[:, 0] > 0))
+            assert stats["lobe_switches"][m] == switches
+            np.testing.assert_array_equal(
+                [stats["x_final"][m], stats["y_final"][m],
+                 stats["z_final"][m]], full[-1])
+
+    def test_regimes(self):
+        """Convection settles on one lobe; chaos keeps switching."""
+        stats = summarize_ensemble([[1.0, 1.0, 1.0]] * 2, 10000, 0.005,
+                                   rho=[10.0, 28.0], transient=4000)
+
+        assert stats["lobe_switches"][0] == 0
+        assert stats["mean_z"][0] == pytest.approx(9.0, abs=1e-3)
+        assert stats["lobe_switches"][1] > 5
+
+    def test_rejects_transient_beyond_run(self):
+        """At least one step must remain after the transient."""
+        with pytest.raises(ValueError):
+            summarize_ensemble(INITIAL_STATES, 100, 0.01, transient=100)
+
+
+class TestSweepLorenz:
+    """Tests for sweep_lorenz()."""
+
+    @pytest.mark.parametrize("processes, batch_size", [
+        (2, 1), (2, 5), (3, 100),
+    ])
+    def test_independent_of_partitioning(self, processes, batch_size):
+        """Pool runs match a serial sweep bit for bit."""
+        args = ([9.0, 10.0], [15.0, 28.0, 35.0], 8/3, INITIAL_STATES, 2000,
+                0.01)
+        expected = sweep_lorenz(*args, transient=200, processes=1,
+                                batch_size=12, chunk_size=250)
+
+        result = sweep_lorenz(*args, transient=200, processes=processes,
+                              batch_size=batch_size, chunk_size=250)
+
+        assert list(result) == list(PARAMETER_COLUMNS + STATISTIC_COLUMNS)
+        for name in result:
+            np.testing.assert_array_equal(result[name], expected[name])
+
+    def test_rows_match_grid(self):
+        """Row i summarizes the run of row i of sweep_grid()."""
+        result = sweep_lorenz(10.0, [20.0, 28.0], [2.0, 8/3], INITIAL_STATES,
+                              1500, 0.01, processes=1, batch_size=3)
+        grid = sweep_grid(10.0, [20.0, 28.0], [2.0, 8/3], INITIAL_STATES)
+
+        for i in range(len(grid["rho"])):
+            full = compute_lorenz_trajectory(
+                [grid["x0"][i], grid["y0"][i], grid["z0"][i]], 1500, 0.01,
+                sigma=grid["sigma"][i], rho=grid["rho"][i],
+                beta=grid["beta"][i])
+            assert result["z_max"][i] == full[:, 2].max()
+
+    def test_rejects_bad_batch_size(self):
+        """Batches must hold at least one run."""
+        with pytest.raises(ValueError):
+            sweep_lorenz(10.0, 28.0, 8/3, [1.0, 1.0, 1.0], 10, 0.01,
+                         batch_size=0)
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                        reason="workers must inherit the patched module")
+    def test_failing_batch_aborts_the_sweep(self, monkeypatch):
+        """An error in one batch is raised without running the others."""
+        summarize = lorenz_sweep.summarize_ensemble
+
+        def fail_first_batch(initial_states, **options):
+            if initial_states[0, 0] == -1.0:
+                raise RuntimeError("batch failed")
+            time.sleep(0.2)
+            return summarize(initial_states, **options)
+
+        monkeypatch.setattr(lorenz_sweep, "summarize_ensemble",
+                            fail_first_batch)
+        starts = np.column_stack([np.arange(-1.0, -101.0, -1.0),
+                                  np.ones(100), np.ones(100)])
+
+        start = time.perf_counter()
+        with pytest.raises(RuntimeError):
+            sweep_lorenz(10.0, 28.0, 8/3, starts, 10, 0.01, processes=2,
+                         batch_size=1)
+
+        # Running every batch would take 100 x 0.2 s / 2 processes
+        assert time.perf_counter() - start < 3.0
@@ -12,7 +12,29 @@ import sys
 from pathlib import Path
 
 # Import from new package structure (doesn't exist yet - will fail)
-from src.fractals.mandelbrot import mandelbrot
+import src.fractals.mandelbrot as mandelbrot_module
+from src.fractals.mandelbrot import (
+    mandelbrot, escape_time, render, Viewport, MandelbrotImage,
+    in_cardioid_or_bulb,
+    DEFAULT_BOUNDS, DEFAULT_CENTER,
+)
+
+
+def reference_mandelbrot(h, w, max_iter):
+    """The original full-grid iteration, which clamps escaped points to 2."""
+    y, x = np.ogrid[-1.4:1.4:h*1j, -2:0.8:w*1j]
+    c = x + y*1j
+    z = c
+    divtime = max_iter + np.zeros(z.shape, dtype=int)
+
+    for i in range(max_iter):
+        z = z**2 + c
+        diverge = z*np.conj(z) > 2**2
+        div_now = diverge & (divtime == max_iter)
+        divtime[div_now] = i
+        z[diverge] = 2
+
+    return divtime
 
 
 class TestMandelbrotCharacterization:
@@ -101,3 +123,253 @@ class TestMandelbrotCharacterization:
 
         assert unique_high > unique_low, \
             "Higher max_iter should provide more iteration count variety"
+
+
+class TestActiveSetEscapeTime:
+    """The active-set engine must reproduce the full-grid divtime exactly."""
+
+    @pytest.mark.parametrize("h, w, max_iter", [
+        (100, 150, 50),
+        (61, 97, 1000),
+        (1, 1, 10),
+        (7, 5, 1),
+    ])
+    def test_identical_to_full_grid_iteration(self, h, w, max_iter):
+        """mandelbrot() matches the original loop bit for bit."""
+        np.testing.assert_array_equal(mandelbrot(h, w, max_iter),
+                                      reference_mandelbrot(h, w, max_iter))
+
+    def test_zero_iterations_gives_max_iter_everywhere(self):
+        """With max_iter=0 nothing is iterated."""
+        np.testing.assert_array_equal(mandelbrot(4, 6, 0),
+                                      np.zeros((4, 6), dtype=int))
+
+    def test_accepts_any_shape(self):
+        """escape_time() keeps the shape of its input."""
+        c = np.array([[0, 1 + 1j, -2], [3, -1, 0.25]])
+        result = escape_time(c, 100)
+
+        assert result.shape == (2, 3)
+        np.testing.assert_array_equal(result, [[100, 0, 100], [0, 100, 100]])
+
+    def test_matches_mandelbrot_grid(self):
+        """escape_time() on mandelbrot()'s grid gives mandelbrot()'s result."""
+        y, x = np.ogrid[-1.4:1.4:40j, -2:0.8:60j]
+        np.testing.assert_array_equal(escape_time(x + y*1j, 200),
+                                      mandelbrot(40, 60, 200))
+
+    def test_all_points_escaped_stops_early(self):
+        """Points far outside the set all escape on the first iteration."""
+        c = np.full((3, 3), 10 + 10j)
+        np.testing.assert_array_equal(escape_time(c, 10**9),
+                                      np.zeros((3, 3), dtype=int))
+
+
+class TestViewport:
+    """Viewport describes a region of the plane and its pixel grid."""
+
+    def test_default_bounds_reproduce_mandelbrot(self):
+        """Rendering DEFAULT_BOUNDS gives exactly mandelbrot()'s array."""
+        view = Viewport.from_bounds(DEFAULT_BOUNDS, 150, 100)
+        image = render(view, 60)
+
+        assert isinstance(image, MandelbrotImage)
+        np.testing.assert_array_equal(image.divtime, mandelbrot(100, 150, 60))
+        assert image.extent == [-2.0, 0.8, -1.4, 1.4]
+        assert image.max_iter == 60
+
+    def test_grid_spans_bounds_inclusive(self):
+        """Corner pixels sit exactly on the bounds; row 0 is y_min."""
+        grid = Viewport(-1, 1, -0.5, 0.5, 5, 3).grid()
+
+        assert grid.shape == (3, 5)
+        assert grid[0, 0] == complex(-1, -0.5)
+        assert grid[-1, -1] == complex(1, 0.5)
+        assert grid[1, 2] == 0
+
+    @pytest.mark.parametrize("width, height", [
+        (401, 201), (4, 3), (3, 4), (2, 2),
+    ])
+    def test_from_center_has_square_pixels(self, width, height):
+        """from_center() keeps pixels square and centres the view."""
+        view = Viewport.from_center(-0.5 + 0.25j, 4, width, height)
+        dx, dy = view.pixel_size
+
+        assert view.shape == (height, width)
+        assert view.center == pytest.approx(-0.5 + 0.25j)
+        assert view.y_max - view.y_min == pytest.approx(2.8 / 4)
+        assert dx == pytest.approx(dy, rel=1e-12)
+
+    def test_from_center_single_row_sits_on_center(self):
+        """A one-row view is centred vertically and keeps the zoom spacing."""
+        view = Viewport.from_center(-0.5 + 0.25j, 4, 10, 1)
+        grid = view.grid()
+
+        assert view.y_min == view.y_max == 0.25
+        np.testing.assert_allclose(np.diff(grid.real[0]), 2.8 / 4)
+        assert grid.real.mean() == pytest.approx(-0.5)
+
+    def test_from_center_single_pixel_is_the_center(self):
+        """A 1x1 view samples exactly the centre."""
+        view = Viewport.from_center(-0.5 + 0.25j, 4, 1, 1)
+
+        assert view.grid()[0, 0] == -0.5 + 0.25j
+
+    def test_from_center_accepts_pair(self):
+        """The centre may be given as an (x, y) pair."""
+        assert (Viewport.from_center((-0.6, 0.0), 1, 10, 10)
+                == Viewport.from_center(DEFAULT_CENTER, 1, 10, 10))
+
+    def test_zoom_halves_span(self):
+        """Doubling the zoom halves the region."""
+        wide = Viewport.from_center(0, 2, 100, 100)
+        narrow = Viewport.from_center(0, 4, 100, 100)
+
+        assert (narrow.x_max - narrow.x_min) * 2 == pytest.approx(
+            wide.x_max - wide.x_min)
+
+    def test_deep_region_costs_only_its_pixels(self, monkeypatch):
+        """A tiny region iterates only its own pixels, nothing else."""
+        iterated = []
+
+        def counting_escape_time(c, max_iter, **options):
+            iterated.append(np.size(c))
+            return escape_time(c, max_iter, **options)
+
+        monkeypatch.setattr(mandelbrot_module, "escape_time",
+                            counting_escape_time)
+        view = Viewport.from_center(-0.743643887 + 0.131825904j, 1e6, 32, 24)
+        image = render(view, 300)
+
+        assert iterated == [32 * 24]
+        assert image.divtime.shape == (24, 32)
+
+    def test_rejects_empty_viewport(self):
+        """A viewport without pixels is an error."""
+        with pytest.raises(ValueError):
+            Viewport(0, 1, 0, 1, 0, 10)
+
+    def test_to_dict_round_trips(self):
+        """to_dict() holds everything needed to rebuild the viewport."""
+        view = Viewport(-1.5, 0.5, -1, 1, 64, 48)
+
+        assert Viewport(**view.to_dict()) == view
+
+
+class TestEarlyExits:
+    """Cardioid/bulb pre-test and periodicity checking must not change
+    the escape times."""
+
+    @pytest.mark.parametrize("cardioid, periodicity", [
+        (True, False), (False, True), (True, True),
+    ])
+    @pytest.mark.parametrize("view, max_iter", [
+        (Viewport.from_bounds(DEFAULT_BOUNDS, 150, 100), 500),
+        (Viewport.from_center(-0.2 + 0j, 3, 90, 60), 2000),
+        (Viewport.from_center(-1.25 + 0j, 40, 60, 60), 2000),
+        (Viewport.from_center(-0.7436 + 0.1318j, 300, 60, 60), 1000),
+    ])
+    def test_identical_to_plain_iteration(self, view, max_iter, cardioid,
+                                          periodicity):
+        """Early exits give exactly the plain escape times."""
+        expected = render(view, max_iter).divtime
+
+        result = render(view, max_iter, cardioid=cardioid,
+                        periodicity=periodicity).divtime
+
+        np.testing.assert_array_equal(result, expected)
+
+    def test_cardioid_and_bulb_membership(self):
+        """Known interior points test True, outside and boundary False."""
+        c = np.array([0, -0.5 + 0.3j, -1, -1.1 + 0.1j,   # inside
+                      0.25, -0.75, 0.3, -2, 1j])          # boundary/outside
+
+        np.testing.assert_array_equal(
+            in_cardioid_or_bulb(c),
+            [True, True, True, True, False, False, False, False, False])
+
+    def test_periodicity_retires_cycles_without_iterating(self):
+        """Orbits that cycle exactly finish long before max_iter."""
+        c = np.array([0, -1, -0.1 + 0.1j, -1.3])
+        max_iter = 10**9  # would never finish without the check
+
+        result = escape_time(c, max_iter, periodicity=True)
+
+        np.testing.assert_array_equal(result, [max_iter] * 4)
+
+    def test_cardioid_skips_interior_points(self):
+        """Interior points get max_iter without a single iteration."""
+        c = np.array([[0, -0.1 + 0.2j], [-1, 5]])
+
+        result = escape_time(c, 10**9, cardioid=True)
+
+        np.testing.assert_array_equal(result, [[10**9, 10**9], [10**9, 0]])
+
+
+class TestContinuousOutputs:
+    """Smooth iteration counts and distance estimates come from the same
+    pass and leave the escape times untouched."""
+
+    VIEW = Viewport.from_bounds(DEFAULT_BOUNDS, 150, 100)
+
+    def test_escape_times_unchanged(self):
+        """Requesting both outputs gives exactly the plain escape times."""
+        image = render(self.VIEW, 200, cardioid=True, periodicity=True,
+                       smooth=True, distance=True)
+
+        np.testing.assert_array_equal(image.divtime,
+                                      render(self.VIEW, 200).divtime)
+
+    def test_outputs_are_float32_or_absent(self):
+        """Outputs are only computed on request."""
+        plain = render(self.VIEW, 50)
+        both = render(self.VIEW, 50, smooth=True, distance=True)
+
+        assert plain.smooth is None and plain.distance is None
+        assert both.smooth.dtype == np.float32
+        assert both.distance.dtype == np.float32
+
+    def test_smooth_count_tracks_escape_time(self):
+        """Escaped points get a value near their integer escape time;
+        interior points get max_iter."""
+        image = render(self.VIEW, 200, smooth=True)
+        escaped = image.divtime < 200
+
+        offset = image.smooth[escaped] - image.divtime[escaped]
+        assert np.all(np.abs(offset) < 4)
+        assert abs(np.median(offset)) < 1
+        np.testing.assert_array_equal(image.smooth[~escaped], 200)
+
+    def test_smooth_count_is_continuous_across_bands(self):
+        """Along a ray leaving the set the smooth count changes gradually
+        while the integer count jumps between bands."""
+        c = np.linspace(0.26, 0.6, 2000)
+        smooth = np.empty(c.shape, np.float32)
+
+        divtime = escape_time(c, 1000, smooth_out=smooth)
+
+        assert np.max(np.abs(np.diff(divtime))) >= 1
+        assert np.max(np.abs(np.diff(smooth))) < 0.5
+
+    def test_distance_estimate_bounds_true_distance(self):
+        """For points whose distance to the set is known, the estimate is
+        within the expected factor of it (up to the small-potential
+        approximation of the formula)."""
+        # Nearest set points: 0.25 (cusp) and -2 (tip of the antenna).
+        c = np.array([0.5, 1.0, -2.5, -3.0, 3.0])
+        true_distance = np.array([0.25, 0.75, 0.5, 1.0, 2.75])
+        distance = np.empty(c.shape, np.float32)
+
+        escape_time(c, 100, distance_out=distance)
+
+        assert np.all(distance / 4 <= true_distance * 1.1)
+        assert np.all(true_distance <= distance * 1.1)
+
+    def test_distance_is_zero_inside(self):
+        """Points that never escape have distance 0."""
+        distance = np.empty(3, np.float32)
+
+        escape_time(np.array([0, -1, -0.1 + 0.1j]), 100,
+                    periodicity=True, distance_out=distance)
+
+        np.testing.assert_array_equal(distance, 0)
@@ -0,0 +1,117 @@
+"""
+Tests for the tiled, multi-process Mandelbrot renderer.
+
+A tiled render must reproduce the serial render() exactly, whatever the
+tile size or number of worker processes.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.fractals.families import Mandelbrot
+from src.fractals.mandelbrot import render, Viewport, DEFAULT_BOUNDS
+from src.fractals.mandelbrot_parallel import tiles, render_tiled, SharedArray
+
+
+class FailingFractal(Mandelbrot):
+    """Raises on the first tile, at ``-1 - 1j``; other tiles are slow."""
+
+    def escape_time(self, points, max_iter, **options):
+        if np.any(points == -1 - 1j):
+            raise RuntimeError("tile failed")
+        time.sleep(0.2)
+        return super().escape_time(points, max_iter, **options)
+
+
+class TestTiles:
+    """Tests for tiles()."""
+
+    def test_tiles_cover_every_pixel_once(self):
+        """Edge tiles are clipped and nothing overlaps."""
+        view = Viewport.from_bounds(DEFAULT_BOUNDS, 70, 45)
+        coverage = np.zeros(view.shape, dtype=int)
+
+        for rows, cols in tiles(view, 32):
+            coverage[rows, cols] += 1
+
+        assert np.all(coverage == 1)
+        assert len(tiles(view, 32)) == 2 * 3
+
+    def test_tile_grid_matches_full_grid(self):
+        """A tile's points are exactly the matching slice of the full grid."""
+        view = Viewport(-2.1, 0.7, -1.3, 1.2, 37, 23)
+        full = view.grid()
+
+        for rows, cols in tiles(view, 8):
+            assert np.array_equal(view.grid(rows, cols), full[rows, cols])
+
+
+class TestRenderTiled:
+    """Tests for render_tiled()."""
+
+    @pytest.mark.parametrize("processes, tile_size", [
+        (1, 16), (2, 16), (3, 50), (2, 1000),
+    ])
+    def test_matches_serial_render(self, processes, tile_size):
+        """Tiled output is identical to a serial render."""
+        view = Viewport.from_center(-0.75 + 0.1j, 3, 120, 90)
+        expected = render(view, 200).divtime
+
+        image = render_tiled(view, 200, processes=processes,
+                             tile_size=tile_size)
+
+        np.testing.assert_array_equal(image.divtime, expected)
+        assert image.viewport == view
+        assert image.max_iter == 200
+
+    def test_passes_early_exit_options(self):
+        """Cardioid and periodicity checks work tile by tile."""
+        view = Viewport.from_center(-0.2 + 0j, 3, 80, 60)
+
+        image = render_tiled(view, 1000, processes=2, tile_size=32,
+                             cardioid=True, periodicity=True)
+
+        np.testing.assert_array_equal(image.divtime, render(view, 1000).divtime)
+
+    def test_assembles_into_preallocated_output(self):
+        """The result is written into ``out`` when one is given."""
+        view = Viewport.from_bounds(DEFAULT_BOUNDS, 40, 30)
+        out = np.full(view.shape, -1, dtype=int)
+
+        image = render_tiled(view, 50, processes=2, tile_size=16, out=out)
+
+        assert image.divtime is out
+        np.testing.assert_array_equal(out, render(view, 50).divtime)
+
+    def test_writes_shared_output_in_place(self):
+        """Workers fill a SharedArray directly; the image views it."""
+        view = Viewport.from_center(-0.75 + 0.1j, 3, 60, 45)
+        expected = render(view, 100).divtime
+
+        with SharedArray(view.shape) as shared:
+            image = render_tiled(view, 100, processes=2, tile_size=16,
+                                 out=shared)
+            assert image.divtime is shared.array
+            np.testing.assert_array_equal(shared.array, expected)
+            del image
+
+    def test_rejects_mismatched_output(self):
+        """An output array of the wrong shape is an error."""
+        view = Viewport.from_bounds(DEFAULT_BOUNDS, 40, 30)
+
+        with pytest.raises(ValueError):
+            render_tiled(view, 50, processes=1, out=np.empty((40, 30), int))
+
+    def test_worker_error_is_raised_without_finishing_the_render(self):
+        """A failing tile aborts the pool instead of waiting for the rest."""
+        view = Viewport(-1.0, 1.0, -1.0, 1.0, 81, 81)  # 100 tiles of 8 px
+
+        start = time.perf_counter()
+        with pytest.raises(RuntimeError):
+            render_tiled(view, 10, processes=2, tile_size=8,
+                         fractal=FailingFractal())
+
+        # Rendering every tile would take 100 x 0.2 s / 2 processes
+        assert time.perf_counter() - start < 3.0
@@ -0,0 +1,145 @@
+"""
+Tests for perturbation-theory deep zoom.
+"""
+
+import decimal
+
+import numpy as np
+import pytest
+
+from src.fractals.mandelbrot import render, Viewport
+from src.fractals.mandelbrot_perturbation import (
+    DeepViewport, reference_orbit, perturbation_escape_time, render_deep,
+)
+
+
+def decimal_escape_time(center, offset, max_iter, precision=80):
+    """Escape time of ``center + offset`` iterated entirely in Decimal."""
+    context = decimal.Context(prec=precision)
+    cr = context.add(center[0], decimal.Decimal(offset.real))
+    ci = context.add(center[1], decimal.Decimal(offset.imag))
+    zr, zi = cr, ci
+    for i in range(max_iter):
+        zr, zi = (context.add(context.subtract(context.multiply(zr, zr),
+                                               context.multiply(zi, zi)), cr),
+                  context.add(context.multiply(context.add(zr, zr), zi), ci))
+        if context.add(context.multiply(zr, zr),
+                       context.multiply(zi, zi)) > 4:
+            return i
+    return max_iter
+
+
+class TestDeepViewport:
+    """Tests for DeepViewport."""
+
+    def test_string_centre_keeps_full_precision(self):
+        """Digits beyond float64 are not rounded away."""
+        view = DeepViewport(("-0.1000000000000000000000000000001", "0"),
+                            1e30, 4, 4)
+
+        assert view.center_real == decimal.Decimal(
+            "-0.1000000000000000000000000000001")
+
+    def test_precision_grows_with_zoom(self):
+        """The reference orbit resolves the pixel spacing."""
+        shallow = DeepViewport(("0", "1"), 1e3, 10, 10)
+        deep = DeepViewport(("0", "1"), 1e50, 10, 10)
+
+        assert deep.precision - shallow.precision == 47
+
+    def test_offsets_are_square_and_centred(self):
+        """Offsets match Viewport.from_center() spacing around zero."""
+        view = DeepViewport(complex(-0.5, 0), 4, 5, 3)
+        offsets = view.offsets()
+
+        assert offsets.shape == (3, 5)
+        assert offsets[1, 2] == 0
+        np.testing.assert_allclose(np.diff(offsets.real, axis=1),
+                                   view.spacing)
+        np.testing.assert_allclose(np.diff(offsets.imag, axis=0),
+                                   view.spacing)
+
+    def test_rejects_empty_viewport(self):
+        """A viewport needs at least one pixel."""
+        with pytest.raises(ValueError):
+            DeepViewport(("0", "0"), 1, 0, 10)
+
+
+class TestReferenceOrbit:
+    """Tests for reference_orbit()."""
+
+    def test_starts_at_zero_then_centre(self):
+        """Z_0 = 0 and Z_1 = C."""
+        orbit = reference_orbit(decimal.Decimal("-1"), decimal.Decimal("0"),
+                                5, 30)
+
+        np.testing.assert_array_equal(orbit, [0, -1, 0, -1, 0])
+
+    def test_stops_before_escape(self):
+        """Terms with |Z| > 2 are not stored."""
+        orbit = reference_orbit(decimal.Decimal("1"), decimal.Decimal("0"),
+                                10, 30)
+
+        np.testing.assert_array_equal(orbit, [0, 1, 2])
+
+
+class TestPerturbation:
+    """Tests for perturbation_escape_time() and render_deep()."""
+
+    def test_matches_direct_render_at_shallow_zoom(self):
+        """Where float64 suffices both methods agree."""
+        view = DeepViewport(complex(-0.75, 0.1), 100, 60, 40)
+        x_min, x_max, y_min, y_max = view.extent
+        expected = render(Viewport(x_min, x_max, y_min, y_max, 60, 40),
+                          300).divtime
+
+        image = render_deep(view, 300)
+
+        assert np.mean(image.divtime != expected) < 1e-3
+
+    def test_matches_decimal_iteration_beyond_float64(self):
+        """At 1e40 each pixel equals a full-precision iteration."""
+        view = DeepViewport(("0", "1"), 1e40, 8, 6)
+        image = render_deep(view, 500)
+
+        offsets = view.offsets()
+        for row in range(0, 6, 2):
+            for col in range(0, 8, 3):
+                expected = decimal_escape_time(
+                    (view.center_real, view.center_imag),
+                    offsets[row, col], 500)
+                assert image.divtime[row, col] == expected
+
+    def test_resolves_structure_float64_cannot(self):
+        """A 1e50 zoom shows detail where complex128 sees one point."""
+        view = DeepViewport(("0", "1"), 1e50, 40, 30)
+
+        image = render_deep(view, 1000)
+
+        assert len(np.unique(image.divtime)) > 10
+        assert image.divtime.max() < 1000
+
+    def test_rebasing_continues_past_escaped_reference(self):
+        """Pixels outlive a reference orbit that escapes early."""
+        # The centre escapes, but the left part of the view is inside
+        # the main cardioid.
+        view = DeepViewport(complex(0.26, 0), 50, 40, 20)
+        x_min, x_max, y_min, y_max = view.extent
+        expected = render(Viewport(x_min, x_max, y_min, y_max, 40, 20),
+                          200).divtime
+        orbit = reference_orbit(view.center_real, view.center_imag, 202,
+                                view.precision)
+
+        divtime, rebases = perturbation_escape_time(orbit, view.offsets(),
+                                                    200)
+
+        assert len(orbit) < 200
+        assert rebases > 0
+        assert np.any(divtime == 200)
+        assert np.mean(divtime != expected) < 1e-2
+
+    def test_escaping_centre(self):
+        """A centre outside |C| <= 2 renders like escape_time()."""
+        image = render_deep(DeepViewport(complex(3, 0), 10, 4, 4), 50)
+
+        assert np.all(image.divtime == 0)
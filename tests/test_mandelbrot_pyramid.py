@@ -0,0 +1,141 @@
+"""
+Tests for the Mandelbrot tile pyramid and its on-disk LRU cache.
+"""
+
+import numpy as np
+import pytest
+
+import src.fractals.mandelbrot_pyramid as pyramid_module
+from src.fractals.mandelbrot import render, Viewport
+from src.fractals.mandelbrot_pyramid import TilePyramid, TileCache
+
+
+class TestTileGeometry:
+    """Tests for TilePyramid.tile_viewport()."""
+
+    def test_root_tile_covers_root_bounds(self, tmp_path):
+        """Level 0 is one tile whose pixel centres fill the root region."""
+        pyramid = TilePyramid(tmp_path, tile_size=4)
+        view = pyramid.tile_viewport(0, 0, 0)
+        dx, dy = view.pixel_size
+
+        assert view.shape == (4, 4)
+        assert view.x_min - dx / 2 == pytest.approx(-2.0)
+        assert view.x_max + dx / 2 == pytest.approx(0.8)
+        assert view.y_min - dy / 2 == pytest.approx(-1.4)
+        assert dx == pytest.approx(dy)
+
+    def test_neighbours_abut_with_even_spacing(self, tmp_path):
+        """Adjacent tiles continue the same pixel grid without overlap."""
+        pyramid = TilePyramid(tmp_path, tile_size=8)
+        left = pyramid.tile_viewport(3, 2, 5)
+        right = pyramid.tile_viewport(3, 3, 5)
+        dx, _ = left.pixel_size
+
+        assert right.x_min - left.x_max == pytest.approx(dx)
+        assert right.y_min == left.y_min
+
+    def test_children_split_parent(self, tmp_path):
+        """The four children of a tile cover exactly its region."""
+        pyramid = TilePyramid(tmp_path, tile_size=8)
+        parent = pyramid.tile_viewport(2, 1, 3)
+        low = pyramid.tile_viewport(3, 2, 6)
+        high = pyramid.tile_viewport(3, 3, 7)
+        half_pixel = parent.pixel_size[0] / 2
+
+        assert low.x_min - low.pixel_size[0] / 2 == pytest.approx(
+            parent.x_min - half_pixel)
+        assert high.y_max + high.pixel_size[1] / 2 == pytest.approx(
+            parent.y_max + half_pixel)
+
+    @pytest.mark.parametrize("level, x, y", [(0, 1, 0), (2, 4, 0), (-1, 0, 0)])
+    def test_rejects_missing_tiles(self, tmp_path, level, x, y):
+        """Indices outside the level are an error."""
+        with pytest.raises(ValueError):
+            TilePyramid(tmp_path).tile_viewport(level, x, y)
+
+    def test_tiles_for_viewport(self, tmp_path):
+        """The tiles overlapping a view are listed row by row."""
+        pyramid = TilePyramid(tmp_path)
+        view = Viewport(-1.9, -1.2, -1.3, -0.5, 10, 10)
+
+        assert pyramid.tiles_for_viewport(view, 2) == [
+            (0, 0), (1, 0), (0, 1), (1, 1)]
+
+
+class TestTilePyramid:
+    """Tests for TilePyramid.get_tile()."""
+
+    def test_tile_matches_render(self, tmp_path):
+        """A tile holds the escape times of its viewport."""
+        pyramid = TilePyramid(tmp_path, tile_size=16)
+
+        tile = pyramid.get_tile(2, 1, 2, 100)
+
+        assert tile.dtype == np.uint8
+        np.testing.assert_array_equal(
+            tile, render(pyramid.tile_viewport(2, 1, 2), 100).divtime)
+
+    def test_repeat_requests_are_not_recomputed(self, tmp_path, monkeypatch):
+        """Cached tiles are served from disk, also by a new pyramid."""
+        calls = []
+
+        def counting_render(viewport, max_iter):
+            calls.append((viewport, max_iter))
+            return render(viewport, max_iter)
+
+        monkeypatch.setattr(pyramid_module, "render", counting_render)
+        first = TilePyramid(tmp_path, tile_size=16).get_tile(1, 0, 1, 50)
+        pyramid = TilePyramid(tmp_path, tile_size=16)
+        second = pyramid.get_tile(1, 0, 1, 50)
+
+        assert len(calls) == 1
+        np.testing.assert_array_equal(first, second)
+        assert pyramid.cache.hits == 1
+
+    def test_max_iter_is_part_of_the_key(self, tmp_path):
+        """The same tile at another max_iter is a different entry."""
+        pyramid = TilePyramid(tmp_path, tile_size=8)
+        pyramid.get_tile(0, 0, 0, 50)
+        pyramid.get_tile(0, 0, 0, 500)
+
+        assert len(pyramid.cache) == 2
+
+    def test_rejects_cache_of_other_geometry(self, tmp_path):
+        """A cache directory belongs to one tile size and root region."""
+        TilePyramid(tmp_path, tile_size=16)
+
+        with pytest.raises(ValueError):
+            TilePyramid(tmp_path, tile_size=32)
+
+
+class TestTileCache:
+    """Tests for TileCache LRU eviction."""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Going over max_bytes drops the entries used longest ago."""
+        array = np.zeros(1000, dtype=np.uint8)
+        probe = TileCache(tmp_path / "probe")
+        probe.put("a.npy", array)
+        entry_bytes = probe.total_bytes
+        cache = TileCache(tmp_path / "lru", max_bytes=2 * entry_bytes)
+
+        cache.put("a.npy", array)
+        cache.put("b.npy", array)
+        cache.get("a.npy")  # b is now the least recently used
+        cache.put("c.npy", array)
+
+        assert "a.npy" in cache and "c.npy" in cache
+        assert "b.npy" not in cache
+        assert not (tmp_path / "lru" / "b.npy").exists()
+        assert cache.total_bytes <= 2 * entry_bytes
+
+    def test_reopened_cache_keeps_entries(self, tmp_path):
+        """Entries persist across TileCache instances."""
+        TileCache(tmp_path).put("a.npy", np.arange(5))
+
+        cache = TileCache(tmp_path)
+
+        np.testing.assert_array_equal(cache.get("a.npy"), np.arange(5))
+        assert cache.get("missing.npy") is None
+        assert (cache.hits, cache.misses) == (1, 1)
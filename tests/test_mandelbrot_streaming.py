@@ -0,0 +1,99 @@
+"""
+Tests for out-of-core Mandelbrot rendering to memory-mapped files.
+
+A streamed render must hold exactly the escape times of render(), in the
+smallest dtype that fits max_iter, and resume without redoing finished
+tiles.
+"""
+
+import numpy as np
+import pytest
+
+from src.fractals.mandelbrot import render, Viewport
+from src.fractals.mandelbrot_streaming import (
+    render_to_file, load_render, divtime_dtype,
+)
+
+VIEW = Viewport.from_center(-0.75 + 0.1j, 3, 70, 45)
+
+
+class TestDivtimeDtype:
+    """Tests for divtime_dtype()."""
+
+    @pytest.mark.parametrize("max_iter, dtype", [
+        (100, np.uint8), (255, np.uint8), (256, np.uint16),
+        (70000, np.uint32),
+    ])
+    def test_smallest_unsigned_type(self, max_iter, dtype):
+        """max_iter itself must fit, since unescaped pixels store it."""
+        assert divtime_dtype(max_iter) == dtype
+
+
+class TestRenderToFile:
+    """Tests for render_to_file() and load_render()."""
+
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_matches_in_memory_render(self, tmp_path, processes):
+        """The file holds render()'s escape times in the compact dtype."""
+        path = tmp_path / "view.npy"
+
+        image = render_to_file(VIEW, 300, path, tile_size=16,
+                               processes=processes)
+
+        assert isinstance(image.divtime, np.memmap)
+        assert image.divtime.dtype == np.uint16
+        np.testing.assert_array_equal(image.divtime, render(VIEW, 300).divtime)
+        assert image.viewport == VIEW
+        assert image.max_iter == 300
+
+    def test_resume_skips_finished_tiles(self, tmp_path):
+        """Only tiles not marked complete are rendered again."""
+        path = tmp_path / "view.npy"
+        render_to_file(VIEW, 100, path, tile_size=16)
+        expected = render(VIEW, 100).divtime
+
+        # Simulate an interruption: tile 0 unfinished, tile 1 finished but
+        # with pixels that a re-render would overwrite.
+        out = np.load(path, mmap_mode="r+")
+        out[:16, :16] = 0
+        out[:16, 16:32] = 7
+        out.flush()
+        done = np.load(tmp_path / "view.tiles.npy", mmap_mode="r+")
+        done[0] = 0
+        done.flush()
+        del out, done
+
+        image = render_to_file(VIEW, 100, path, tile_size=16)
+
+        np.testing.assert_array_equal(image.divtime[:16, :16],
+                                      expected[:16, :16])
+        assert np.all(image.divtime[:16, 16:32] == 7)
+
+    def test_resume_rejects_different_render(self, tmp_path):
+        """Resuming with other parameters is an error, not a silent mix."""
+        path = tmp_path / "view.npy"
+        render_to_file(VIEW, 100, path, tile_size=16)
+
+        with pytest.raises(ValueError):
+            render_to_file(VIEW, 200, path, tile_size=16)
+
+    def test_no_resume_overwrites(self, tmp_path):
+        """resume=False starts over with the new parameters."""
+        path = tmp_path / "view.npy"
+        render_to_file(VIEW, 100, path, tile_size=16)
+
+        image = render_to_file(VIEW, 200, path, tile_size=32, resume=False)
+
+        np.testing.assert_array_equal(image.divtime, render(VIEW, 200).divtime)
+
+    def test_load_rejects_incomplete_render(self, tmp_path):
+        """load_render() refuses files with missing tiles."""
+        path = tmp_path / "view.npy"
+        render_to_file(VIEW, 50, path, tile_size=16)
+        done = np.load(tmp_path / "view.tiles.npy", mmap_mode="r+")
+        done[-1] = 0
+        done.flush()
+        del done
+
+        with pytest.raises(ValueError):
+            load_render(path)
@@ -0,0 +1,62 @@
+"""
+Tests for Mariani-Silver subdivision rendering.
+"""
+
+import numpy as np
+import pytest
+
+from src.fractals.mandelbrot import render, Viewport, DEFAULT_BOUNDS
+from src.fractals.mandelbrot_subdivision import (
+    subdivided_escape_time, render_subdivided,
+)
+
+
+class TestSubdividedEscapeTime:
+    """Tests for subdivided_escape_time()."""
+
+    def test_interior_view_evaluates_a_fraction_of_pixels(self):
+        """A view dominated by the interior is filled, not iterated."""
+        view = Viewport.from_center(-0.2 + 0j, 3, 240, 160)
+        expected = render(view, 500).divtime
+
+        divtime, evaluated = subdivided_escape_time(view.grid(), 500)
+
+        assert evaluated < 0.35 * divtime.size
+        assert np.mean(divtime != expected) < 1e-3
+
+    def test_view_inside_the_set_evaluates_only_the_border(self):
+        """A rectangle entirely inside the set costs only its border."""
+        view = Viewport(-0.3, -0.1, -0.1, 0.1, 50, 40)
+
+        divtime, evaluated = subdivided_escape_time(view.grid(), 200)
+
+        assert np.all(divtime == 200)
+        assert evaluated == 2 * 50 + 2 * 38
+
+    def test_default_view_matches_full_render(self):
+        """On the default view the fill is exact."""
+        view = Viewport.from_bounds(DEFAULT_BOUNDS, 150, 100)
+
+        image = render_subdivided(view, 100)
+
+        np.testing.assert_array_equal(image.divtime, render(view, 100).divtime)
+        assert image.viewport == view
+
+    def test_large_min_size_evaluates_every_non_uniform_pixel(self):
+        """Without subdivision a mixed rectangle is iterated pixel by pixel."""
+        view = Viewport.from_center(-0.75 + 0.1j, 3, 40, 30)
+
+        divtime, evaluated = subdivided_escape_time(view.grid(), 100,
+                                                    min_size=100)
+
+        assert evaluated == divtime.size
+        np.testing.assert_array_equal(divtime, render(view, 100).divtime)
+
+    @pytest.mark.parametrize("shape", [(1, 1), (1, 7), (2, 5), (3, 3)])
+    def test_thin_grids(self, shape):
+        """Grids without an interior are just their border."""
+        view = Viewport(-1.5, 0.5, -1, 1, shape[1], shape[0])
+
+        divtime, _ = subdivided_escape_time(view.grid(), 50)
+
+        np.testing.assert_array_equal(divtime, render(view, 50).divtime)